@@ -32,31 +32,38 @@ def _boundary_cut(buf: str) -> int:
     # fallback: hard cut
     return j
 
-def _append_and_flush_chunks(acc: List[str], buf: str) -> str:
-    """Append as many chunks as possible from buf; return remaining tail."""
-    while len(buf) > CHUNK_MAX_BYTES and len(acc) < MAX_CHUNKS:
-        cut = _boundary_cut(buf[:CHUNK_MAX_BYTES+BOUNDARY_WINDOW])
-        acc.append(buf[:cut])
-        # ensure overlap
-        tail_start = max(cut - CHUNK_OVERLAP, 0)
-        buf = buf[tail_start:]
-    return buf
-
-def _finalize(acc: List[str], buf: str):
-    if buf and len(acc) < MAX_CHUNKS:
-        acc.append(buf)
-
-def _chunk_stream_text(text_iter, meta: Dict[str, Any]) -> Dict[str, Any]:
-    chunks: List[str] = []
+def _iter_chunks(text_iter, max_chunks: int | None = None, meta: Dict[str, Any] | None = None):
+    """Generator form of the chunker: yields chunks as soon as they are cut, so callers
+    can stream a document without holding every chunk. max_chunks=None streams the whole
+    text; otherwise, if text remains after max_chunks, sets meta["truncated"]."""
     buf = ""
+    emitted = 0
+    def _limit_reached():
+        if max_chunks is not None and emitted >= max_chunks:
+            if meta is not None:
+                meta.update(truncated=True, max_chunks=max_chunks)
+            return True
+        return False
     for piece in text_iter:
         if not piece:
             continue
         buf += piece
-        buf = _append_and_flush_chunks(chunks, buf)
-        if len(chunks) >= MAX_CHUNKS:
-            return {"status":"partial","chunks":chunks,"meta":meta | {"max_chunks":MAX_CHUNKS}}
-    _finalize(chunks, buf)
+        while len(buf) > CHUNK_MAX_BYTES:
+            if _limit_reached():
+                return
+            cut = _boundary_cut(buf[:CHUNK_MAX_BYTES+BOUNDARY_WINDOW])
+            yield buf[:cut]
+            emitted += 1
+            # ensure overlap
+            buf = buf[max(cut - CHUNK_OVERLAP, 0):]
+    if buf and not _limit_reached():
+        yield buf
+
+def _chunk_stream_text(text_iter, meta: Dict[str, Any]) -> Dict[str, Any]:
+    limit: Dict[str, Any] = {}
+    chunks = list(_iter_chunks(text_iter, MAX_CHUNKS, limit))
+    if limit.get("truncated"):
+        return {"status":"partial","chunks":chunks,"meta":meta | {"max_chunks":MAX_CHUNKS}}
     return {"status":"ok","chunks":chunks,"meta":meta}
 
 def _iter_pdf_text(path: str, max_pages: int):
@@ -69,12 +76,12 @@ def _iter_pdf_text(path: str, max_pages: int):
         except Exception:
             yield "\n"
 
-def _read_pdf(path: str, opts: dict) -> Dict[str, Any]:
+def _pdf_source(path: str, opts: dict):
     max_pages = min(int(opts.get("max_pages", PDF_MAX_PAGES)), PDF_MAX_PAGES)
     meta = {"type":"pdf","max_pages":max_pages}
-    return _chunk_stream_text(_iter_pdf_text(path, max_pages), meta)
+    return _iter_pdf_text(path, max_pages), meta
 
-def _read_txt(path: str, opts: dict) -> Dict[str, Any]:
+def _txt_source(path: str, opts: dict):
     meta = {"type":"text"}
     def _iter():
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
@@ -82,9 +89,9 @@ def _read_txt(path: str, opts: dict) -> Dict[str, Any]:
                 piece = f.read(8192)
                 if not piece: break
                 yield piece
-    return _chunk_stream_text(_iter(), meta)
+    return _iter(), meta
 
-def _read_csv(path: str, opts: dict) -> Dict[str, Any]:
+def _csv_source(path: str, opts: dict):
     max_rows = min(int(opts.get("max_rows", CSV_MAX_ROWS)), CSV_MAX_ROWS)
     meta = {"type":"csv","max_rows":max_rows}
     def _iter():
@@ -94,10 +101,19 @@ def _read_csv(path: str, opts: dict) -> Dict[str, Any]:
                 if i >= max_rows: break
                 # turn row into delimited text line
                 yield ",".join(str(c) for c in row) + "\n"
-    return _chunk_stream_text(_iter(), meta)
+    return _iter(), meta
 
-def mcp_file(payload: dict) -> dict:
-    path = payload.get("path")
+def _read_pdf(path: str, opts: dict) -> Dict[str, Any]:
+    return _chunk_stream_text(*_pdf_source(path, opts))
+
+def _read_txt(path: str, opts: dict) -> Dict[str, Any]:
+    return _chunk_stream_text(*_txt_source(path, opts))
+
+def _read_csv(path: str, opts: dict) -> Dict[str, Any]:
+    return _chunk_stream_text(*_csv_source(path, opts))
+
+def _open_source(path: str, opts: dict):
+    """(text_iter, meta) for a supported file, or an error dict."""
     if not path or not os.path.exists(path):
         return {"status":"error","error":"MISSING_OR_BAD_PATH"}
     size = os.path.getsize(path)
@@ -107,11 +123,28 @@ def mcp_file(payload: dict) -> dict:
     kind = filetype.guess(path)
     ext = ("." + kind.extension) if kind else os.path.splitext(path)[1].lower()
 
-    opts = payload.get("options", {})
     if ext in [".txt",".md"]:
-        return _read_txt(path, opts)
+        return _txt_source(path, opts)
     if ext in [".csv",".tsv"]:
-        return _read_csv(path, opts)
+        return _csv_source(path, opts)
     if ext == ".pdf":
-        return _read_pdf(path, opts)
+        return _pdf_source(path, opts)
     return {"status":"error","error":f"UNSUPPORTED_TYPE:{ext}"}
+
+def iter_file_chunks(path: str, opts: dict | None = None, max_chunks: int | None = None):
+    """Stream a file's chunks lazily -> (chunk generator, meta). Raises ValueError with the
+    connector error code for missing/oversized/unsupported files. Streams every chunk by
+    default (memory stays bounded); with max_chunks set, meta["truncated"] is True once
+    the generator is exhausted if the file had more chunks than that."""
+    source = _open_source(path, opts or {})
+    if isinstance(source, dict):
+        raise ValueError(source["error"])
+    text_iter, meta = source
+    meta["truncated"] = False
+    return _iter_chunks(text_iter, max_chunks, meta), meta
+
+def mcp_file(payload: dict) -> dict:
+    source = _open_source(payload.get("path"), payload.get("options", {}))
+    if isinstance(source, dict):
+        return source
+    return _chunk_stream_text(*source)
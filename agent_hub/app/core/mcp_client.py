@@ -1,8 +1,15 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+import asyncio, os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from .tool_api import builtin_tools
 from ..connectors import notion_connector, slack_connector, web_search_connector, file_connector
 
+# Env limits (per-tool timeout can be overridden with `timeout_s` in hub.yaml)
+TOOL_TIMEOUT_S   = float(os.getenv("TOOL_TIMEOUT_S", "10"))
+TOOL_BUDGET_S    = float(os.getenv("TOOL_BUDGET_S", "30"))
+TOOL_MAX_WORKERS = int(os.getenv("TOOL_MAX_WORKERS", "16"))
+
 external_tools = {
     "notion": notion_connector.mcp_notion,
     "slack": slack_connector.mcp_slack,
@@ -13,16 +20,37 @@ external_tools = {
 class MCPClient:
     def __init__(self, tools_config: List[dict]):
         self._tools = {t["id"]: t for t in tools_config}
+        # connectors are blocking (requests/slack_sdk/file IO) -> dedicated pool so
+        # a slow tool never starves the event loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=TOOL_MAX_WORKERS, thread_name_prefix="mcp-tool")
 
-    def run_tools(self, tool_ids: List[str], payload: Dict[str, Any]) -> Dict[str, Any]:
-        results = {}
-        for tid in tool_ids or []:
+    def _timeout(self, tid: str, budget_s: float) -> float:
+        return min(float(self._tools.get(tid, {}).get("timeout_s", TOOL_TIMEOUT_S)), budget_s)
+
+    async def _run_one(self, tid: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        if tid not in builtin_tools and tid not in external_tools:
+            return {"status":"error", "error": f"tool '{tid}' not available"}
+
+        ctx = payload.get("context", {})
+        tool_payload = {**payload, **ctx}
+        loop = asyncio.get_running_loop()
+        try:
             if tid in builtin_tools:
-                results[tid] = builtin_tools[tid](payload)
-            elif tid in external_tools:
-                ctx = payload.get("context", {})
-                tool_payload = {**payload, **ctx}
-                results[tid] = external_tools[tid](tool_payload)
-            else:
-                results[tid] = {"status":"error", "error": f"tool '{tid}' not available"}
-        return results
+                return builtin_tools[tid](payload)
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, external_tools[tid], tool_payload), timeout)
+        except asyncio.TimeoutError:
+            # the worker thread cannot be interrupted; its late result is discarded
+            return {"status":"timeout", "error":"TOOL_TIMEOUT", "detail":{"timeout_s":timeout}}
+        except Exception as e:
+            return {"status":"error", "error":"TOOL_FAILED", "detail":str(e)}
+
+    async def run_tools_async(self, tool_ids: List[str], payload: Dict[str, Any], budget_s: Optional[float] = None) -> Dict[str, Any]:
+        """Fan tools out concurrently. Latency ~= slowest tool, capped by its timeout and the budget.
+        Tools that time out or fail come back as status timeout/error; the rest are returned as-is."""
+        budget_s = TOOL_BUDGET_S if budget_s is None else budget_s
+        tids = list(dict.fromkeys(tool_ids or []))
+        results = await asyncio.gather(*(self._run_one(tid, payload, self._timeout(tid, budget_s)) for tid in tids))
+        return dict(zip(tids, results))
+
+    def run_tools(self, tool_ids: List[str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        return asyncio.run(self.run_tools_async(tool_ids, payload))
@@ -4,15 +4,100 @@
 Agent Hub와 EchoJudgmentSystem의 최적화된 엔진을 연결하는 브리지
 """
 
+import os
 import sys
+import heapq
+import itertools
 from pathlib import Path
 import time
-from typing import Dict, Any, List
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Iterable, Callable, Optional
 
 # EchoJudgmentSystem 경로 추가
 ECHO_BASE_PATH = Path(__file__).parent.parent.parent.parent / "echo_engine"
 sys.path.insert(0, str(ECHO_BASE_PATH))
 
+# 파일 분석 map-reduce 설정 (env)
+FILE_WORKERS = int(os.getenv("ECHO_FILE_WORKERS", str(os.cpu_count() or 1)))
+FILE_MAX_IN_FLIGHT = int(os.getenv("ECHO_FILE_MAX_IN_FLIGHT", "0"))  # 0 -> workers * 2
+FILE_PARALLEL_MIN_CHUNKS = int(os.getenv("ECHO_FILE_PARALLEL_MIN_CHUNKS", "8"))
+FILE_BATCH_CHUNKS = int(os.getenv("ECHO_FILE_BATCH_CHUNKS", "16"))  # 워커 호출 1회당 청크 수 (IPC 분할 상환)
+FILE_SAMPLE_CHUNKS = int(os.getenv("ECHO_FILE_SAMPLE_CHUNKS", "10"))  # 결과에 남길 청크 상세 수
+FILE_PROGRESS_EVERY = int(os.getenv("ECHO_FILE_PROGRESS_EVERY", "100"))
+
+EMOTION_KEYS = ("joy", "sadness", "anger", "fear", "surprise", "neutral")
+
+# ----- 워커 프로세스 (map 단계) -----
+
+_worker_persona = None
+
+def _init_chunk_worker():
+    """워커 프로세스마다 PersonaCore 한 번 생성"""
+    global _worker_persona
+    from persona_core_optimized_bridge import PersonaCore
+    _worker_persona = PersonaCore()
+
+def _analyze_chunk(index: int, chunk: str, context: Dict[str, Any], persona=None) -> Dict[str, Any]:
+    """청크 하나 분석 -> 집계에 필요한 값만 담은 작은 dict"""
+    result = (persona or _worker_persona).process_input(f"분석해주세요: {chunk}", context)
+    return {
+        "chunk_index": index,
+        "response": result.get("response", ""),
+        "emotion": result.get("emotion_analysis", {}).get("primary_emotion", "neutral"),
+        "intent": result.get("intent_classification", {}).get("primary_intent", "unknown"),
+    }
+
+def _analyze_chunk_batch(batch: List, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [_analyze_chunk(index, chunk, context) for index, chunk in batch]
+
+class FileAnalysisReducer:
+    """청크 결과를 도착 순서와 무관하게 점진 병합 (reduce 단계)
+
+    동률일 때 먼저 등장한(청크 번호가 작은) 의도가 이기도록 등장 위치를 기록해,
+    순차 처리와 같은 dominant_intent / intent_stats 순서를 만든다.
+    """
+
+    def __init__(self, sample_size: int = FILE_SAMPLE_CHUNKS):
+        self.emotions = dict.fromkeys(EMOTION_KEYS, 0)
+        self.intents: Dict[str, int] = {}
+        self.intent_first_seen: Dict[str, int] = {}
+        self.chunks_processed = 0
+        self.chunks_failed = 0
+        self.progress_marks = 0  # 진행 로그를 남긴 FILE_PROGRESS_EVERY 구간 수
+        self._sample_size = sample_size
+        self._sample: List = []  # 청크 번호가 가장 작은 sample_size개 (max-heap)
+
+    def add(self, item: Dict[str, Any]) -> None:
+        self.chunks_processed += 1
+        if item["emotion"] in self.emotions:
+            self.emotions[item["emotion"]] += 1
+        intent, index = item["intent"], item["chunk_index"]
+        self.intents[intent] = self.intents.get(intent, 0) + 1
+        if index < self.intent_first_seen.get(intent, index + 1):
+            self.intent_first_seen[intent] = index
+
+        if self._sample_size > 0:
+            entry = (-index, item)
+            if len(self._sample) < self._sample_size:
+                heapq.heappush(self._sample, entry)
+            elif index < -self._sample[0][0]:
+                heapq.heapreplace(self._sample, entry)
+
+    def intent_stats(self) -> Dict[str, int]:
+        order = sorted(self.intents, key=self.intent_first_seen.get)
+        return {intent: self.intents[intent] for intent in order}
+
+    def dominant_emotion(self) -> str:
+        return max(self.emotions, key=self.emotions.get)
+
+    def dominant_intent(self) -> str:
+        stats = self.intent_stats()
+        return max(stats, key=stats.get) if stats else "unknown"
+
+    def sample(self) -> List[Dict[str, Any]]:
+        return [item for _, item in sorted(self._sample, key=lambda e: -e[0])]
+
 class EchoEngineBridge:
     """Agent Hub - Echo Engine 브리지"""
     
@@ -25,6 +110,7 @@ class EchoEngineBridge:
             "total_time": 0.0,
             "avg_response_time": 0.0
         }
+        self._file_pool: Optional[ProcessPoolExecutor] = None
         
         self._initialize_echo_engine()
     
@@ -106,8 +192,15 @@ class EchoEngineBridge:
                 "processing_time_ms": processing_time * 1000
             }
     
-    def enhance_file_processing(self, file_chunks: List[str], context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """파일 청크들을 Echo 엔진으로 처리 및 요약"""
+    def enhance_file_processing(self, file_chunks: Iterable[str], context: Dict[str, Any] = None,
+                                progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """파일 청크들을 Echo 엔진으로 처리 및 요약
+
+        모든 청크를 분석한다 (리스트나 file_connector.iter_file_chunks 제너레이터).
+        청크가 FILE_PARALLEL_MIN_CHUNKS개 이상이면 프로세스 풀에서 map-reduce로 처리하고,
+        청크를 FILE_BATCH_CHUNKS개씩 묶어 보내고, 동시에 올라가는 배치 수를
+        max_in_flight로 묶어 메모리를 제한한다.
+        """
         if not self.echo_available:
             return {
                 "summary": "Echo engine not available for file processing",
@@ -116,57 +209,51 @@ class EchoEngineBridge:
             }
         
         start_time = time.time()
+        context = context or {}
+        reducer = FileAnalysisReducer()
         
         try:
-            processed_chunks = []
-            total_emotions = {"joy": 0, "sadness": 0, "anger": 0, "fear": 0, "surprise": 0, "neutral": 0}
-            total_intents = {}
+            # 너무 짧은 청크는 스킵 (청크 번호는 원본 기준 유지)
+            chunks = ((i, chunk) for i, chunk in enumerate(file_chunks) if len(chunk.strip()) >= 10)
             
-            # 각 청크를 Echo로 처리
-            for i, chunk in enumerate(file_chunks[:10]):  # 최대 10개 청크
-                if len(chunk.strip()) < 10:  # 너무 짧은 청크는 스킵
-                    continue
-                    
-                result = self.echo_persona.process_input(f"분석해주세요: {chunk[:500]}...", context or {})
-                
-                # 감정 통계 수집
-                emotion_data = result.get("emotion_analysis", {})
-                primary_emotion = emotion_data.get("primary_emotion", "neutral")
-                if primary_emotion in total_emotions:
-                    total_emotions[primary_emotion] += 1
-                
-                # 의도 통계 수집  
-                intent_data = result.get("intent_classification", {})
-                primary_intent = intent_data.get("primary_intent", "unknown")
-                total_intents[primary_intent] = total_intents.get(primary_intent, 0) + 1
-                
-                processed_chunks.append({
-                    "chunk_index": i,
-                    "response": result.get("response", ""),
-                    "emotion": primary_emotion,
-                    "intent": primary_intent
-                })
+            # 작은 입력은 풀 기동 비용 없이 현재 프로세스에서 처리
+            head = []
+            for item in chunks:
+                head.append(item)
+                if len(head) >= FILE_PARALLEL_MIN_CHUNKS:
+                    break
+            
+            if len(head) < FILE_PARALLEL_MIN_CHUNKS or FILE_WORKERS <= 1:
+                for i, chunk in itertools.chain(head, chunks):
+                    reducer.add(_analyze_chunk(i, chunk, context, self.echo_persona))
+                    self._report_progress(reducer, start_time, progress_callback)
+                mode = "inline"
+            else:
+                self._map_reduce(itertools.chain(head, chunks), context, reducer, start_time, progress_callback)
+                mode = "parallel"
             
             # 전체 요약 생성
-            dominant_emotion = max(total_emotions, key=total_emotions.get)
-            dominant_intent = max(total_intents, key=total_intents.get) if total_intents else "unknown"
+            dominant_emotion = reducer.dominant_emotion()
+            dominant_intent = reducer.dominant_intent()
             
             summary_text = f"파일 분석 완료. 주요 감정: {dominant_emotion}, 주요 의도: {dominant_intent}"
             final_summary = self.echo_persona.process_input(
                 f"다음 파일 분석 결과를 종합해서 요약해주세요: {summary_text}", 
-                context or {}
+                context
             )
             
             processing_time = time.time() - start_time
             
             return {
                 "summary": final_summary.get("response", summary_text),
-                "chunks_processed": len(processed_chunks),
+                "chunks_processed": reducer.chunks_processed,
+                "chunks_failed": reducer.chunks_failed,
                 "dominant_emotion": dominant_emotion,
                 "dominant_intent": dominant_intent,
-                "emotion_stats": total_emotions,
-                "intent_stats": total_intents,
-                "processed_chunks": processed_chunks,
+                "emotion_stats": reducer.emotions,
+                "intent_stats": reducer.intent_stats(),
+                "processed_chunks": reducer.sample(),
+                "processing_mode": mode,
                 "processing_time_ms": processing_time * 1000,
                 "source": "echo_engine"
             }
@@ -177,12 +264,65 @@ class EchoEngineBridge:
             
             return {
                 "summary": f"파일 처리 중 오류 발생: {e}",
-                "chunks_processed": 0,
+                "chunks_processed": reducer.chunks_processed,
                 "error": str(e),
                 "processing_time_ms": processing_time * 1000,
                 "source": "error"
             }
     
+    def _get_file_pool(self) -> ProcessPoolExecutor:
+        if self._file_pool is None:
+            self._file_pool = ProcessPoolExecutor(max_workers=FILE_WORKERS, initializer=_init_chunk_worker)
+        return self._file_pool
+    
+    def _map_reduce(self, chunks, context, reducer, start_time, progress_callback):
+        """청크 스트림을 풀에 흘려보내며 완료되는 대로 병합 (in-flight 상한 유지)"""
+        pool = self._get_file_pool()
+        max_in_flight = FILE_MAX_IN_FLIGHT or FILE_WORKERS * 2  # 배치 단위
+        batches = iter(lambda: list(itertools.islice(chunks, FILE_BATCH_CHUNKS)), [])
+        in_flight = {}  # future -> 배치 청크 수 (실패 시 집계용)
+        
+        try:
+            for batch in batches:
+                in_flight[pool.submit(_analyze_chunk_batch, batch, context)] = len(batch)
+                if len(in_flight) >= max_in_flight:
+                    self._merge_done(in_flight, reducer, start_time, progress_callback)
+            while in_flight:
+                self._merge_done(in_flight, reducer, start_time, progress_callback)
+        except BrokenProcessPool:
+            self._file_pool = None  # 다음 요청에서 새 풀 생성
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+    
+    def _merge_done(self, in_flight, reducer, start_time, progress_callback):
+        """완료된 배치가 나올 때까지 기다려 병합하고 in_flight에서 제거"""
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            size = in_flight.pop(future)
+            try:
+                for item in future.result():
+                    reducer.add(item)
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                reducer.chunks_failed += size
+                print(f"⚠️ 청크 배치 분석 실패: {e}")
+            self._report_progress(reducer, start_time, progress_callback)
+    
+    def _report_progress(self, reducer, start_time, progress_callback):
+        done = reducer.chunks_processed + reducer.chunks_failed
+        if progress_callback is not None:
+            progress_callback({
+                "chunks_done": done,
+                "chunks_failed": reducer.chunks_failed,
+                "elapsed_ms": (time.time() - start_time) * 1000,
+            })
+        elif FILE_PROGRESS_EVERY and done // FILE_PROGRESS_EVERY > reducer.progress_marks:
+            reducer.progress_marks = done // FILE_PROGRESS_EVERY
+            print(f"📄 파일 분석 진행: {done}개 청크 ({time.time() - start_time:.1f}s)")
+    
     def get_performance_stats(self) -> Dict[str, Any]:
         """성능 통계 반환"""
         return {
@@ -242,6 +382,18 @@ def process_file_with_echo(chunks: List[str], context: Dict[str, Any] = None) ->
     """파일 청크를 Echo로 처리"""
     return get_echo_bridge().enhance_file_processing(chunks, context)
 
+def process_file_path_with_echo(path: str, options: Dict[str, Any] = None, context: Dict[str, Any] = None,
+                                progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """파일을 청크 제너레이터로 스트리밍하며 Echo로 분석 (전체 청크를 메모리에 올리지 않음)"""
+    from ..connectors.file_connector import iter_file_chunks
+    try:
+        chunks, meta = iter_file_chunks(path, options)
+    except ValueError as e:
+        return {"summary": f"파일을 읽을 수 없습니다: {e}", "chunks_processed": 0, "error": str(e), "source": "error"}
+    result = get_echo_bridge().enhance_file_processing(chunks, context, progress_callback)
+    result["file_meta"] = meta
+    return result
+
 def echo_health_check() -> Dict[str, Any]:
     """Echo 헬스체크"""
     return get_echo_bridge().health_check()
@@ -1,7 +1,10 @@
 from __future__ import annotations
-import json, os, time
+import atexit, json, os, queue, threading, time
 
 TRACE_DIR = os.environ.get("ECHO_TRACE_DIR", os.path.join(os.path.dirname(__file__), "..", "..", "traces"))
+TRACE_BATCH_MAX   = int(os.getenv("TRACE_BATCH_MAX", "256"))
+TRACE_FLUSH_S     = float(os.getenv("TRACE_FLUSH_S", "1.0"))
+TRACE_QUEUE_MAX   = int(os.getenv("TRACE_QUEUE_MAX", "10000"))
 
 def save(record: dict) -> str:
     os.makedirs(TRACE_DIR, exist_ok=True)
@@ -10,3 +13,71 @@ def save(record: dict) -> str:
     with open(path, "w", encoding="utf-8") as f:
         json.dump(record, f, ensure_ascii=False, indent=2)
     return path
+
+class TraceWriter:
+    """Background JSONL writer: records are queued from the request path and
+    written in batches to traces/trace_<YYYYMMDD>.jsonl (one line per record)."""
+
+    def __init__(self, trace_dir: str = TRACE_DIR):
+        self.trace_dir = trace_dir
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=TRACE_QUEUE_MAX)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, record: dict) -> None:
+        self._ensure_thread()
+        record = {"t": time.time(), **record}
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1  # never block a request on trace IO
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="resonance-trace", daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + TRACE_FLUSH_S
+            while len(batch) < TRACE_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception as e:
+                print(f"[resonance_trace] write failed ({len(batch)} records): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: list) -> None:
+        os.makedirs(self.trace_dir, exist_ok=True)
+        path = os.path.join(self.trace_dir, f"trace_{time.strftime('%Y%m%d')}.jsonl")
+        lines = "".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in batch)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+_writer = TraceWriter()
+
+def submit(record: dict) -> None:
+    """Queue a trace record for the background JSONL writer (non-blocking)."""
+    _writer.submit(record)
+
+def flush() -> None:
+    """Block until every queued trace record is on disk."""
+    _writer.flush()
+
+atexit.register(flush)
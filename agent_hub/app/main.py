@@ -1,10 +1,14 @@
 from __future__ import annotations
-from fastapi import FastAPI, HTTPException
+import asyncio
+import os
+import tempfile
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from .core.registry import Registry
 from .core.mcp_client import MCPClient
 from .core.router import route_call
+from .connectors.file_connector import FILE_MAX_BYTES
 from .echo import signature_bridge, resonance_trace, hooks, echo_engine_bridge
 
 app = FastAPI(title="Echo Agent Hub v0.4 (alpha1) — File Connector")
@@ -41,6 +45,7 @@ def root():
             "invoke": "/invoke",
             "echo_direct": "/echo",
             "echo_file": "/echo/file", 
+            "echo_file_upload": "/echo/file/upload",
             "echo_stats": "/echo/stats",
             "echo_invoke": "/invoke/echo",
             "api_docs": "/docs"
@@ -66,18 +71,19 @@ def tools():
     return registry.list_tools()
 
 @app.post("/invoke")
-def invoke(req: InvokeReq):
+async def invoke(req: InvokeReq):
     payload = hooks.before_invoke(req.model_dump())
     agent = registry.get_agent(payload["agent"])
     if not agent:
         raise HTTPException(400, f"unknown agent '{payload['agent']}'")
-    tool_results = mcp.run_tools(payload.get("tools") or [], {"text": payload["prompt"], "context": payload.get("context", {})})
+    tool_results = await mcp.run_tools_async(payload.get("tools") or [], {"text": payload["prompt"], "context": payload.get("context", {})})
     call_ctx = dict(payload.get("context", {}))
     call_ctx["tools"] = tool_results
-    text = route_call(agent.get("provider"), agent.get("model"), payload["prompt"], call_ctx)
+    # provider SDK clients are blocking
+    text = await asyncio.to_thread(route_call, agent.get("provider"), agent.get("model"), payload["prompt"], call_ctx)
     enriched = signature_bridge.enhance(text, signature="Heo", mode="post")
     record = {"request": payload, "tool_results": tool_results, "model_text": text, "enriched": enriched}
-    resonance_trace.save(record)
+    resonance_trace.submit(record)
     return hooks.after_invoke(enriched)
 
 @app.post("/echo")
@@ -92,28 +98,53 @@ def echo_file_process(req: FileEchoReq):
     result = echo_engine_bridge.process_file_with_echo(req.file_chunks, req.context)
     return result
 
+@app.post("/echo/file/upload")
+async def echo_file_upload(request: Request, filename: str):
+    """업로드한 파일(txt/md/csv/tsv/pdf, 요청 본문 = 파일 바이트)을 스트리밍 map-reduce로 분석
+
+    본문은 임시 파일로 흘려 쓰고, 청크는 제너레이터로 읽어 전체를 메모리에 올리지 않는다.
+    """
+    suffix = os.path.splitext(filename)[1].lower()
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix, prefix="echo_upload_")
+    try:
+        size = 0
+        with os.fdopen(fd, "wb") as f:
+            async for piece in request.stream():
+                size += len(piece)
+                if size > FILE_MAX_BYTES:
+                    raise HTTPException(413, f"file exceeds {FILE_MAX_BYTES} bytes")
+                f.write(piece)
+        return await asyncio.to_thread(echo_engine_bridge.process_file_path_with_echo, tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+@app.on_event("shutdown")
+def flush_traces():
+    resonance_trace.flush()
+
 @app.get("/echo/stats")
 def echo_stats():
     """Echo 엔진 성능 통계"""
     return echo_engine_bridge.echo_stats()
 
 @app.post("/invoke/echo")
-def invoke_with_echo(req: InvokeReq):
+async def invoke_with_echo(req: InvokeReq):
     """기존 invoke를 Echo 엔진으로 강화"""
     payload = hooks.before_invoke(req.model_dump())
     agent = registry.get_agent(payload["agent"])
     if not agent:
         raise HTTPException(400, f"unknown agent '{payload['agent']}'")
     
-    # 도구 실행
-    tool_results = mcp.run_tools(payload.get("tools") or [], {"text": payload["prompt"], "context": payload.get("context", {})})
+    # 도구 실행 (동시 실행, 도구별 타임아웃 - 느린 도구는 timeout 결과로 대체)
+    tool_results = await mcp.run_tools_async(payload.get("tools") or [], {"text": payload["prompt"], "context": payload.get("context", {})})
     
     # 도구 결과를 포함한 컨텍스트 구성
     call_ctx = dict(payload.get("context", {}))
     call_ctx["tools"] = tool_results
     
     # Echo 엔진으로 처리 (기존 모델 대신)
-    echo_result = echo_engine_bridge.process_text_with_echo(
+    echo_result = await asyncio.to_thread(
+        echo_engine_bridge.process_text_with_echo,
         payload["prompt"], 
         call_ctx
     )
@@ -131,13 +162,13 @@ def invoke_with_echo(req: InvokeReq):
         "persona_signature": echo_result.get("persona_signature", "Echo-Aurora")
     }
     
-    # 기록 저장
+    # 기록 저장 (백그라운드 JSONL 배치 기록)
     record = {
         "request": payload,
         "tool_results": tool_results, 
         "echo_result": echo_result,
         "enriched": enriched
     }
-    resonance_trace.save(record)
+    resonance_trace.submit(record)
     
     return hooks.after_invoke(enriched)
@@ -6,14 +6,23 @@ EchoJudgmentSystem 고급 기능 모듈
 - 자동 학습 기능
 """
 
-import json
+import time
+import uuid
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Dict, Optional
 import numpy as np
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 
+from api.history_store import (
+    EMOTION_KEYWORDS,
+    NPI_COMPONENTS,
+    classify_emotions,
+    get_history_store,
+)
+
 
 @dataclass
 class BatchRequest:
@@ -41,29 +50,18 @@ class AdvancedAnalyzer:
         self.log_path = log_path
         self.history_days = 30
 
+    @property
+    def store(self):
+        """증분 집계 히스토리 저장소"""
+        return get_history_store(self.log_path)
+
     def load_history(self, days: int = None) -> pd.DataFrame:
-        """히스토리 데이터 로드"""
+        """히스토리 데이터 로드 (timestamp 인덱스로 기간 내 행만 조회)"""
         if days is None:
             days = self.history_days
 
         try:
-            logs = []
-            with open(self.log_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        logs.append(json.loads(line))
-
-            if not logs:
-                return pd.DataFrame()
-
-            df = pd.DataFrame(logs)
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
-
-            # 지정된 기간 내 데이터만 필터링
-            cutoff_date = datetime.now() - timedelta(days=days)
-            df = df[df["timestamp"] >= cutoff_date]
-
-            return df
+            return self.store.load_frame(days)
 
         except Exception as e:
             print(f"히스토리 로드 실패: {e}")
@@ -124,15 +122,6 @@ class AdvancedAnalyzer:
         if df.empty:
             return {"error": "데이터 없음"}
 
-        # Claude 감정 데이터 분석 (claude_summary에서 감정 키워드 추출)
-        emotion_keywords = {
-            "joy": ["기쁘", "행복", "좋", "최고", "성공", "축하"],
-            "sadness": ["슬프", "우울", "힘들", "속상", "실망", "포기"],
-            "anger": ["화", "짜증", "분노", "열받", "억울", "불만"],
-            "fear": ["무서", "걱정", "불안", "두려", "긴장", "스트레스"],
-            "neutral": ["그냥", "보통", "평상시", "일반적"],
-        }
-
         emotion_trends = {
             "daily_emotions": {},
             "emotion_distribution": {},
@@ -142,14 +131,13 @@ class AdvancedAnalyzer:
 
         # 감정 키워드 기반 분류
         if "claude_summary" in df.columns:
-            emotion_counts = {emotion: 0 for emotion in emotion_keywords.keys()}
+            emotion_counts = {emotion: 0 for emotion in EMOTION_KEYWORDS.keys()}
 
-            for text in df["claude_summary"].fillna(""):
-                text_lower = text.lower()
-                for emotion, keywords in emotion_keywords.items():
-                    if any(keyword in text_lower for keyword in keywords):
-                        emotion_counts[emotion] += 1
-                        break
+            for emotion in classify_emotions(
+                df["claude_summary"].fillna("").astype(str).tolist()
+            ):
+                if emotion:
+                    emotion_counts[emotion] += 1
 
             emotion_trends["emotion_distribution"] = emotion_counts
 
@@ -202,13 +190,137 @@ class AdvancedAnalyzer:
 
         return strategy_analysis
 
+    def summarize_user_patterns(self, days: int = 7) -> Dict:
+        """사용자 패턴 분석 (증분 집계 기반, analyze_user_patterns와 동일 형식)"""
+        agg = self.store.aggregate(days)
+        if agg.total == 0:
+            return {"error": "데이터 없음"}
+
+        strategy_counts = {s: v[0] for s, v in agg.strategies.items() if s}
+
+        return {
+            "총_요청수": agg.total,
+            "평균_NPI점수": agg.npi_mean,
+            "주요_전략": (
+                max(sorted(strategy_counts), key=strategy_counts.get)
+                if strategy_counts
+                else "N/A"
+            ),
+            "감정_분포": {},
+            "시간대_분포": dict(sorted(agg.hourly.items())),
+            "NPI_구성요소_평균": {
+                component: agg.components[component][0] / agg.components[component][1]
+                for component in NPI_COMPONENTS
+                if agg.components.get(component, [0, 0])[1]
+            },
+        }
+
+    def summarize_emotional_trends(self, days: int = 7) -> Dict:
+        """감정 트렌드 분석 (증분 집계 기반)"""
+        agg = self.store.aggregate(days)
+        if agg.total == 0:
+            return {"error": "데이터 없음"}
+
+        return {
+            "daily_emotions": {},
+            "emotion_distribution": {
+                emotion: agg.emotions.get(emotion, 0) for emotion in EMOTION_KEYWORDS
+            },
+            "emotional_volatility": 0.0,
+            "trend_direction": "stable",
+        }
+
+    def summarize_strategy_effectiveness(self, days: int = 7) -> Dict:
+        """전략 효과성 분석 (증분 집계 기반)"""
+        agg = self.store.aggregate(days)
+        if agg.total == 0:
+            return {"error": "데이터 없음"}
+
+        strategy_analysis = {
+            "strategy_performance": {},
+            "best_strategy": None,
+            "strategy_trends": {},
+            "recommendations": [],
+        }
+
+        means = {
+            strategy: stats[1] / stats[2]
+            for strategy, stats in sorted(agg.strategies.items())
+            if strategy and stats[2]
+        }
+        if not means:
+            return strategy_analysis
+
+        strategy_analysis["strategy_performance"] = {
+            "mean": means,
+            "count": {strategy: agg.strategies[strategy][2] for strategy in means},
+        }
+        strategy_analysis["best_strategy"] = max(means, key=means.get)
+
+        # 권장사항 생성
+        recommendations = []
+        for strategy, stats in means.items():
+            if stats > 0.75:
+                recommendations.append(
+                    f"{strategy} 전략은 높은 성과를 보입니다 (평균: {stats:.3f})"
+                )
+            elif stats < 0.5:
+                recommendations.append(
+                    f"{strategy} 전략 개선이 필요합니다 (평균: {stats:.3f})"
+                )
+
+        strategy_analysis["recommendations"] = recommendations
+        return strategy_analysis
+
+    def system_stats(self, days: int = 30) -> Dict:
+        """시스템 통계 (증분 집계 기반)"""
+        agg = self.store.aggregate(days)
+
+        return {
+            "total_requests": agg.total,
+            "active_days": len(agg.days),
+            "average_daily_requests": (
+                round(agg.total / max(len(agg.days), 1), 2) if agg.total else 0
+            ),
+            "most_active_hour": (
+                max(agg.hourly, key=agg.hourly.get) if agg.hourly else None
+            ),
+            "data_period": f"{days}일",
+        }
+
+    def realtime_status(self) -> Dict:
+        """실시간 상태 (최근 24시간 집계)"""
+        agg = self.store.aggregate(1)
+
+        if agg.total == 0:
+            return {
+                "status": "inactive",
+                "recent_requests": 0,
+                "last_activity": None,
+                "current_trend": "no_data",
+            }
+
+        # 최근 활동 트렌드
+        if agg.total > 10:
+            current_trend = "high_activity"
+        elif agg.total > 5:
+            current_trend = "moderate_activity"
+        else:
+            current_trend = "low_activity"
+
+        return {
+            "status": "active",
+            "recent_requests": agg.total,
+            "last_activity": datetime.fromtimestamp(agg.last_ts).isoformat(),
+            "current_trend": current_trend,
+            "period": "최근 24시간",
+        }
+
     def generate_comprehensive_analysis(self, days: int = 7) -> AnalysisResult:
         """종합 분석 보고서 생성"""
-        df = self.load_history(days)
-
-        user_pattern = self.analyze_user_patterns(df)
-        emotional_trend = self.analyze_emotional_trends(df)
-        strategy_effectiveness = self.analyze_strategy_effectiveness(df)
+        user_pattern = self.summarize_user_patterns(days)
+        emotional_trend = self.summarize_emotional_trends(days)
+        strategy_effectiveness = self.summarize_strategy_effectiveness(days)
 
         # 종합 권장사항 생성
         recommendations = []
@@ -243,83 +355,246 @@ class AdvancedAnalyzer:
 
 
 class BatchProcessor:
-    """배치 처리 엔진"""
-
-    def __init__(self):
+    """배치 처리 엔진 (스레드 풀 기반 동시 처리)"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        progress_ttl_seconds: float = 3600.0,
+        max_tracked_batches: int = 256,
+    ):
         self.batch_history = []
+        self.max_concurrency = max_concurrency
+        self.batch_progress: Dict[str, Dict] = {}  # 배치별 실시간 진행 상태
+        # 끝난 배치의 진행 상태는 TTL/개수 상한으로 정리 (실행 중인 배치는 유지)
+        self.progress_ttl_seconds = progress_ttl_seconds
+        self.max_tracked_batches = max_tracked_batches
+        self._progress_finished_at: Dict[str, float] = {}  # batch_id -> monotonic 종료 시각
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="batch"
+        )
 
-    async def process_batch(self, requests: List[str], batch_id: str = None) -> Dict:
-        """배치 요청 처리"""
+    def resolve_concurrency(self, max_concurrency: Optional[int]) -> int:
+        """요청한 동시 처리 수 검증 후 풀 크기(self.max_concurrency)로 상한 적용"""
+        if max_concurrency is None:
+            return self.max_concurrency
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency는 1 이상이어야 합니다")
+        return min(max_concurrency, self.max_concurrency)
+
+    def _mark_finished(self, batch_id: str, status: str):
+        progress = self.batch_progress.get(batch_id)
+        if progress is None:
+            return
+        progress["status"] = status
+        progress["finished_at"] = datetime.now().isoformat()
+        self._progress_finished_at[batch_id] = time.monotonic()
+
+    def _prune_progress(self):
+        """TTL이 지난 완료 배치를 지우고, 상한을 넘으면 오래된 완료 배치부터 제거"""
+        finished = self._progress_finished_at
+        cutoff = time.monotonic() - self.progress_ttl_seconds
+        expired = [batch_id for batch_id, at in finished.items() if at <= cutoff]
+
+        overflow = len(self.batch_progress) - len(expired) - self.max_tracked_batches
+        if overflow > 0:
+            # dict는 종료 순서를 유지하므로 앞쪽이 가장 오래된 완료 배치
+            remaining = [batch_id for batch_id in finished if batch_id not in expired]
+            expired.extend(remaining[:overflow])
+
+        for batch_id in expired:
+            del finished[batch_id]
+            self.batch_progress.pop(batch_id, None)
+
+    def _process_single(self, index: int, prompt: str, batch_id: str) -> Dict:
+        """단일 프롬프트 처리 (동기 파이프라인, 워커 스레드에서 실행)"""
         from api.npi import evaluate_npi
         from api.llm_runner import run_claude_judgment
         from api.nunchi_response_engine import generate_response
         from api.log_writer import write_log
 
-        if batch_id is None:
-            batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-        batch_request = BatchRequest(
-            requests=requests, batch_id=batch_id, timestamp=datetime.now()
-        )
+        try:
+            # 개별 처리 (기존 파이프라인 사용)
+            npi_score = evaluate_npi(prompt)
+            claude_result = run_claude_judgment(prompt)
+            claude_str = (
+                claude_result.get("judgment", str(claude_result))
+                if isinstance(claude_result, dict)
+                else str(claude_result)
+            )
+            response, strategy = generate_response(prompt, npi_score, claude_str)
+
+            # 로그 기록 (배치 ID 포함)
+            write_log(
+                f"[BATCH:{batch_id}] {prompt}",
+                npi_score,
+                strategy,
+                response,
+                claude_str,
+            )
 
-        results = []
+            return {
+                "index": index,
+                "prompt": prompt,
+                "npi_score": npi_score,
+                "claude_result": claude_str,
+                "response": response,
+                "strategy": strategy,
+                "batch_id": batch_id,
+            }
 
-        for i, prompt in enumerate(requests):
-            try:
-                # 개별 처리 (기존 파이프라인 사용)
-                npi_score = evaluate_npi(prompt)
-                claude_result = run_claude_judgment(prompt)
-                claude_str = (
-                    claude_result.get("judgment", str(claude_result))
-                    if isinstance(claude_result, dict)
-                    else str(claude_result)
-                )
-                response, strategy = generate_response(prompt, npi_score, claude_str)
-
-                # 로그 기록 (배치 ID 포함)
-                write_log(
-                    f"[BATCH:{batch_id}] {prompt}",
-                    npi_score,
-                    strategy,
-                    response,
-                    claude_str,
+        except Exception as e:
+            return {
+                "index": index,
+                "prompt": prompt,
+                "error": str(e),
+                "batch_id": batch_id,
+            }
+
+    async def _iter_results(
+        self, requests: List[str], batch_id: str, concurrency: int
+    ) -> AsyncIterator[Dict]:
+        """완료 순서대로 결과 반환 (동시 처리 수 제한, 진행 상태 갱신)"""
+        progress = {
+            "batch_id": batch_id,
+            "status": "running",
+            "total_requests": len(requests),
+            "max_concurrency": concurrency,
+            "completed": 0,
+            "successful": 0,
+            "failed": 0,
+            "started_at": datetime.now().isoformat(),
+            "finished_at": None,
+            "elapsed_seconds": 0.0,
+        }
+        self._progress_finished_at.pop(batch_id, None)
+        self.batch_progress[batch_id] = progress
+        self._prune_progress()
+        started = time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(index: int, prompt: str) -> Dict:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    self._executor, self._process_single, index, prompt, batch_id
                 )
 
-                result = {
-                    "index": i,
-                    "prompt": prompt,
-                    "npi_score": npi_score,
-                    "claude_result": claude_str,
-                    "response": response,
-                    "strategy": strategy,
-                    "batch_id": batch_id,
-                }
-
-                results.append(result)
+        tasks = [
+            asyncio.ensure_future(run_one(i, prompt))
+            for i, prompt in enumerate(requests)
+        ]
 
-            except Exception as e:
-                results.append(
-                    {
-                        "index": i,
-                        "prompt": prompt,
-                        "error": str(e),
-                        "batch_id": batch_id,
-                    }
-                )
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+
+                progress["completed"] += 1
+                progress["failed" if "error" in result else "successful"] += 1
+                progress["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+
+                yield result
+        finally:
+            # 소비자가 중단한 경우 대기 중인 작업 취소
+            for task in tasks:
+                task.cancel()
+            if progress["completed"] < progress["total_requests"]:
+                self._mark_finished(batch_id, "cancelled")
+
+    def _finalize_batch(
+        self, batch_request: BatchRequest, results: List[Dict]
+    ) -> Dict:
+        """배치 결과 정리 및 히스토리 기록"""
+        results.sort(key=lambda r: r["index"])
 
         batch_result = {
-            "batch_id": batch_id,
-            "total_requests": len(requests),
+            "batch_id": batch_request.batch_id,
+            "total_requests": len(batch_request.requests),
             "successful": len([r for r in results if "error" not in r]),
             "failed": len([r for r in results if "error" in r]),
             "results": results,
             "timestamp": batch_request.timestamp.isoformat(),
         }
 
+        self._mark_finished(batch_request.batch_id, "completed")
+
         self.batch_history.append(batch_result)
 
         return batch_result
 
+    def _new_batch_request(
+        self, requests: List[str], batch_id: Optional[str]
+    ) -> BatchRequest:
+        if batch_id is None:
+            # 같은 초에 시작한 배치끼리 진행 상태가 겹치지 않도록 uuid 접미사
+            batch_id = (
+                f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            )
+
+        return BatchRequest(
+            requests=requests, batch_id=batch_id, timestamp=datetime.now()
+        )
+
+    async def process_batch(
+        self,
+        requests: List[str],
+        batch_id: str = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict:
+        """배치 요청 처리 (전체 완료 후 입력 순서대로 반환)"""
+        concurrency = self.resolve_concurrency(max_concurrency)
+        batch_request = self._new_batch_request(requests, batch_id)
+
+        results = [
+            result
+            async for result in self._iter_results(
+                requests, batch_request.batch_id, concurrency
+            )
+        ]
+
+        return self._finalize_batch(batch_request, results)
+
+    def stream_batch(
+        self,
+        requests: List[str],
+        batch_id: str = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict]:
+        """배치 요청 스트리밍 처리 (완료되는 순서대로 개별 결과 반환)
+
+        max_concurrency 검증은 호출 시점에 바로 한다 (스트리밍 시작 전 ValueError).
+        """
+        concurrency = self.resolve_concurrency(max_concurrency)
+        return self._stream_batch(requests, batch_id, concurrency)
+
+    async def _stream_batch(
+        self, requests: List[str], batch_id: Optional[str], concurrency: int
+    ) -> AsyncIterator[Dict]:
+        batch_request = self._new_batch_request(requests, batch_id)
+
+        results = []
+        iterator = self._iter_results(requests, batch_request.batch_id, concurrency)
+        try:
+            async for result in iterator:
+                results.append(result)
+                yield result
+        finally:
+            # 소비자가 중단해도 내부 제너레이터를 바로 닫아 취소 상태를 기록
+            await iterator.aclose()
+
+        self._finalize_batch(batch_request, results)
+
+    def get_batch_status(self, batch_id: str) -> Optional[Dict]:
+        """배치 진행 상태 조회 (진행 중이면 실시간 진행률, 완료 시 결과 포함)"""
+        progress = self.batch_progress.get(batch_id)
+
+        for batch in self.batch_history:
+            if batch["batch_id"] == batch_id:
+                return {**batch, **(progress or {"status": "completed"})}
+
+        return dict(progress) if progress is not None else None
+
 
 class AutoLearner:
     """자동 학습 엔진"""
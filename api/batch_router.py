@@ -3,10 +3,12 @@
 """
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 import asyncio
+import json
 
 from api.advanced_features import BatchProcessor, AdvancedAnalyzer, AutoLearner
 
@@ -24,6 +26,8 @@ learner = AutoLearner()
 class BatchRequest(BaseModel):
     prompts: List[str]
     batch_id: Optional[str] = None
+    # 1 이상, 서버 풀 크기(batch_processor.max_concurrency)를 넘으면 그 값으로 제한
+    max_concurrency: Optional[int] = Field(None, ge=1)
 
 
 class BatchResponse(BaseModel):
@@ -52,7 +56,9 @@ class AnalysisResponse(BaseModel):
 async def process_batch(request: BatchRequest):
     """배치 처리 요청"""
     try:
-        result = await batch_processor.process_batch(request.prompts, request.batch_id)
+        result = await batch_processor.process_batch(
+            request.prompts, request.batch_id, request.max_concurrency
+        )
 
         return BatchResponse(
             batch_id=result["batch_id"],
@@ -66,6 +72,28 @@ async def process_batch(request: BatchRequest):
         raise HTTPException(status_code=500, detail=f"배치 처리 실패: {str(e)}")
 
 
+@batch_router.post("/process/stream")
+async def process_batch_stream(request: BatchRequest, format: str = "ndjson"):
+    """배치 스트리밍 처리 (완료되는 순서대로 NDJSON 또는 SSE로 전송)"""
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format은 ndjson 또는 sse")
+
+    results = batch_processor.stream_batch(
+        request.prompts, request.batch_id, request.max_concurrency
+    )
+
+    async def event_stream():
+        async for result in results:
+            line = json.dumps(result, ensure_ascii=False)
+            yield f"data: {line}\n\n" if format == "sse" else f"{line}\n"
+
+        if format == "sse":
+            yield "event: done\ndata: {}\n\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(event_stream(), media_type=media_type)
+
+
 @batch_router.get("/history")
 async def get_batch_history():
     """배치 처리 히스토리 조회"""
@@ -74,10 +102,10 @@ async def get_batch_history():
 
 @batch_router.get("/status/{batch_id}")
 async def get_batch_status(batch_id: str):
-    """특정 배치 상태 조회"""
-    for batch in batch_processor.batch_history:
-        if batch["batch_id"] == batch_id:
-            return batch
+    """특정 배치 상태 조회 (진행 중인 배치는 실시간 진행률)"""
+    status = batch_processor.get_batch_status(batch_id)
+    if status is not None:
+        return status
 
     raise HTTPException(status_code=404, detail="배치를 찾을 수 없습니다")
 
@@ -104,8 +132,7 @@ async def comprehensive_analysis(request: AnalysisRequest):
 async def get_user_patterns(days: int = 7):
     """사용자 패턴 분석"""
     try:
-        df = analyzer.load_history(days)
-        patterns = analyzer.analyze_user_patterns(df)
+        patterns = analyzer.summarize_user_patterns(days)
         return {"patterns": patterns, "days": days}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"패턴 분석 실패: {str(e)}")
@@ -115,8 +142,7 @@ async def get_user_patterns(days: int = 7):
 async def get_emotional_trends(days: int = 7):
     """감정 트렌드 분석"""
     try:
-        df = analyzer.load_history(days)
-        trends = analyzer.analyze_emotional_trends(df)
+        trends = analyzer.summarize_emotional_trends(days)
         return {"emotional_trends": trends, "days": days}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"감정 분석 실패: {str(e)}")
@@ -126,8 +152,7 @@ async def get_emotional_trends(days: int = 7):
 async def get_strategy_effectiveness(days: int = 7):
     """전략 효과성 분석"""
     try:
-        df = analyzer.load_history(days)
-        effectiveness = analyzer.analyze_strategy_effectiveness(df)
+        effectiveness = analyzer.summarize_strategy_effectiveness(days)
         return {"strategy_effectiveness": effectiveness, "days": days}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"전략 분석 실패: {str(e)}")
@@ -148,33 +173,7 @@ async def get_learning_report():
 async def get_system_stats():
     """시스템 통계"""
     try:
-        df = analyzer.load_history(30)  # 30일 데이터
-
-        if df.empty:
-            return {
-                "total_requests": 0,
-                "active_days": 0,
-                "average_daily_requests": 0,
-                "most_active_hour": None,
-                "data_period": "30일",
-            }
-
-        # 기본 통계
-        total_requests = len(df)
-        active_days = df["timestamp"].dt.date.nunique()
-        avg_daily = total_requests / max(active_days, 1)
-
-        # 시간대별 분석
-        hourly_dist = df["timestamp"].dt.hour.value_counts()
-        most_active_hour = hourly_dist.idxmax() if not hourly_dist.empty else None
-
-        return {
-            "total_requests": total_requests,
-            "active_days": active_days,
-            "average_daily_requests": round(avg_daily, 2),
-            "most_active_hour": most_active_hour,
-            "data_period": "30일",
-        }
+        return analyzer.system_stats(30)  # 30일 데이터
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
@@ -184,34 +183,7 @@ async def get_system_stats():
 async def get_realtime_status():
     """실시간 상태 조회"""
     try:
-        df = analyzer.load_history(1)  # 최근 1일
-
-        if df.empty:
-            return {
-                "status": "inactive",
-                "recent_requests": 0,
-                "last_activity": None,
-                "current_trend": "no_data",
-            }
-
-        recent_requests = len(df)
-        last_activity = df["timestamp"].max().isoformat()
-
-        # 최근 활동 트렌드
-        if recent_requests > 10:
-            current_trend = "high_activity"
-        elif recent_requests > 5:
-            current_trend = "moderate_activity"
-        else:
-            current_trend = "low_activity"
-
-        return {
-            "status": "active",
-            "recent_requests": recent_requests,
-            "last_activity": last_activity,
-            "current_trend": current_trend,
-            "period": "최근 24시간",
-        }
+        return analyzer.realtime_status()  # 최근 1일
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"실시간 상태 조회 실패: {str(e)}")
 
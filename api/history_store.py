@@ -0,0 +1,375 @@
+"""
+NPI 로그 히스토리 저장소
+- npi_log.jsonl을 바이트 오프셋 기준으로 증분 수집 (새 줄만 파싱)
+- SQLite 원본 테이블 (timestamp 인덱스) + 시간 버킷 단위 증분 집계
+- /analysis 엔드포인트는 전체 로그가 아닌 구간 집계만 조회
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from echo_engine.keyword_automaton import get_keyword_automaton
+
+# 감정 키워드 (claude_summary 기반 분류, 사전 순서대로 첫 매칭)
+EMOTION_KEYWORDS = {
+    "joy": ["기쁘", "행복", "좋", "최고", "성공", "축하"],
+    "sadness": ["슬프", "우울", "힘들", "속상", "실망", "포기"],
+    "anger": ["화", "짜증", "분노", "열받", "억울", "불만"],
+    "fear": ["무서", "걱정", "불안", "두려", "긴장", "스트레스"],
+    "neutral": ["그냥", "보통", "평상시", "일반적"],
+}
+
+NPI_COMPONENTS = ["structure", "emotion", "rhythm", "context", "strategy_tone", "silence"]
+
+HOUR = 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    ts REAL NOT NULL,
+    timestamp TEXT,
+    prompt TEXT,
+    strategy TEXT,
+    emotion TEXT,
+    npi_total REAL,
+    npi_score TEXT,
+    response TEXT,
+    claude_summary TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_logs_ts ON logs (ts);
+
+CREATE TABLE IF NOT EXISTS hourly_stats (
+    bucket INTEGER NOT NULL,
+    hour_of_day INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    emotion TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    npi_sum REAL NOT NULL,
+    npi_count INTEGER NOT NULL,
+    last_ts REAL NOT NULL,
+    PRIMARY KEY (bucket, strategy, emotion)
+);
+
+CREATE TABLE IF NOT EXISTS hourly_components (
+    bucket INTEGER NOT NULL,
+    component TEXT NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (bucket, component)
+);
+
+CREATE TABLE IF NOT EXISTS ingest_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+EMOTION_AUTOMATON = get_keyword_automaton(EMOTION_KEYWORDS)
+
+
+def classify_emotion(text: str) -> str:
+    """claude_summary에서 감정 분류 (매칭 없으면 빈 문자열)"""
+    return EMOTION_AUTOMATON.first_label((text or "").lower())
+
+
+def classify_emotions(texts: List[str]) -> List[str]:
+    """classify_emotion 벌크 버전 (컬럼 전체를 한 번에 스캔)"""
+    return EMOTION_AUTOMATON.classify_many([(text or "").lower() for text in texts])
+
+
+class HistoryAggregate:
+    """구간 집계 결과"""
+
+    def __init__(self):
+        self.total = 0
+        self.hourly: Dict[int, int] = {}
+        self.days: set = set()
+        self.strategies: Dict[str, List[float]] = {}  # [count, npi_sum, npi_count]
+        self.emotions: Dict[str, int] = {}
+        self.components: Dict[str, List[float]] = {}  # [sum, count]
+        self.last_ts: Optional[float] = None
+
+    def add(
+        self,
+        hour_of_day: int,
+        day: str,
+        strategy: str,
+        emotion: str,
+        count: int,
+        npi_sum: float,
+        npi_count: int,
+        last_ts: float,
+    ):
+        self.total += count
+        self.hourly[hour_of_day] = self.hourly.get(hour_of_day, 0) + count
+        self.days.add(day)
+
+        stats = self.strategies.setdefault(strategy, [0, 0.0, 0])
+        stats[0] += count
+        stats[1] += npi_sum
+        stats[2] += npi_count
+
+        if emotion:
+            self.emotions[emotion] = self.emotions.get(emotion, 0) + count
+
+        if self.last_ts is None or last_ts > self.last_ts:
+            self.last_ts = last_ts
+
+    def add_component(self, component: str, total: float, count: int):
+        stats = self.components.setdefault(component, [0.0, 0])
+        stats[0] += total
+        stats[1] += count
+
+    @property
+    def npi_mean(self) -> float:
+        npi_sum = sum(s[1] for s in self.strategies.values())
+        npi_count = sum(s[2] for s in self.strategies.values())
+        return npi_sum / npi_count if npi_count else 0
+
+
+class HistoryStore:
+    """NPI 로그 증분 수집 및 집계 저장소 (SQLite)"""
+
+    def __init__(self, log_path: str = "npi_log.jsonl", db_path: str = None):
+        self.log_path = log_path
+        self.db_path = db_path or os.path.splitext(log_path)[0] + "_history.db"
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def _get_offset(self) -> int:
+        row = self._conn.execute(
+            "SELECT value FROM ingest_state WHERE key = 'offset'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _reset(self):
+        """로그 파일이 잘리거나 교체된 경우 집계 재구성"""
+        for table in ("logs", "hourly_stats", "hourly_components", "ingest_state"):
+            self._conn.execute(f"DELETE FROM {table}")
+
+    def sync(self) -> int:
+        """
+        마지막 오프셋 이후 추가된 로그만 수집
+
+        Returns:
+            새로 수집한 엔트리 수
+        """
+        if not os.path.exists(self.log_path):
+            return 0
+
+        with self._lock:
+            offset = self._get_offset()
+            size = os.path.getsize(self.log_path)
+            if size < offset:
+                self._reset()
+                offset = 0
+            if size == offset:
+                return 0
+
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+
+            # 기록 중인 마지막 줄은 다음 수집으로 미룸
+            complete = data.rfind(b"\n") + 1
+            ingested = 0
+            for line in data[:complete].decode("utf-8", errors="replace").splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if self._ingest(entry):
+                    ingested += 1
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingest_state (key, value) VALUES ('offset', ?)",
+                (offset + complete,),
+            )
+            self._conn.commit()
+            return ingested
+
+    def _ingest(self, entry: Dict) -> bool:
+        """엔트리 한 개를 원본 테이블과 시간 버킷 집계에 반영"""
+        try:
+            moment = datetime.fromisoformat(str(entry["timestamp"]))
+        except (KeyError, ValueError):
+            return False
+
+        ts = moment.timestamp()
+        bucket = int(ts // HOUR)
+        npi_score = entry.get("npi_score") or {}
+        npi_total = npi_score.get("total") if isinstance(npi_score, dict) else None
+        strategy = entry.get("strategy") or ""
+        emotion = classify_emotion(str(entry.get("claude_summary") or ""))
+
+        self._conn.execute(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                ts,
+                entry["timestamp"],
+                entry.get("prompt"),
+                strategy,
+                emotion,
+                npi_total,
+                json.dumps(npi_score, ensure_ascii=False),
+                entry.get("response"),
+                entry.get("claude_summary"),
+            ),
+        )
+        self._conn.execute(
+            """
+            INSERT INTO hourly_stats VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?)
+            ON CONFLICT (bucket, strategy, emotion) DO UPDATE SET
+                count = count + 1,
+                npi_sum = npi_sum + excluded.npi_sum,
+                npi_count = npi_count + excluded.npi_count,
+                last_ts = MAX(last_ts, excluded.last_ts)
+            """,
+            (
+                bucket,
+                moment.hour,
+                moment.date().isoformat(),
+                strategy,
+                emotion,
+                npi_total or 0.0,
+                1 if npi_total is not None else 0,
+                ts,
+            ),
+        )
+
+        if isinstance(npi_score, dict):
+            for component in NPI_COMPONENTS:
+                value = npi_score.get(component)
+                if isinstance(value, (int, float)):
+                    self._conn.execute(
+                        """
+                        INSERT INTO hourly_components VALUES (?, ?, ?, 1)
+                        ON CONFLICT (bucket, component) DO UPDATE SET
+                            total = total + excluded.total,
+                            count = count + 1
+                        """,
+                        (bucket, component, float(value)),
+                    )
+        return True
+
+    def _window(self, days: float) -> Tuple[float, int]:
+        """(cutoff 타임스탬프, 완전히 포함되는 첫 버킷)"""
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        return cutoff, int(math.floor(cutoff / HOUR)) + 1
+
+    def aggregate(self, days: float) -> HistoryAggregate:
+        """
+        최근 days일 구간 집계
+
+        완전히 포함되는 시간 버킷은 집계 테이블에서, 경계 버킷은
+        timestamp 인덱스로 원본 행만 읽어 합산한다.
+        """
+        self.sync()
+        cutoff, first_full_bucket = self._window(days)
+        result = HistoryAggregate()
+
+        with self._lock:
+            for row in self._conn.execute(
+                """
+                SELECT hour_of_day, day, strategy, emotion, count, npi_sum,
+                       npi_count, last_ts
+                FROM hourly_stats WHERE bucket >= ?
+                """,
+                (first_full_bucket,),
+            ):
+                result.add(*row)
+
+            for component, total, count in self._conn.execute(
+                """
+                SELECT component, SUM(total), SUM(count)
+                FROM hourly_components WHERE bucket >= ? GROUP BY component
+                """,
+                (first_full_bucket,),
+            ):
+                result.add_component(component, total, count)
+
+            boundary_rows = self._conn.execute(
+                """
+                SELECT ts, strategy, emotion, npi_total, npi_score
+                FROM logs WHERE ts >= ? AND ts < ?
+                """,
+                (cutoff, first_full_bucket * HOUR),
+            ).fetchall()
+
+        for ts, strategy, emotion, npi_total, npi_score in boundary_rows:
+            moment = datetime.fromtimestamp(ts)
+            result.add(
+                moment.hour,
+                moment.date().isoformat(),
+                strategy,
+                emotion,
+                1,
+                npi_total or 0.0,
+                1 if npi_total is not None else 0,
+                ts,
+            )
+            scores = json.loads(npi_score or "{}")
+            for component in NPI_COMPONENTS:
+                value = scores.get(component)
+                if isinstance(value, (int, float)):
+                    result.add_component(component, float(value), 1)
+
+        return result
+
+    def load_frame(self, days: float) -> pd.DataFrame:
+        """최근 days일 원본 로그를 DataFrame으로 (timestamp 인덱스 범위 조회)"""
+        self.sync()
+        cutoff, _ = self._window(days)
+
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT timestamp, prompt, npi_score, strategy, response, claude_summary
+                FROM logs WHERE ts >= ? ORDER BY ts
+                """,
+                (cutoff,),
+            ).fetchall()
+
+        if not rows:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(
+            rows,
+            columns=[
+                "timestamp",
+                "prompt",
+                "npi_score",
+                "strategy",
+                "response",
+                "claude_summary",
+            ],
+        )
+        df["npi_score"] = df["npi_score"].map(json.loads)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df
+
+
+_stores: Dict[str, HistoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_history_store(log_path: str = "npi_log.jsonl") -> HistoryStore:
+    """로그 경로별 HistoryStore 싱글톤"""
+    key = os.path.abspath(log_path)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = HistoryStore(log_path)
+        return _stores[key]
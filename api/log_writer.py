@@ -1,8 +1,12 @@
 import json
+import threading
 from datetime import datetime
 
 LOG_PATH = "npi_log.jsonl"
 
+# 배치 워커 스레드 간 동시 append 보호
+_write_lock = threading.Lock()
+
 
 def write_log(prompt, npi_score, strategy, response, claude_result):
     log_entry = {
@@ -13,5 +17,15 @@ def write_log(prompt, npi_score, strategy, response, claude_result):
         "response": response,
         "claude_summary": claude_result,
     }
-    with open(LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+    line = json.dumps(log_entry, ensure_ascii=False) + "\n"
+    with _write_lock:
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    # 분석용 시간 버킷 집계 증분 갱신 (새로 append된 줄만 수집)
+    try:
+        from api.history_store import get_history_store
+
+        get_history_store(LOG_PATH).sync()
+    except Exception as e:
+        print(f"히스토리 집계 갱신 실패: {e}")
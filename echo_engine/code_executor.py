@@ -9,19 +9,38 @@ WebShell용 자연어→코드 생성→실행 파이프라인의 실행 엔진
 3. 시간 제한 및 리소스 제한
 4. 보안 필터링 (컴파일된 정규식으로 성능 향상)
 5. 실행 환경 격리 및 효율적인 임시 파일 관리
+6. 미리 띄워둔 인터프리터 풀 (작업마다 포크, rlimit 적용, 작업별 scratch 디렉토리, N회 실행 후 재활용)
 """
 
 import asyncio
+import atexit
+import json
+import select
+import shutil
+import signal
+import subprocess
 import tempfile
+import threading
 import os
 import sys
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 import re
 from functools import lru_cache
 
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+POOL_AVAILABLE = RESOURCE_AVAILABLE and os.name == "posix"
+WORKER_SPAWN_TIMEOUT = 15.0  # 워커 인터프리터 기동 대기 상한 (초)
+
 @dataclass
 class CodeExecutionResult:
     """코드 실행 결과"""
@@ -44,6 +63,10 @@ class ExecutionConfig:
     allow_subprocess: bool = False
     working_directory: Optional[str] = None
     python_path: Optional[str] = None
+    max_file_size_mb: int = 64
+    use_pool: bool = True  # False면 실행마다 새 인터프리터를 띄운다
+    pool_size: int = 4
+    max_jobs_per_worker: int = 50
 
 class SecurityFilter:
     """보안 필터 - 미리 컴파일된 정규식으로 최적화"""
@@ -81,6 +104,419 @@ class SecurityFilter:
         
         return is_safe, warnings
 
+def _run_job_child(job: Dict[str, Any], limits: Dict[str, Any]):
+    """포크된 작업 프로세스 - 제한을 걸고 코드를 실행한 뒤 종료 (상태는 작업과 함께 사라진다)"""
+    import atexit as job_atexit
+    import builtins
+    import traceback
+
+    os.setpgid(0, 0)  # 시간 초과 시 사용자 코드가 만든 자식까지 한 번에 종료
+    if limits.get("memory_mb"):
+        mem = limits["memory_mb"] << 20
+        resource.setrlimit(resource.RLIMIT_AS, (mem, mem))
+    if limits.get("file_size_mb"):
+        fsize = limits["file_size_mb"] << 20
+        resource.setrlimit(resource.RLIMIT_FSIZE, (fsize, fsize))
+    # soft == hard 로 걸어 사용자 코드가 한도를 다시 올릴 수 없게 한다
+    cpu = job["cpu_seconds"] + 1
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+    signal.signal(signal.SIGXFSZ, signal.SIG_IGN)  # 크기 초과 쓰기는 OSError(EFBIG)로
+
+    out = open(job["stdout_path"], "w", encoding="utf-8", errors="replace")
+    err = open(job["stderr_path"], "w", encoding="utf-8", errors="replace")
+    os.dup2(out.fileno(), 1)
+    os.dup2(err.fileno(), 2)
+    sys.stdout, sys.stderr = out, err
+    sys.argv = [job["script"]]
+    sys.path[0] = job["scratch"]
+    os.chdir(job["cwd"])
+
+    return_code = 0
+    try:
+        try:
+            # runpy.run_path처럼 새 __main__ 모듈을 sys.modules에 설치 (pickle/multiprocessing 호환)
+            main_module = types.ModuleType("__main__")
+            main_module.__file__ = job["script"]
+            main_module.__builtins__ = builtins
+            main_module.__loader__ = main_module.__package__ = main_module.__spec__ = None
+            sys.modules["__main__"] = main_module
+            code = compile(job["code"], job["script"], "exec")
+            exec(code, main_module.__dict__)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return_code = int(e.code or 0)
+            else:
+                print(e.code, file=sys.stderr)
+                return_code = 1
+        except BaseException as e:
+            # 워커 자신의 프레임은 빼고 일반 스크립트 실행과 같은 traceback 출력
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+            return_code = 1
+        # 인터프리터 종료와 같은 순서: non-daemon 스레드 대기 후 atexit 실행
+        threading._shutdown()
+        job_atexit._run_exitfuncs()
+    except BaseException:
+        traceback.print_exc()
+        return_code = return_code or 1
+    finally:
+        for stream in (sys.stdout, sys.stderr, out, err):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        os._exit(return_code & 0xFF)
+
+
+def _worker_main(limits: Dict[str, Any]):
+    """풀 워커 프로세스 본체 (포크 서버) - 작업마다 새 자식을 포크해 실행
+
+    워커 자신은 사용자 코드를 실행하지 않으므로 모듈/builtins/환경 상태가 작업 간에 공유되지 않는다.
+    """
+    # 프로토콜용 fd를 따로 빼두고 0/1/2는 /dev/null로 둔다
+    proto_in_fd, proto_out_fd = os.dup(0), os.dup(1)
+    proto_in = os.fdopen(proto_in_fd, "r", encoding="utf-8")
+    proto_out = os.fdopen(proto_out_fd, "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    def send(message: Dict[str, Any]):
+        proto_out.write(json.dumps(message) + "\n")
+        proto_out.flush()
+
+    send({"ready": True})
+
+    for line in proto_in:
+        job = json.loads(line)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(proto_in_fd)
+                os.close(proto_out_fd)
+                _run_job_child(job, limits)
+            finally:
+                os._exit(70)  # 준비 단계에서 실패해도 워커 루프로 돌아가지 않는다
+
+        try:
+            os.setpgid(pid, pid)  # 자식과 이중으로 설정 - killpg가 자식의 setpgid보다 먼저 와도 같은 그룹
+        except (ProcessLookupError, PermissionError):
+            pass  # 자식이 이미 종료했거나 스스로 그룹을 만든 뒤
+        send({"pid": pid})  # 시간 초과 시 풀이 이 pid의 프로세스 그룹을 종료한다
+        _, status, usage = os.wait4(pid, 0)
+        cpu_time = usage.ru_utime + usage.ru_stime
+        if os.WIFSIGNALED(status):
+            return_code = -os.WTERMSIG(status)
+        else:
+            return_code = os.WEXITSTATUS(status)
+        send({
+            "return_code": return_code,
+            "cpu_exceeded": return_code < 0 and cpu_time >= job["cpu_seconds"],
+            "cpu_time": round(cpu_time, 4),
+            "max_rss_kb": usage.ru_maxrss,
+        })
+
+
+class _PoolWorker:
+    """미리 띄워둔 인터프리터 하나 (stdin/stdout JSON 줄 프로토콜)"""
+
+    def __init__(self, python_executable: str, limits: Dict[str, Any], base_dir: str):
+        self.capture_dir = tempfile.mkdtemp(prefix="worker_", dir=base_dir)
+        self.process = subprocess.Popen(
+            [python_executable, os.path.abspath(__file__), "--pool-worker", json.dumps(limits)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            cwd=self.capture_dir, env=os.environ.copy(), close_fds=True,
+        )
+        self.jobs = 0
+        self.ready = False
+        self._buffer = b""
+
+    def read_message(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """응답 한 줄 읽기 - 시간 초과면 None, 워커가 죽었으면 EOFError"""
+        deadline = time.monotonic() + timeout
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("pool worker exited")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def ensure_ready(self) -> bool:
+        if not self.ready:
+            try:
+                self.ready = bool(self.read_message(WORKER_SPAWN_TIMEOUT))
+            except (EOFError, ValueError):
+                self.ready = False
+        return self.ready
+
+    def send(self, message: Dict[str, Any]):
+        self.process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+        self.process.stdin.flush()
+
+    def kill(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+        shutil.rmtree(self.capture_dir, ignore_errors=True)
+
+
+class InterpreterPool:
+    """🔥 사전 기동 인터프리터 풀 - 짧은 코드 실행에서 인터프리터 기동 비용 제거
+
+    - 워커는 포크 서버: 작업마다 새 자식을 포크하므로 작업 간 상태가 공유되지 않는다
+    - 작업 프로세스 rlimit: 메모리(RLIMIT_AS), 파일 크기(RLIMIT_FSIZE), CPU(RLIMIT_CPU), soft == hard
+    - 작업마다 새 scratch 디렉토리, 끝나면 삭제
+    - 시간 초과 시 작업 프로세스 그룹만 종료, max_jobs_per_worker회 실행 / 비정상 종료 시 워커 교체
+    - 대기열 지표: stats()
+    """
+
+    def __init__(
+        self, python_executable: str = None, size: int = 4, max_jobs_per_worker: int = 50,
+        max_memory_mb: int = 512, max_file_size_mb: int = 64, prewarm: bool = True,
+    ):
+        self.python_executable = python_executable or sys.executable
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self.limits = {"memory_mb": max_memory_mb, "file_size_mb": max_file_size_mb}
+        self.base_dir = tempfile.mkdtemp(prefix="echo_code_pool_")
+        self._cond = threading.Condition()
+        self._idle: List[_PoolWorker] = []
+        self._live = 0
+        self._closed = False
+        self._dispatcher = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="code-pool")
+        self._stats = {
+            "jobs": 0, "spawned": 0, "waiting": 0, "max_waiting": 0,
+            "total_wait": 0.0, "recycled": {},
+        }
+        if prewarm:
+            with self._cond:
+                while self._live < self.size:
+                    self._idle.append(self._spawn())
+
+    # ----- 워커 관리 -----
+
+    def _spawn(self) -> _PoolWorker:
+        """_cond 보유 상태에서 호출"""
+        worker = _PoolWorker(self.python_executable, self.limits, self.base_dir)
+        self._live += 1
+        self._stats["spawned"] += 1
+        return worker
+
+    def _enqueue(self) -> float:
+        with self._cond:
+            self._stats["waiting"] += 1
+            self._stats["max_waiting"] = max(self._stats["max_waiting"], self._stats["waiting"])
+        return time.monotonic()
+
+    def _acquire(self, enqueued_at: float) -> _PoolWorker:
+        with self._cond:
+            while not self._idle and self._live >= self.size and not self._closed:
+                self._cond.wait()
+            self._stats["waiting"] -= 1
+            if self._closed:
+                raise RuntimeError("interpreter pool is closed")
+            self._stats["total_wait"] += time.monotonic() - enqueued_at
+            # LIFO - 최근에 쓴 워커가 캐시가 가장 따뜻하다
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.poll() is None:
+                    return worker
+                # 대기 중에 죽은 워커 (OOM killer 등)는 정리만 한다
+                worker.kill()
+                self._live -= 1
+                recycled = self._stats["recycled"]
+                recycled["died_idle"] = recycled.get("died_idle", 0) + 1
+            return self._spawn()
+
+    def _release(self, worker: _PoolWorker, recycle_reason: Optional[str] = None):
+        if recycle_reason is None and worker.jobs >= self.max_jobs_per_worker:
+            recycle_reason = "max_jobs"
+        if recycle_reason is not None:
+            worker.kill()
+        with self._cond:
+            if recycle_reason is None and not self._closed:
+                self._idle.append(worker)
+            else:
+                self._live -= 1
+                if recycle_reason is not None:
+                    recycled = self._stats["recycled"]
+                    recycled[recycle_reason] = recycled.get(recycle_reason, 0) + 1
+                if self._closed:
+                    worker.kill()
+                else:
+                    self._idle.append(self._spawn())  # 교체 워커를 바로 기동해 둔다
+            self._cond.notify()
+
+    # ----- 실행 -----
+
+    def run(
+        self, code: str, timeout: float, working_directory: Optional[str] = None,
+        collect_files: bool = True, _enqueued_at: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """코드 한 번 실행 - stdout/stderr/return_code/files_created/resource_usage 반환"""
+        enqueued_at = self._enqueue() if _enqueued_at is None else _enqueued_at
+        worker = self._acquire(enqueued_at)
+        queue_wait = time.monotonic() - enqueued_at
+        if not worker.ensure_ready():
+            self._release(worker, "spawn_failed")
+            raise RuntimeError("인터프리터 풀 워커 기동 실패")
+
+        scratch = tempfile.mkdtemp(prefix="job_", dir=self.base_dir)
+        script = os.path.join(scratch, "temp_script.py")
+        stdout_path = os.path.join(worker.capture_dir, "stdout")
+        stderr_path = os.path.join(worker.capture_dir, "stderr")
+        cwd = working_directory or scratch
+        recycle_reason, usage = None, {}
+        try:
+            # 이전 작업의 출력이 다른 호출자에게 넘어가지 않도록 캡처 파일을 먼저 지운다
+            for path in (stdout_path, stderr_path):
+                if os.path.exists(path):
+                    os.unlink(path)
+            with open(script, "w", encoding="utf-8") as f:
+                f.write(code)
+            worker.send({
+                "code": code, "script": script, "scratch": scratch, "cwd": cwd,
+                "stdout_path": stdout_path, "stderr_path": stderr_path,
+                "cpu_seconds": max(1, int(timeout)),
+            })
+            worker.jobs += 1
+            deadline = time.monotonic() + timeout
+            try:
+                started = worker.read_message(WORKER_SPAWN_TIMEOUT)
+                job_pid = started["pid"] if started else None
+                reply = worker.read_message(max(0.0, deadline - time.monotonic())) if job_pid else None
+                timed_out = job_pid is not None and reply is None
+                if timed_out:
+                    # 작업 프로세스 그룹만 종료 - 워커는 자식을 회수하고 응답한 뒤 재사용된다
+                    try:
+                        os.killpg(job_pid, signal.SIGKILL)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                    if worker.read_message(WORKER_SPAWN_TIMEOUT) is None:
+                        recycle_reason = "unresponsive"
+                elif reply is None:
+                    raise EOFError("no job pid from pool worker")
+            except (EOFError, OSError, ValueError, KeyError, TypeError):
+                timed_out, reply = False, {"crashed": True}
+
+            if timed_out:
+                stdout, stderr, return_code = "", f"\n실행 시간 초과 ({timeout}초)", -9
+            elif reply.get("crashed"):
+                recycle_reason = "crashed"
+                worker.kill()
+                stdout = self._read_capture(stdout_path)
+                stderr = self._read_capture(stderr_path)
+                stderr += f"\n워커 프로세스 비정상 종료 (종료 코드: {worker.process.returncode})"
+                return_code = -1
+            else:
+                stdout = self._read_capture(stdout_path)
+                stderr = self._read_capture(stderr_path)
+                return_code = reply["return_code"]
+                if reply["cpu_exceeded"]:
+                    stderr += "\nCPU 시간 제한 초과"
+                usage = {"cpu_time": reply["cpu_time"], "max_rss_kb": reply["max_rss_kb"]}
+
+            files_created = []
+            if collect_files and os.path.isdir(cwd):
+                files_created = [
+                    str(p) for p in Path(cwd).iterdir() if p.is_file() and str(p) != script
+                ]
+            usage.update({"queue_wait": round(queue_wait, 6), "worker_pid": worker.process.pid})
+            return {
+                "stdout": stdout, "stderr": stderr, "return_code": return_code,
+                "files_created": files_created, "resource_usage": usage,
+            }
+        except BaseException:
+            recycle_reason = recycle_reason or "error"
+            raise
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+            with self._cond:
+                self._stats["jobs"] += 1
+            self._release(worker, recycle_reason)
+
+    async def run_async(self, code: str, timeout: float, working_directory: Optional[str] = None,
+                        collect_files: bool = True) -> Dict[str, Any]:
+        enqueued_at = self._enqueue()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._dispatcher, self.run, code, timeout, working_directory, collect_files, enqueued_at
+        )
+
+    @staticmethod
+    def _read_capture(path: str) -> str:
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열/워커 지표"""
+        with self._cond:
+            jobs = self._stats["jobs"]
+            return {
+                "size": self.size,
+                "live_workers": self._live,
+                "idle_workers": len(self._idle),
+                "busy_workers": self._live - len(self._idle),
+                "queue_depth": self._stats["waiting"],
+                "max_queue_depth": self._stats["max_waiting"],
+                "jobs": jobs,
+                "avg_queue_wait_ms": round(self._stats["total_wait"] / jobs * 1000, 3) if jobs else 0.0,
+                "spawned": self._stats["spawned"],
+                "recycled": dict(self._stats["recycled"]),
+            }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.kill()
+        self._dispatcher.shutdown(wait=False)
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+
+_pools: Dict[Tuple, InterpreterPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_interpreter_pool(config: ExecutionConfig) -> InterpreterPool:
+    """설정(인터프리터/제한/크기)이 같은 실행기끼리 풀 공유 - 시간 제한은 작업 단위라 키에서 제외"""
+    python_executable = config.python_path or sys.executable
+    key = (python_executable, config.pool_size, config.max_jobs_per_worker,
+           config.max_memory_mb, config.max_file_size_mb)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = InterpreterPool(
+                python_executable, size=config.pool_size, max_jobs_per_worker=config.max_jobs_per_worker,
+                max_memory_mb=config.max_memory_mb, max_file_size_mb=config.max_file_size_mb,
+            )
+        return pool
+
+
+@atexit.register
+def _close_interpreter_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
 class CodeExecutor:
     """🏃 안전한 비동기 코드 실행 엔진"""
 
@@ -89,8 +525,11 @@ class CodeExecutor:
         self.security_filter = SecurityFilter()
         self.auto_generated_dir = Path(__file__).parent / "auto_generated"
         self.auto_generated_dir.mkdir(exist_ok=True)
+        self.pool = get_interpreter_pool(self.config) if self.config.use_pool and POOL_AVAILABLE else None
         print(f"🏃 Code Executor 초기화 완료 (Async Optimized)")
         print(f"   자동 생성 저장: {self.auto_generated_dir}")
+        if self.pool:
+            print(f"   인터프리터 풀: {self.pool.size}개 워커 사전 기동")
 
     async def execute_code(
         self, code: str, filename: str = None, save_to_auto_generated: bool = True
@@ -116,34 +555,14 @@ class CodeExecutor:
             except Exception as e:
                 security_warnings.append(f"자동 생성 폴더 저장 실패: {e}")
 
-        python_executable = self.config.python_path or sys.executable
-        
         try:
-            with tempfile.TemporaryDirectory() as temp_dir_str:
-                temp_dir = Path(temp_dir_str)
-                temp_file = temp_dir / "temp_script.py"
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    f.write(code)
-
-                working_dir = self.config.working_directory or temp_dir_str
-                process = await asyncio.create_subprocess_exec(
-                    python_executable, str(temp_file),
-                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
-                    cwd=working_dir, env=os.environ.copy()
+            if self.pool is not None:
+                run = await self.pool.run_async(
+                    code, self.config.timeout_seconds, self.config.working_directory,
+                    self.config.allow_file_creation,
                 )
-                
-                try:
-                    stdout_b, stderr_b = await asyncio.wait_for(
-                        process.communicate(), timeout=self.config.timeout_seconds
-                    )
-                    stdout, stderr = stdout_b.decode(), stderr_b.decode()
-                    return_code = process.returncode
-                except asyncio.TimeoutError:
-                    process.kill()
-                    await process.wait()
-                    stdout, stderr = "", f"\n실행 시간 초과 ({self.config.timeout_seconds}초)"
-                    return_code = -9
-
+            else:
+                run = await self._run_cold(code)
         except Exception as e:
             return CodeExecutionResult(
                 success=False, stdout="", stderr=f"실행 오류: {e}", return_code=-1,
@@ -152,17 +571,57 @@ class CodeExecutor:
             )
 
         execution_time = time.monotonic() - start_time
-        created_files = []
-        if self.config.allow_file_creation and 'temp_dir' in locals():
-            created_files = [str(p) for p in Path(working_dir).iterdir() if p.is_file() and p != temp_file]
-
+        stdout, stderr, return_code = run["stdout"], run["stderr"], run["return_code"]
         success = return_code == 0 and not stderr.strip()
         return CodeExecutionResult(
             success=success, stdout=stdout, stderr=stderr, return_code=return_code,
-            execution_time=execution_time, files_created=saved_files + created_files,
-            security_warnings=security_warnings, resource_usage={"execution_time": execution_time}
+            execution_time=execution_time, files_created=saved_files + run["files_created"],
+            security_warnings=security_warnings,
+            resource_usage={"execution_time": execution_time, **run["resource_usage"]}
         )
 
+    async def _run_cold(self, code: str) -> Dict[str, Any]:
+        """풀 없이 실행마다 새 인터프리터 기동 (resource 모듈이 없는 플랫폼 / use_pool=False)"""
+        python_executable = self.config.python_path or sys.executable
+
+        with tempfile.TemporaryDirectory() as temp_dir_str:
+            temp_dir = Path(temp_dir_str)
+            temp_file = temp_dir / "temp_script.py"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(code)
+
+            working_dir = self.config.working_directory or temp_dir_str
+            process = await asyncio.create_subprocess_exec(
+                python_executable, str(temp_file),
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                cwd=working_dir, env=os.environ.copy()
+            )
+
+            try:
+                stdout_b, stderr_b = await asyncio.wait_for(
+                    process.communicate(), timeout=self.config.timeout_seconds
+                )
+                stdout, stderr = stdout_b.decode(), stderr_b.decode()
+                return_code = process.returncode
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                stdout, stderr = "", f"\n실행 시간 초과 ({self.config.timeout_seconds}초)"
+                return_code = -9
+
+            created_files = []
+            if self.config.allow_file_creation:
+                created_files = [str(p) for p in Path(working_dir).iterdir() if p.is_file() and p != temp_file]
+
+        return {
+            "stdout": stdout, "stderr": stderr, "return_code": return_code,
+            "files_created": created_files, "resource_usage": {},
+        }
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """인터프리터 풀 대기열/워커 지표 (풀 미사용 시 빈 dict)"""
+        return self.pool.stats() if self.pool else {}
+
     def validate_and_prepare_code(self, code: str, coding_intent: str = None) -> Tuple[str, List[str]]:
         """코드 검증 및 준비"""
         warnings = []
@@ -219,4 +678,7 @@ async def main_test():
     print("\n✅ Code Executor 테스트 완료!")
 
 if __name__ == "__main__":
-    asyncio.run(main_test())
+    if len(sys.argv) > 2 and sys.argv[1] == "--pool-worker":
+        _worker_main(json.loads(sys.argv[2]))
+    else:
+        asyncio.run(main_test())
@@ -12,6 +12,8 @@ import uuid
 import jwt
 from cryptography.fernet import Fernet
 
+from echo_engine.rate_limiter import get_rate_limiter
+
 try:
     from echo_engine.echo_error_handler import handle_vector_error, echo_safe
     import re
@@ -40,43 +42,21 @@ except ImportError:
 
 
 class RateLimiter:
-    """Rate limiting 클래스"""
+    """Rate limiting 클래스 - 슬라이딩 윈도우 카운터 (판정 O(1))
+
+    ECHO_RATE_LIMIT_BACKEND=sqlite 이면 같은 호스트의 여러 워커 프로세스가 한도를 공유한다.
+    """
 
-    def __init__(self, per_minute: int = 60, per_day: int = 1000):
+    def __init__(
+        self, per_minute: int = 60, per_day: int = 1000, name: str = "deep_lookup"
+    ):
         self.per_minute = per_minute
         self.per_day = per_day
-        self.minute_requests = []
-        self.day_requests = []
+        self.limiter = get_rate_limiter(name, [(per_minute, 60), (per_day, 86400)])
 
     def allow_request(self) -> bool:
-        """요청 허용 여부 판단"""
-        now = datetime.now()
-
-        # 1분 이내 요청 정리
-        self.minute_requests = [
-            req_time
-            for req_time in self.minute_requests
-            if now - req_time < timedelta(minutes=1)
-        ]
-
-        # 1일 이내 요청 정리
-        self.day_requests = [
-            req_time
-            for req_time in self.day_requests
-            if now - req_time < timedelta(days=1)
-        ]
-
-        # 제한 확인
-        if len(self.minute_requests) >= self.per_minute:
-            return False
-        if len(self.day_requests) >= self.per_day:
-            return False
-
-        # 요청 기록
-        self.minute_requests.append(now)
-        self.day_requests.append(now)
-
-        return True
+        """요청 허용 여부 판단 (허용 시 분/일 카운터에 함께 기록)"""
+        return self.limiter.allow()
 
 
 class JWTHandler:
@@ -5,6 +5,9 @@
 
 import json
 import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 import numpy as np
@@ -26,6 +29,129 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
 
+class EmbeddingStore:
+    """
+    단일 파일(SQLite blob 테이블) 임베딩 캐시 + 프로세스 내 LRU 계층
+    키마다 .npy 파일을 두는 대신 한 DB에 모아 일괄 조회/저장
+    """
+
+    def __init__(
+        self, db_path: Path, max_memory_entries: int = 2048, max_disk_entries: int = 10000
+    ):
+        self.db_path = Path(db_path)
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                dtype TEXT NOT NULL,
+                vector BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _remember(self, key: str, vector: np.ndarray):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """여러 키 일괄 조회 (LRU 우선, 나머지는 한 번의 쿼리)"""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                    self.stats["memory_hits"] += 1
+                else:
+                    missing.append(key)
+
+            for start in range(0, len(missing), 500):
+                chunk = missing[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, dtype, blob in self._conn.execute(
+                    f"SELECT key, dtype, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ):
+                    vector = np.frombuffer(blob, dtype=dtype).copy()
+                    found[key] = vector
+                    self._remember(key, vector)
+                    self.stats["disk_hits"] += 1
+
+            self.stats["misses"] += len(keys) - len(found)
+        return found
+
+    def put(self, key: str, vector: np.ndarray):
+        self.put_many({key: vector})
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        """여러 임베딩을 한 트랜잭션으로 저장"""
+        if not items:
+            return
+        with self._lock:
+            rows = []
+            for key, vector in items.items():
+                vector = np.ascontiguousarray(vector)
+                self._remember(key, vector)
+                rows.append((key, vector.dtype.str, vector.tobytes()))
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dtype, vector) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._evict_disk()
+            self._conn.commit()
+
+    def _evict_disk(self):
+        """디스크 캐시 최대 크기 초과분 제거 (오래 저장된 순)"""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE rowid IN "
+                "(SELECT rowid FROM embeddings ORDER BY rowid LIMIT ?)",
+                (overflow,),
+            )
+
+    def import_npy_files(self, cache_dir: Path) -> int:
+        """이전 버전의 키별 .npy 캐시 파일을 가져오고 삭제"""
+        items = {}
+        for npy_file in cache_dir.glob("*.npy"):
+            try:
+                items[npy_file.stem] = np.load(npy_file)
+            except Exception:
+                pass
+        if items:
+            self.put_many(items)
+        for npy_file in cache_dir.glob("*.npy"):
+            npy_file.unlink()
+        return len(items)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
 class EchoEmbeddingEngine:
     """
     Echo 시그니처 기반 임베딩 엔진
@@ -39,6 +165,13 @@ class EchoEmbeddingEngine:
         # 캐시 설정
         self.cache_dir = Path("data/embeddings_cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        caching = self.config.get("caching", {})
+        self.cache_store = EmbeddingStore(
+            self.cache_dir / "embeddings.db",
+            max_memory_entries=caching.get("max_memory_entries", 2048),
+            max_disk_entries=caching.get("max_cache_size", 10000),
+        )
+        self.cache_store.import_npy_files(self.cache_dir)
 
         # 임베딩 모델 초기화
         self.models = {}
@@ -79,7 +212,11 @@ class EchoEmbeddingEngine:
                     },
                     "mock": {"dimensions": 128, "seed": 42},
                 },
-                "caching": {"enabled": True, "max_cache_size": 10000},
+                "caching": {
+                    "enabled": True,
+                    "max_cache_size": 10000,
+                    "max_memory_entries": 2048,
+                },
                 "echo_integration": {
                     "signature_aware": True,
                     "resonance_weighting": True,
@@ -179,17 +316,58 @@ class EchoEmbeddingEngine:
         signature: str = "Echo-Aurora",
         contexts: List[Dict[str, Any]] = None,
     ) -> List[np.ndarray]:
-        """배치 임베딩 처리"""
+        """
+        배치 임베딩 처리
+
+        중복 키를 제거하고 캐시 히트는 일괄 조회하며,
+        미스만 모아 모델에 한 번의 encode 호출로 전달한다.
+        """
         if contexts is None:
             contexts = [{}] * len(texts)
 
-        embeddings = []
-        for text, context in zip(texts, contexts):
-            embedding = self.embed_text(text, signature, context)
-            embeddings.append(embedding)
+        keys = [
+            self._get_cache_key(text, signature, context)
+            for text, context in zip(texts, contexts)
+        ]
+        pending = {}
+        for key, text, context in zip(keys, texts, contexts):
+            pending.setdefault(key, (text, context))
+
+        if self.config.get("caching", {}).get("enabled", True):
+            embeddings = self.cache_store.get_many(list(pending))
+        else:
+            embeddings = {}
+
+        misses = [key for key in pending if key not in embeddings]
+        if misses:
+            base_embeddings = self._generate_base_embeddings(
+                [pending[key][0] for key in misses]
+            )
 
-        print(f"📦 배치 임베딩 완료: {len(texts)}개 텍스트")
-        return embeddings
+            computed = {}
+            for key, base_embedding in zip(misses, base_embeddings):
+                text, context = pending[key]
+                if self.config.get("echo_integration", {}).get("signature_aware", True):
+                    computed[key] = self._apply_signature_weights(
+                        base_embedding, signature, text, context
+                    )
+                else:
+                    computed[key] = base_embedding
+
+            if self.config.get("caching", {}).get("enabled", True):
+                self.cache_store.put_many(computed)
+            embeddings.update(computed)
+
+            # 메타데이터 기록 (embed_text와 동일하게 신규 계산분만)
+            for key, embedding in computed.items():
+                text, context = pending[key]
+                self._log_embedding_event(text, signature, embedding.shape, context)
+
+        print(
+            f"📦 배치 임베딩 완료: {len(texts)}개 텍스트 "
+            f"(고유 {len(pending)}, 신규 계산 {len(misses)})"
+        )
+        return [embeddings[key] for key in keys]
 
     def _generate_base_embedding(self, text: str) -> np.ndarray:
         """기본 임베딩 벡터 생성"""
@@ -200,6 +378,29 @@ class EchoEmbeddingEngine:
         else:
             return self._mock_embed(text)
 
+    def _generate_base_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """여러 텍스트의 기본 임베딩을 모델 호출 한 번으로 생성"""
+        if self.current_model == "openai":
+            try:
+                model = self.config["models"]["openai"]["model"]
+                response = openai.embeddings.create(input=texts, model=model)
+                return [
+                    np.array(item.embedding, dtype=np.float32) for item in response.data
+                ]
+            except Exception as e:
+                print(f"🚨 OpenAI 배치 임베딩 실패: {e}, Mock으로 대체")
+                return [self._mock_embed(text) for text in texts]
+        elif self.current_model == "sentence_transformers":
+            try:
+                model = self.models["sentence_transformers"]
+                embeddings = model.encode(texts, convert_to_numpy=True)
+                return list(embeddings.astype(np.float32))
+            except Exception as e:
+                print(f"🚨 Sentence Transformers 배치 임베딩 실패: {e}, Mock으로 대체")
+                return [self._mock_embed(text) for text in texts]
+        else:
+            return [self._mock_embed(text) for text in texts]
+
     def _openai_embed(self, text: str) -> np.ndarray:
         """OpenAI API를 통한 임베딩"""
         try:
@@ -294,26 +495,22 @@ class EchoEmbeddingEngine:
         return hashlib.md5(content.encode()).hexdigest()
 
     def _load_from_cache(self, cache_key: str) -> Optional[np.ndarray]:
-        """캐시에서 임베딩 로드"""
+        """캐시에서 임베딩 로드 (LRU → SQLite)"""
         if not self.config.get("caching", {}).get("enabled", True):
             return None
 
-        cache_file = self.cache_dir / f"{cache_key}.npy"
-        if cache_file.exists():
-            try:
-                return np.load(cache_file)
-            except Exception:
-                return None
-        return None
+        try:
+            return self.cache_store.get(cache_key)
+        except Exception:
+            return None
 
     def _save_to_cache(self, cache_key: str, embedding: np.ndarray):
         """임베딩을 캐시에 저장"""
         if not self.config.get("caching", {}).get("enabled", True):
             return
 
-        cache_file = self.cache_dir / f"{cache_key}.npy"
         try:
-            np.save(cache_file, embedding)
+            self.cache_store.put(cache_key, embedding)
         except Exception as e:
             self.logger.warning(f"캐시 저장 실패: {e}")
 
@@ -393,11 +590,9 @@ class EchoEmbeddingEngine:
 
     def clear_cache(self):
         """임베딩 캐시 클리어"""
-        import shutil
-
-        if self.cache_dir.exists():
-            shutil.rmtree(self.cache_dir)
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_store.clear()
+        for npy_file in self.cache_dir.glob("*.npy"):
+            npy_file.unlink()
         print("🧹 임베딩 캐시 클리어 완료")
 
 
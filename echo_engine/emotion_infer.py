@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import json
 
+from .keyword_automaton import get_keyword_automaton
+
 # Foundation Doctrine 연동
 try:
     from .echo_foundation_doctrine import SYSTEM_PHILOSOPHY, RHYTHM_PATTERNS
@@ -284,6 +286,16 @@ class EmotionInferenceEngine:
             },
         }
 
+        # 키워드 + 강도 수식어 전체를 한 번에 찾는 공유 오토마톤
+        self.keyword_automaton = get_keyword_automaton(
+            {
+                emotion: keywords["korean"]
+                + keywords["english"]
+                + keywords["intensity_modifiers"]
+                for emotion, keywords in self.emotion_keywords.items()
+            }
+        )
+
         # 감정 전환 규칙
         self.emotion_transitions = {
             "joy": {
@@ -462,27 +474,30 @@ class EmotionInferenceEngine:
         return emotion_scores
 
     def _analyze_keywords(self, text: str) -> Dict[str, float]:
-        """키워드 기반 감정 분석"""
+        """키워드 기반 감정 분석 (오토마톤 한 번 스캔으로 모든 키워드 위치 확인)"""
         scores = {emotion: 0.0 for emotion in self.emotion_keywords.keys()}
+        positions = self.keyword_automaton.first_positions(text)
 
         for emotion, keywords in self.emotion_keywords.items():
             score = 0.0
 
             # 정확한 키워드 매칭
             for keyword in keywords["korean"] + keywords["english"]:
-                if keyword in text:
-                    score += 1.0
-
-                    # 강도 수식어 근접성 체크
-                    for modifier in keywords["intensity_modifiers"]:
-                        if modifier in text:
-                            keyword_pos = text.find(keyword)
-                            modifier_pos = text.find(modifier)
-                            distance = abs(keyword_pos - modifier_pos)
-                            if distance < 15:  # 가까운 거리에 있으면
-                                score += 0.8 * (
-                                    1 - distance / 15
-                                )  # 거리에 반비례하여 가중치 적용
+                keyword_pos = positions.get(keyword)
+                if keyword_pos is None:
+                    continue
+                score += 1.0
+
+                # 강도 수식어 근접성 체크
+                for modifier in keywords["intensity_modifiers"]:
+                    modifier_pos = positions.get(modifier)
+                    if modifier_pos is None:
+                        continue
+                    distance = abs(keyword_pos - modifier_pos)
+                    if distance < 15:  # 가까운 거리에 있으면
+                        score += 0.8 * (
+                            1 - distance / 15
+                        )  # 거리에 반비례하여 가중치 적용
 
             scores[emotion] = score
 
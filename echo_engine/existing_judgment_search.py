@@ -10,6 +10,7 @@
 2. 키워드 매칭 보조 탐색
 3. 시그니처별 필터링
 4. 신뢰도 기반 결과 반환
+5. 사전 계산 임베딩 행렬 기반 top-k 탐색 (증분 갱신 및 디스크 저장)
 """
 
 import os
@@ -84,6 +85,17 @@ class ExistingJudgmentSearcher:
         self.cached_judgments: List[CachedJudgment] = []
         self._load_cached_judgments()
 
+        # 임베딩 행렬 (cached_judgments와 행 순서 일치, L2 정규화)
+        self.embedding_file = os.path.join(cache_dir, "judgment_embeddings.npy")
+        self.embedding_keys_file = os.path.join(
+            cache_dir, "judgment_embeddings_keys.json"
+        )
+        self.embedding_flush_interval = 32
+        self._embedding_buffer = None
+        self._embedding_count = 0
+        self._unsaved_embeddings = 0
+        self._build_embedding_matrix()
+
         # 통계
         self.stats = {
             "total_searches": 0,
@@ -134,6 +146,107 @@ class ExistingJudgmentSearcher:
         except Exception as e:
             print(f"⚠️ 캐시 로드 실패: {e}")
 
+    def _encode_normalized(self, texts: List[str]) -> "np.ndarray":
+        """텍스트 목록을 한 번의 encode 호출로 임베딩 후 L2 정규화"""
+        vectors = np.asarray(self.embedding_model.encode(texts), dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    @property
+    def _embedding_matrix(self) -> Optional["np.ndarray"]:
+        """유효한 행만 포함한 임베딩 행렬 뷰"""
+        if self._embedding_buffer is None:
+            return None
+        return self._embedding_buffer[: self._embedding_count]
+
+    def _set_embedding_matrix(self, matrix: "np.ndarray"):
+        """임베딩 행렬 교체 (여유 용량 확보)"""
+        capacity = max(16, matrix.shape[0] * 2)
+        buffer = np.zeros((capacity, matrix.shape[1]), dtype=np.float32)
+        buffer[: matrix.shape[0]] = matrix
+        self._embedding_buffer = buffer
+        self._embedding_count = matrix.shape[0]
+
+    def _append_embedding(self, vector: "np.ndarray"):
+        """임베딩 행 추가 (용량 2배 확장, 분할 상환 O(1))"""
+        if self._embedding_buffer is None:
+            self._set_embedding_matrix(vector.reshape(1, -1))
+            return
+        if self._embedding_count >= self._embedding_buffer.shape[0]:
+            grown = np.zeros(
+                (self._embedding_buffer.shape[0] * 2, self._embedding_buffer.shape[1]),
+                dtype=np.float32,
+            )
+            grown[: self._embedding_count] = self._embedding_matrix
+            self._embedding_buffer = grown
+        self._embedding_buffer[self._embedding_count] = vector
+        self._embedding_count += 1
+
+    def _load_persisted_embeddings(self) -> Dict[str, "np.ndarray"]:
+        """저장된 임베딩 로드 (normalized_input -> 벡터)"""
+        if not (
+            os.path.exists(self.embedding_file)
+            and os.path.exists(self.embedding_keys_file)
+        ):
+            return {}
+
+        try:
+            with open(self.embedding_keys_file, "r", encoding="utf-8") as f:
+                keys = json.load(f)
+            matrix = np.load(self.embedding_file)
+            if len(keys) != matrix.shape[0]:
+                print("⚠️ 임베딩 캐시 불일치 - 재계산합니다")
+                return {}
+            return {key: matrix[i] for i, key in enumerate(keys)}
+        except Exception as e:
+            print(f"⚠️ 임베딩 캐시 로드 실패: {e}")
+            return {}
+
+    def _build_embedding_matrix(self):
+        """캐시된 판단의 임베딩 행렬 구성 (저장본 재사용, 누락분만 일괄 인코딩)"""
+        if not (EMBEDDING_AVAILABLE and self.embedding_model):
+            return
+        if not self.cached_judgments:
+            return
+
+        try:
+            persisted = self._load_persisted_embeddings()
+            texts = [j.normalized_input for j in self.cached_judgments]
+            missing = [t for t in dict.fromkeys(texts) if t not in persisted]
+
+            if missing:
+                for text, vector in zip(missing, self._encode_normalized(missing)):
+                    persisted[text] = vector
+
+            self._set_embedding_matrix(np.stack([persisted[t] for t in texts]))
+
+            if missing:
+                self.save_embeddings()
+                print(f"✅ 임베딩 {len(missing)}개 신규 계산")
+
+        except Exception as e:
+            print(f"⚠️ 임베딩 행렬 구성 실패: {e}")
+            self._embedding_buffer = None
+            self._embedding_count = 0
+
+    def save_embeddings(self):
+        """임베딩 행렬을 디스크에 저장"""
+        matrix = self._embedding_matrix
+        if matrix is None:
+            return
+
+        try:
+            keys = [j.normalized_input for j in self.cached_judgments]
+            np.save(self.embedding_file, matrix)
+            with open(self.embedding_keys_file, "w", encoding="utf-8") as f:
+                json.dump(keys, f, ensure_ascii=False)
+            self._unsaved_embeddings = 0
+        except Exception as e:
+            print(f"⚠️ 임베딩 저장 실패: {e}")
+
     def search_similar_judgment(
         self, normalized_input: str, signature: str = "Selene", threshold: float = 0.7
     ) -> Optional[Dict[str, Any]]:
@@ -154,17 +267,25 @@ class ExistingJudgmentSearcher:
             return None
 
         # 시그니처별 필터링 (선택적)
-        signature_filtered = [
-            j for j in self.cached_judgments if j.signature == signature
+        signature_indices = [
+            i for i, j in enumerate(self.cached_judgments) if j.signature == signature
         ]
 
-        candidates = signature_filtered if signature_filtered else self.cached_judgments
+        if signature_indices:
+            candidates = [self.cached_judgments[i] for i in signature_indices]
+        else:
+            candidates = self.cached_judgments
+            signature_indices = None
 
         # 1차: 임베딩 기반 유사도 탐색
         global EMBEDDING_AVAILABLE
-        if EMBEDDING_AVAILABLE and self.embedding_model:
+        if (
+            EMBEDDING_AVAILABLE
+            and self.embedding_model
+            and self._embedding_matrix is not None
+        ):
             best_match = self._embedding_similarity_search(
-                normalized_input, candidates, threshold
+                normalized_input, signature_indices, threshold
             )
             if best_match:
                 self.stats["successful_matches"] += 1
@@ -183,37 +304,61 @@ class ExistingJudgmentSearcher:
         return None
 
     def _embedding_similarity_search(
-        self, input_text: str, candidates: List[CachedJudgment], threshold: float
+        self,
+        input_text: str,
+        candidate_indices: Optional[List[int]],
+        threshold: float,
     ) -> Optional[CachedJudgment]:
         """임베딩 기반 유사도 탐색"""
+        matches = self._embedding_top_k(input_text, candidate_indices, k=1)
+        if not matches:
+            return None
+
+        index, score = matches[0]
+        if score < threshold:
+            return None
+
+        best_match = self.cached_judgments[index]
+        best_match.similarity_score = score
+        return best_match
+
+    def _embedding_top_k(
+        self, input_text: str, candidate_indices: Optional[List[int]], k: int = 5
+    ) -> List[Tuple[int, float]]:
+        """
+        사전 계산된 임베딩 행렬에 대한 단일 행렬곱 top-k 탐색
+
+        Args:
+            input_text: 입력 텍스트
+            candidate_indices: 후보 판단 인덱스 (None이면 전체)
+            k: 반환할 결과 수
+
+        Returns:
+            (cached_judgments 인덱스, 코사인 유사도) 목록, 유사도 내림차순
+        """
         try:
-            # 입력 텍스트 임베딩
-            input_embedding = self.embedding_model.encode([input_text])[0]
+            matrix = self._embedding_matrix
+            if matrix is None or matrix.shape[0] == 0:
+                return []
 
-            best_match = None
-            best_score = 0.0
+            query = self._encode_normalized([input_text])[0]
 
-            for judgment in candidates:
-                # 캐시된 텍스트 임베딩
-                cached_embedding = self.embedding_model.encode(
-                    [judgment.normalized_input]
-                )[0]
-
-                # 코사인 유사도 계산
-                similarity = np.dot(input_embedding, cached_embedding) / (
-                    np.linalg.norm(input_embedding) * np.linalg.norm(cached_embedding)
-                )
+            if candidate_indices is None:
+                scores = matrix @ query
+                indices = np.arange(matrix.shape[0])
+            else:
+                indices = np.asarray(candidate_indices)
+                scores = matrix[indices] @ query
 
-                if similarity > best_score and similarity >= threshold:
-                    best_score = similarity
-                    best_match = judgment
-                    best_match.similarity_score = similarity
+            k = min(k, scores.shape[0])
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
 
-            return best_match
+            return [(int(indices[i]), float(scores[i])) for i in top]
 
         except Exception as e:
             print(f"⚠️ 임베딩 유사도 탐색 실패: {e}")
-            return None
+            return []
 
     def _keyword_similarity_search(
         self, input_text: str, candidates: List[CachedJudgment], threshold: float
@@ -309,12 +454,32 @@ class ExistingJudgmentSearcher:
                 usage_count=1,
             )
 
+            self._add_judgment_embedding(cached_judgment)
             self.cached_judgments.append(cached_judgment)
             self.stats["cache_size"] = len(self.cached_judgments)
 
+            if self._unsaved_embeddings >= self.embedding_flush_interval:
+                self.save_embeddings()
+
         except Exception as e:
             print(f"⚠️ 캐시 추가 실패: {e}")
 
+    def _add_judgment_embedding(self, judgment: CachedJudgment):
+        """새 판단의 임베딩 행 추가 (행렬이 캐시와 정렬된 경우에만)"""
+        if not (EMBEDDING_AVAILABLE and self.embedding_model):
+            return
+        if self._embedding_matrix is None and self.cached_judgments:
+            return
+
+        try:
+            vector = self._encode_normalized([judgment.normalized_input])[0]
+            self._append_embedding(vector)
+            self._unsaved_embeddings += 1
+        except Exception as e:
+            print(f"⚠️ 임베딩 추가 실패 - 키워드 탐색으로 전환: {e}")
+            self._embedding_buffer = None
+            self._embedding_count = 0
+
     def update_usage_count(self, judgment_input: str):
         """사용 횟수 업데이트"""
         for judgment in self.cached_judgments:
@@ -360,15 +525,21 @@ class ExistingJudgmentSearcher:
         cutoff_date = datetime.now() - timedelta(days=days)
 
         before_count = len(self.cached_judgments)
-        self.cached_judgments = [
-            j
+        keep = [
+            j.timestamp > cutoff_date or j.usage_count > 5  # 자주 사용된 것은 보존
             for j in self.cached_judgments
-            if j.timestamp > cutoff_date or j.usage_count > 5  # 자주 사용된 것은 보존
+        ]
+        self.cached_judgments = [
+            j for j, kept in zip(self.cached_judgments, keep) if kept
         ]
         after_count = len(self.cached_judgments)
 
         removed_count = before_count - after_count
         if removed_count > 0:
+            matrix = self._embedding_matrix
+            if matrix is not None:
+                self._set_embedding_matrix(matrix[np.asarray(keep, dtype=bool)])
+                self.save_embeddings()
             print(f"✅ {removed_count}개의 오래된 판단을 정리했습니다.")
 
         self.stats["cache_size"] = len(self.cached_judgments)
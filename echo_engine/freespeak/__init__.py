@@ -11,6 +11,7 @@ from .archive import (
     find_sessions,
     get_session_meta,
     list_recent_sessions,
+    load_turn_index,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "find_sessions",
     "get_session_meta",
     "list_recent_sessions",
+    "load_turn_index",
 ]
@@ -7,6 +7,8 @@
 - 실시간 스트리밍 중 무음 백그라운드 저장
 - 메타데이터: 플래그, 페르소나 비율, 모델명 등 완전 기록
 - 리플레이 지원을 위한 타이밍 정보 포함
+- 턴 오프셋 인덱스(session.idx)로 N번째 턴부터 바로 탐색
+- buffered 모드: 스트리밍 조각을 모아 쓰고 턴 경계에서만 fsync
 
 @owner: echo
 @expose
@@ -21,10 +23,14 @@ import time
 import uuid
 import pathlib
 from datetime import datetime
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 DEFAULT_DIR = os.getenv("ECHO_FREESPEAK_DIR", "logs/freespeak_sessions")
 
+# buffered 모드 기본값: 이 크기나 시간을 넘기면 모아 둔 조각을 파일에 쓴다
+DEFAULT_FLUSH_BYTES = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 0.5
+
 
 def _now_ts() -> str:
     """현재 시간을 파일명 친화적 형태로 반환"""
@@ -46,6 +52,10 @@ class FreeSpeakArchiver:
     - session.jsonl: 머신 리더블 (리플레이/분석용)
     - session.log: 원본 화면 텍스트 (인간 리더블)
 
+    ▶ 턴 인덱스:
+    - session.idx: user 이벤트(턴 시작)마다 {"turn", "offset", "t"} 한 줄
+      offset은 session.jsonl 안의 바이트 위치 (리플레이가 바로 seek)
+
     ▶ 세션 ID 형식: "fs_<timestamp>_<8charuuid>"
 
     ▶ 이벤트 타입:
@@ -54,22 +64,45 @@ class FreeSpeakArchiver:
     - delta: 어시스턴트 출력 조각 (스트리밍)
     - done: 세션 완료
     - error: 오류 발생
+
+    ▶ buffered=True:
+    - delta는 메모리에 모았다가 flush_bytes/flush_interval을 넘기면 한 번에 기록
+    - write_done/write_error/close에서 모두 기록하고 fsync (턴 경계 내구성)
+    - 이벤트 형식은 동일 (조각마다 한 줄, 타이밍 보존)
     """
 
-    def __init__(self, base_dir: str = DEFAULT_DIR, session_id: Optional[str] = None):
+    def __init__(
+        self,
+        base_dir: str = DEFAULT_DIR,
+        session_id: Optional[str] = None,
+        buffered: bool = False,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
         self.base = ensure_dir(base_dir)
         self.session_id = session_id or f"fs_{_now_ts()}_{uuid.uuid4().hex[:8]}"
         self.dir = ensure_dir(self.base / self.session_id)
+        self.buffered = buffered
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
 
-        # 이중 파일 오픈 (JSONL + RAW LOG)
-        self.jsonl = open(
-            self.dir / "session.jsonl", "a", encoding="utf-8", errors="replace"
-        )
+        # 이중 파일 오픈 (JSONL + RAW LOG) + 턴 인덱스
+        # JSONL은 바이트 오프셋을 직접 세기 위해 바이너리로 연다
+        self.jsonl = open(self.dir / "session.jsonl", "ab")
         self.raw = open(
             self.dir / "session.log", "a", encoding="utf-8", errors="replace"
         )
+        self.index = open(self.dir / "session.idx", "a", encoding="utf-8")
         self._opened = True
 
+        self._offset = self.jsonl.tell()  # 다음 이벤트가 놓일 바이트 위치
+        self._turn = _count_lines(self.dir / "session.idx")
+        self._jsonl_buf: List[bytes] = []
+        self._raw_buf: List[str] = []
+        self._index_buf: List[str] = []
+        self._buf_bytes = 0
+        self._last_flush = time.monotonic()
+
         # 세션 시작 로그
         self.raw.write(f"🌌 Free-Speak Session: {self.session_id}\n")
         self.raw.write(f"Started at: {datetime.now().isoformat()}\n")
@@ -80,7 +113,9 @@ class FreeSpeakArchiver:
         """리소스 정리"""
         if self._opened:
             try:
+                self._flush_buffers(sync=self.buffered)
                 self.jsonl.close()
+                self.index.close()
             finally:
                 try:
                     self.raw.write("\n" + "=" * 60)
@@ -95,46 +130,101 @@ class FreeSpeakArchiver:
         """JSONL 이벤트 기록 (타임스탬프 자동 추가)"""
         obj["t"] = time.time()
         obj["session_id"] = self.session_id
-        self.jsonl.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        line = (json.dumps(obj, ensure_ascii=False) + "\n").encode(
+            "utf-8", errors="replace"
+        )
+
+        if obj["type"] == "user":
+            # 턴 시작 위치 기록 - 데이터보다 먼저 디스크에 닿지 않도록 버퍼를 거친다
+            self._turn += 1
+            self._index_buf.append(
+                json.dumps({"turn": self._turn, "offset": self._offset, "t": obj["t"]})
+                + "\n"
+            )
+        self._offset += len(line)
+        self._jsonl_buf.append(line)
+        self._buf_bytes += len(line)
+
+    def _write_raw(self, text: str):
+        self._raw_buf.append(text)
+        self._buf_bytes += len(text)
+
+    def _flush_buffers(self, sync: bool = False):
+        """모아 둔 이벤트를 파일에 기록 (sync=True면 fsync까지)"""
+        if self._jsonl_buf:
+            self.jsonl.write(b"".join(self._jsonl_buf))
+            self._jsonl_buf.clear()
+        if self._raw_buf:
+            self.raw.write("".join(self._raw_buf))
+            self._raw_buf.clear()
         self.jsonl.flush()
+        self.raw.flush()
+        if sync:
+            os.fsync(self.jsonl.fileno())
+            os.fsync(self.raw.fileno())
+        if self._index_buf:
+            self.index.write("".join(self._index_buf))
+            self._index_buf.clear()
+            self.index.flush()
+            if sync:
+                os.fsync(self.index.fileno())
+        self._buf_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def _maybe_flush(self, boundary: bool = False):
+        """unbuffered면 매번, buffered면 크기/시간/턴 경계에서 기록"""
+        if not self.buffered:
+            self._flush_buffers()
+        elif boundary:
+            self._flush_buffers(sync=True)
+        elif (
+            self._buf_bytes >= self.flush_bytes
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush_buffers()
+
+    def flush(self):
+        """버퍼 강제 기록 (fsync 포함)"""
+        if self._opened:
+            self._flush_buffers(sync=True)
 
     def write_meta(self, meta: Dict[str, Any]):
         """세션 메타데이터 기록"""
         self._write_jsonl({"type": "meta", "meta": meta})
 
         # Raw log에도 메타 정보 기록
-        self.raw.write(f"📋 Session Meta:\n")
+        self._write_raw(f"📋 Session Meta:\n")
         for key, value in meta.items():
-            self.raw.write(f"  {key}: {json.dumps(value, ensure_ascii=False)}\n")
-        self.raw.write("-" * 40 + "\n")
-        self.raw.flush()
+            self._write_raw(f"  {key}: {json.dumps(value, ensure_ascii=False)}\n")
+        self._write_raw("-" * 40 + "\n")
+        self._maybe_flush()
 
     def write_user(self, text: str):
         """사용자 입력 기록"""
         self._write_jsonl({"type": "user", "text": text})
-        self.raw.write(f"\n💬 User: {text}\n")
-        self.raw.write("🌌 Echo: ")
-        self.raw.flush()
+        self._write_raw(f"\n💬 User: {text}\n")
+        self._write_raw("🌌 Echo: ")
+        self._maybe_flush()
 
     def write_delta(self, delta: str):
         """스트리밍 조각 기록 (어시스턴트 출력)"""
         self._write_jsonl({"type": "delta", "text": delta})
-        self.raw.write(delta)
-        self.raw.flush()
+        self._write_raw(delta)
+        self._maybe_flush()
 
     def write_done(self, usage: Optional[Dict[str, Any]] = None):
         """세션 완료 기록"""
         self._write_jsonl({"type": "done", "usage": usage or {}})
-        self.raw.write("\n✅ [Response Complete]\n")
+        self._write_raw("\n✅ [Response Complete]\n")
         if usage:
-            self.raw.write(f"📊 Usage: {json.dumps(usage, ensure_ascii=False)}\n")
-        self.raw.flush()
+            self._write_raw(f"📊 Usage: {json.dumps(usage, ensure_ascii=False)}\n")
+        self._maybe_flush(boundary=True)
 
     def write_error(self, msg: str):
         """오류 기록"""
         self._write_jsonl({"type": "error", "msg": msg})
-        self.raw.write(f"\n❌ [ERROR] {msg}\n")
-        self.raw.flush()
+        self._write_raw(f"\n❌ [ERROR] {msg}\n")
+        self._maybe_flush(boundary=True)
 
     def write_persona_info(
         self, persona_mix_name: str, blend_ratio: str, traits: Dict[str, float]
@@ -147,10 +237,10 @@ class FreeSpeakArchiver:
         }
         self._write_jsonl({"type": "persona", "data": persona_data})
 
-        self.raw.write(f"\n🎭 Persona Mix: {persona_mix_name} ({blend_ratio})\n")
+        self._write_raw(f"\n🎭 Persona Mix: {persona_mix_name} ({blend_ratio})\n")
         trait_str = " | ".join([f"{k}:{v:.1f}" for k, v in traits.items()])
-        self.raw.write(f"💫 Traits: {trait_str}\n")
-        self.raw.flush()
+        self._write_raw(f"💫 Traits: {trait_str}\n")
+        self._maybe_flush()
 
     # 컨텍스트 매니저 지원
     def __enter__(self):
@@ -161,6 +251,30 @@ class FreeSpeakArchiver:
         return False
 
 
+def _count_lines(path: pathlib.Path) -> int:
+    if not path.exists():
+        return 0
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def load_turn_index(
+    session_id: str, base_dir: str = DEFAULT_DIR
+) -> List[Dict[str, Any]]:
+    """턴 오프셋 인덱스 로드 ([{"turn", "offset", "t"}, ...], 없으면 빈 목록)"""
+    index_path = pathlib.Path(base_dir) / session_id / "session.idx"
+    entries = []
+    if not index_path.exists():
+        return entries
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # 기록 중 끊긴 마지막 줄
+    return entries
+
+
 def find_sessions(base_dir: str = DEFAULT_DIR) -> Iterable[str]:
     """Free-Speak 세션 목록 조회"""
     p = pathlib.Path(base_dir)
@@ -17,8 +17,10 @@
 """
 
 import json
+import math
 import time
 import asyncio
+from collections import deque
 from typing import Dict, Any, List, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -103,6 +105,12 @@ class LLMJudgmentRequest:
     require_reasoning: bool = True
     timeout: float = 30.0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # 점진 융합 (None이면 config 기본값)
+    incremental: Optional[bool] = None
+    quorum: Optional[int] = None  # 이 수만큼 유효 응답이 모이면 종료
+    confidence_threshold: Optional[float] = None  # CONFIDENCE_BASED 조기 종료 기준
+    hedge: Optional[bool] = None
+    backup_providers: List[LLMProvider] = field(default_factory=list)
 
 
 @dataclass
@@ -152,6 +160,23 @@ class FusionJudgmentLoop:
             self.config.get("fusion_strategy", "weighted_average")
         )
 
+        # 점진 융합 / 헤징 설정
+        incremental_config = self.config.get("incremental_fusion", {})
+        self.incremental_enabled = incremental_config.get("enabled", True)
+        self.default_confidence_threshold = incremental_config.get(
+            "confidence_threshold", 0.9
+        )
+        self.hedge_enabled = incremental_config.get("hedge", False)
+        self.hedge_min_samples = incremental_config.get("hedge_min_samples", 5)
+        self.hedge_default_delay = incremental_config.get("hedge_default_delay", 2.0)
+        self.default_backup_providers = [
+            LLMProvider(p) if isinstance(p, str) else p
+            for p in incremental_config.get("backup_providers", [])
+        ]
+
+        # 제공자별 최근 응답 시간 (헤징 지연 p95 계산용)
+        self.provider_latencies: Dict[LLMProvider, deque] = {}
+
         # 통계
         self.stats = {
             "total_requests": 0,
@@ -238,23 +263,37 @@ class FusionJudgmentLoop:
             print(f"   시그니처: {request.signature.value}")
             print(f"   제공자: {[p.value for p in available_providers]}")
 
-            # 병렬 판단 실행
-            judgment_tasks = []
-            for provider in available_providers:
-                task = self._execute_provider_judgment(provider, request)
-                judgment_tasks.append(task)
+            fusion_strategy = request.fusion_strategy or self.default_fusion_strategy
+            incremental = (
+                request.incremental
+                if request.incremental is not None
+                else self.incremental_enabled
+            )
 
-            # 모든 판단 완료 대기 (타임아웃 적용)
-            try:
-                individual_responses = await asyncio.wait_for(
-                    asyncio.gather(*judgment_tasks, return_exceptions=True),
-                    timeout=request.timeout,
+            fusion_info = None
+            if incremental:
+                # 완료되는 순서대로 소비, 융합 조건 충족 시 나머지 취소
+                individual_responses, fusion_info = await self._collect_incremental(
+                    available_providers, request, fusion_strategy
                 )
-            except asyncio.TimeoutError:
-                print(f"⚠️ 판단 타임아웃 ({request.timeout}초)")
-                individual_responses = [
-                    self._create_timeout_response(p) for p in available_providers
-                ]
+            else:
+                # 병렬 판단 실행
+                judgment_tasks = []
+                for provider in available_providers:
+                    task = self._execute_provider_judgment(provider, request)
+                    judgment_tasks.append(task)
+
+                # 모든 판단 완료 대기 (타임아웃 적용)
+                try:
+                    individual_responses = await asyncio.wait_for(
+                        asyncio.gather(*judgment_tasks, return_exceptions=True),
+                        timeout=request.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    print(f"⚠️ 판단 타임아웃 ({request.timeout}초)")
+                    individual_responses = [
+                        self._create_timeout_response(p) for p in available_providers
+                    ]
 
             # 성공한 응답만 필터링
             valid_responses = [
@@ -267,10 +306,11 @@ class FusionJudgmentLoop:
                 raise RuntimeError("모든 LLM 제공자에서 판단 실패")
 
             # 융합 전략 적용
-            fusion_strategy = request.fusion_strategy or self.default_fusion_strategy
             fused_result = self._apply_fusion_strategy(
                 valid_responses, fusion_strategy, request
             )
+            if fusion_info is not None:
+                fused_result.processing_summary["incremental"] = fusion_info
 
             # 통계 업데이트
             self.stats["successful_fusions"] += 1
@@ -289,6 +329,168 @@ class FusionJudgmentLoop:
                 request, str(e), time.time() - start_time
             )
 
+    async def _collect_incremental(
+        self,
+        providers: List[LLMProvider],
+        request: LLMJudgmentRequest,
+        strategy: FusionStrategy,
+    ) -> Tuple[List[LLMJudgmentResponse], Dict[str, Any]]:
+        """
+        제공자 응답을 완료 순서대로 수집
+
+        융합 전략의 종료 조건(_fusion_satisfied)이 충족되거나 타임아웃이 되면
+        남은 요청을 취소한다. 헤징이 켜져 있으면 응답이 p95 지연을 넘긴
+        제공자 대신 백업 제공자에게 같은 요청을 한 번 더 보낸다.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + request.timeout
+
+        tasks: Dict[asyncio.Task, LLMProvider] = {
+            asyncio.ensure_future(self._execute_provider_judgment(p, request)): p
+            for p in providers
+        }
+
+        hedge = request.hedge if request.hedge is not None else self.hedge_enabled
+        backups = [
+            p
+            for p in (request.backup_providers or self.default_backup_providers)
+            if p in self.providers and p not in providers
+        ]
+        hedge_at: Dict[LLMProvider, float] = {}
+        if hedge and backups:
+            for provider in providers:
+                hedge_at[provider] = start + self._hedge_delay(provider)
+
+        responses: List[LLMJudgmentResponse] = []
+        valid: List[LLMJudgmentResponse] = []
+        answered: set = set()
+        hedged: List[str] = []
+        stop_reason = "all_completed"
+
+        while tasks:
+            now = loop.time()
+            if now >= deadline:
+                stop_reason = "timeout"
+                break
+
+            # 헤징 시각이 된 느린 제공자는 백업으로 복제 요청
+            for provider, at in list(hedge_at.items()):
+                if now >= at:
+                    del hedge_at[provider]
+                    if provider not in answered and backups:
+                        backup = backups.pop(0)
+                        task = asyncio.ensure_future(
+                            self._execute_provider_judgment(backup, request)
+                        )
+                        tasks[task] = backup
+                        hedged.append(f"{provider.value}->{backup.value}")
+                        print(f"🪂 헤징: {provider.value} 지연 → {backup.value} 요청")
+
+            wake_at = min([deadline] + list(hedge_at.values()))
+            done, _ = await asyncio.wait(
+                list(tasks),
+                timeout=max(0.0, wake_at - loop.time()),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            for task in done:
+                provider = tasks.pop(task)
+                response = task.result()
+                answered.add(provider)
+                responses.append(response)
+                if response.error is None:
+                    valid.append(response)
+                    self._record_latency(provider, response.processing_time)
+
+            if valid and tasks:
+                pending_providers = list(tasks.values())
+                if self._fusion_satisfied(
+                    valid, responses, pending_providers, strategy, request, len(providers)
+                ):
+                    stop_reason = "fusion_satisfied"
+                    break
+
+        # 남은 요청 취소 (지연 제공자)
+        cancelled = []
+        for task, provider in tasks.items():
+            task.cancel()
+            cancelled.append(provider.value)
+            if stop_reason == "timeout":
+                responses.append(self._create_timeout_response(provider))
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if stop_reason == "timeout":
+            print(f"⚠️ 판단 타임아웃 ({request.timeout}초) - 완료된 {len(valid)}개 응답으로 융합")
+
+        return responses, {
+            "early_stop": stop_reason,
+            "elapsed": loop.time() - start,
+            "cancelled": cancelled,
+            "hedged": hedged,
+        }
+
+    def _fusion_satisfied(
+        self,
+        valid: List[LLMJudgmentResponse],
+        responses: List[LLMJudgmentResponse],
+        pending: List[LLMProvider],
+        strategy: FusionStrategy,
+        request: LLMJudgmentRequest,
+        total_providers: int,
+    ) -> bool:
+        """현재까지의 응답만으로 융합 결과를 확정할 수 있는지"""
+
+        if request.quorum is not None and len(valid) >= request.quorum:
+            return True
+
+        if strategy == FusionStrategy.CONFIDENCE_BASED:
+            threshold = (
+                request.confidence_threshold
+                if request.confidence_threshold is not None
+                else self.default_confidence_threshold
+            )
+            return max(r.confidence for r in valid) >= threshold
+
+        if strategy == FusionStrategy.MAJORITY_VOTE:
+            # 남은 응답이 모두 2위에 몰려도 다수 의견이 바뀌지 않으면 확정
+            remaining = len(pending)
+            return self._vote_decided(
+                [r.emotion_detected for r in valid], remaining
+            ) and self._vote_decided([r.strategy_suggested for r in valid], remaining)
+
+        if strategy == FusionStrategy.SIGNATURE_OPTIMIZED:
+            # 선호 제공자 응답이 있으면 나머지는 결과에 반영되지 않는다
+            preferred = self._signature_preferences().get(request.signature, [])
+            preferred_pending = any(p in preferred for p in pending)
+            has_preferred = any(r.provider in preferred for r in valid)
+            return has_preferred and not preferred_pending
+
+        # WEIGHTED_AVERAGE: quorum 미지정 시 전체 제공자 수만큼 대기
+        return len(valid) >= total_providers
+
+    @staticmethod
+    def _vote_decided(votes: List[str], remaining: int) -> bool:
+        counts: Dict[str, int] = {}
+        for vote in votes:
+            counts[vote] = counts.get(vote, 0) + 1
+        ranked = sorted(counts.values(), reverse=True)
+        runner_up = ranked[1] if len(ranked) > 1 else 0
+        return ranked[0] > runner_up + remaining
+
+    def _record_latency(self, provider: LLMProvider, latency: float):
+        history = self.provider_latencies.setdefault(provider, deque(maxlen=100))
+        history.append(latency)
+
+    def _hedge_delay(self, provider: LLMProvider) -> float:
+        """제공자 p95 응답 시간 (표본이 부족하면 기본 지연)"""
+        history = self.provider_latencies.get(provider)
+        if not history or len(history) < self.hedge_min_samples:
+            return self.hedge_default_delay
+        ordered = sorted(history)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
     async def _execute_provider_judgment(
         self, provider: LLMProvider, request: LLMJudgmentRequest
     ) -> LLMJudgmentResponse:
@@ -583,20 +785,22 @@ class FusionJudgmentLoop:
             },
         )
 
-    def _signature_optimized_fusion(
-        self, responses: List[LLMJudgmentResponse], request: LLMJudgmentRequest
-    ) -> FusedJudgmentResult:
-        """시그니처 최적화 융합"""
-
-        # 시그니처별 최적 제공자 매핑
-        signature_preferences = {
+    @staticmethod
+    def _signature_preferences() -> Dict[Any, List[LLMProvider]]:
+        """시그니처별 최적 제공자 매핑"""
+        return {
             EchoSignature.AURORA: [LLMProvider.MISTRAL, LLMProvider.CLAUDE],
             EchoSignature.PHOENIX: [LLMProvider.GPT, LLMProvider.MISTRAL],
             EchoSignature.SAGE: [LLMProvider.CLAUDE, LLMProvider.ECHO_INTERNAL],
             EchoSignature.COMPANION: [LLMProvider.MISTRAL, LLMProvider.ECHO_INTERNAL],
         }
 
-        preferred_providers = signature_preferences.get(request.signature, [])
+    def _signature_optimized_fusion(
+        self, responses: List[LLMJudgmentResponse], request: LLMJudgmentRequest
+    ) -> FusedJudgmentResult:
+        """시그니처 최적화 융합"""
+
+        preferred_providers = self._signature_preferences().get(request.signature, [])
 
         # 선호 제공자 우선 선택
         preferred_responses = [
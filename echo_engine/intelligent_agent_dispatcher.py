@@ -12,10 +12,12 @@ Echo 시스템의 모든 에이전트를 지능적으로 선택, 배치, 실행
 
 import yaml
 import json
+import time
 import asyncio
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import importlib
 import inspect
 from pathlib import Path
@@ -59,8 +61,11 @@ class AgentPipeline:
     pipeline_id: str
     agents: List[str]
     data_flow: Dict[str, str]  # agent_id -> next_agent_id
-    parallel_stages: List[List[str]]
+    parallel_stages: List[List[str]]  # DAG 위상 레벨 (표시용)
     error_handling: str  # stop, continue, retry
+    dependencies: Dict[str, List[str]] = field(
+        default_factory=dict
+    )  # agent_id -> 입력을 제공하는 상위 agent_id 목록
 
 
 class IntelligentAgentDispatcher:
@@ -83,6 +88,17 @@ class IntelligentAgentDispatcher:
         self.agent_affinity_matrix = self._build_affinity_matrix()
         self.load_balancer = {}
 
+        # DAG 스케줄러: 리소스 클래스(도메인)별 동시 실행 상한
+        self.resource_limits = {
+            "desktop": 1,  # 화면/입력 장치 공유
+            "web": 4,
+            "api": 4,
+            "document": 2,
+            "communication": 2,
+            "default": 2,
+        }
+        self.pipeline_traces: deque = deque(maxlen=100)
+
         # 자연어 이해 패턴
         self.intent_patterns = self._load_intent_patterns()
 
@@ -249,27 +265,11 @@ class IntelligentAgentDispatcher:
         for i, agent_id in enumerate(agents[:-1]):
             data_flow[agent_id] = agents[i + 1]
 
-        # 병렬 실행 가능한 단계 식별
-        parallel_stages = []
-
-        # 단순한 병렬화: 독립적인 에이전트들을 병렬로 실행
-        independent_agents = []
-        dependent_agents = []
+        # 실제 의존성 DAG: 데이터 흐름 후보 중 협업 도메인 관계가 있는 간선만 유지
+        dependencies = self._build_dependency_graph(agents, data_flow)
 
-        for agent_id in agents:
-            if agent_id in self.agent_affinity_matrix:
-                dependent_agents.append(agent_id)
-            else:
-                independent_agents.append(agent_id)
-
-        if independent_agents:
-            parallel_stages.append(independent_agents)
-        if dependent_agents:
-            parallel_stages.append(dependent_agents)
-
-        # 파이프라인이 너무 단순하면 순차 실행
-        if len(parallel_stages) <= 1:
-            parallel_stages = [[agent] for agent in agents]
+        # 병렬 실행 가능한 단계 식별 (위상 레벨)
+        parallel_stages = self._topological_levels(agents, dependencies)
 
         return AgentPipeline(
             pipeline_id=pipeline_id,
@@ -277,51 +277,196 @@ class IntelligentAgentDispatcher:
             data_flow=data_flow,
             parallel_stages=parallel_stages,
             error_handling="retry",  # 기본값
+            dependencies=dependencies,
         )
 
+    def _build_dependency_graph(
+        self, agents: List[str], data_flow: Dict[str, str]
+    ) -> Dict[str, List[str]]:
+        """
+        에이전트 의존성 그래프 구축
+
+        data_flow 간선과 순서상 앞선 에이전트 쌍을 후보로 보고, 하위 에이전트가
+        상위 에이전트의 협업 대상(agent_affinity_matrix)일 때만 의존성으로 둔다.
+        간선은 항상 agents 순서 방향이므로 사이클이 생기지 않는다.
+        """
+        order = {agent_id: i for i, agent_id in enumerate(agents)}
+        dependencies = {agent_id: [] for agent_id in agents}
+
+        candidates = set(data_flow.items())
+        for i, upstream in enumerate(agents):
+            for downstream in agents[i + 1 :]:
+                candidates.add((upstream, downstream))
+
+        for upstream, downstream in candidates:
+            if upstream not in order or downstream not in order:
+                continue
+            if order[upstream] >= order[downstream]:
+                continue
+            if downstream in self.agent_affinity_matrix.get(upstream, []):
+                dependencies[downstream].append(upstream)
+
+        for agent_id in dependencies:
+            dependencies[agent_id].sort(key=order.get)
+        return dependencies
+
+    @staticmethod
+    def _topological_levels(
+        agents: List[str], dependencies: Dict[str, List[str]]
+    ) -> List[List[str]]:
+        """의존성 깊이별 에이전트 묶음"""
+        level: Dict[str, int] = {}
+        for agent_id in agents:  # agents 순서가 위상 순서
+            level[agent_id] = 1 + max(
+                (level[dep] for dep in dependencies.get(agent_id, [])), default=-1
+            )
+
+        stages: List[List[str]] = []
+        for agent_id in agents:
+            while len(stages) <= level[agent_id]:
+                stages.append([])
+            stages[level[agent_id]].append(agent_id)
+        return stages
+
+    def _expected_latency(self, agent_id: str) -> float:
+        """성능 이력 기반 예상 실행 시간"""
+        return float(
+            self.agent_performance.get(agent_id, {}).get("avg_execution_time", 5.0)
+        )
+
+    def _critical_path_ranks(
+        self, agents: List[str], dependencies: Dict[str, List[str]]
+    ) -> Dict[str, float]:
+        """
+        각 에이전트에서 파이프라인 끝까지의 예상 최장 경로 (upward rank)
+
+        rank가 큰 에이전트일수록 크리티컬 패스에 있으므로 먼저 실행한다.
+        """
+        dependents: Dict[str, List[str]] = {agent_id: [] for agent_id in agents}
+        for agent_id, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(agent_id)
+
+        ranks: Dict[str, float] = {}
+        for agent_id in reversed(agents):
+            ranks[agent_id] = self._expected_latency(agent_id) + max(
+                (ranks[child] for child in dependents[agent_id]), default=0.0
+            )
+        return ranks
+
+    def _resource_class(self, agent_id: str) -> str:
+        """에이전트의 리소스 클래스 (도메인)"""
+        domain = self.available_agents.get(agent_id, {}).get("domain", "default")
+        return domain if domain in self.resource_limits else "default"
+
     async def execute_pipeline(
         self, pipeline: AgentPipeline, task: AgentTask
     ) -> Dict[str, Any]:
-        """파이프라인 실행"""
+        """
+        파이프라인 실행 (DAG 스케줄러)
+
+        입력(상위 에이전트)이 모두 끝난 에이전트를 즉시 시작한다. 동시에 준비된
+        에이전트는 크리티컬 패스 rank 순으로, 리소스 클래스별 상한 안에서 실행한다.
+        """
 
         print(f"🚀 파이프라인 '{pipeline.pipeline_id}' 실행 시작")
 
+        agents = pipeline.agents
+        dependencies = pipeline.dependencies or {
+            agent_id: [] for agent_id in agents
+        }
+        ranks = self._critical_path_ranks(agents, dependencies)
+
+        dependents: Dict[str, List[str]] = {agent_id: [] for agent_id in agents}
+        for agent_id, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(agent_id)
+        remaining_inputs = {
+            agent_id: len(dependencies.get(agent_id, [])) for agent_id in agents
+        }
+
         results = {}
         errors = []
+        trace: Dict[str, Dict[str, Any]] = {}
+        pipeline_start = time.perf_counter()
 
-        try:
-            # 각 병렬 단계 실행
-            for stage_index, stage_agents in enumerate(pipeline.parallel_stages):
-                print(
-                    f"📍 단계 {stage_index + 1}: {len(stage_agents)}개 에이전트 병렬 실행"
-                )
+        def now() -> float:
+            return time.perf_counter() - pipeline_start
 
-                # 병렬 실행
-                stage_tasks = []
-                for agent_id in stage_agents:
-                    task_coroutine = self._execute_single_agent(agent_id, task, results)
-                    stage_tasks.append(task_coroutine)
+        ready = [agent_id for agent_id in agents if remaining_inputs[agent_id] == 0]
+        for agent_id in ready:
+            trace[agent_id] = {"ready_at": 0.0}
+        running: Dict[asyncio.Task, str] = {}
+        in_use: Dict[str, int] = {}
 
-                # 모든 에이전트 완료 대기
-                stage_results = await asyncio.gather(
-                    *stage_tasks, return_exceptions=True
+        try:
+            while ready or running:
+                # 준비된 에이전트를 rank 순으로, 리소스 여유가 있는 만큼 시작
+                ready.sort(key=lambda agent_id: ranks[agent_id], reverse=True)
+                for agent_id in list(ready):
+                    resource = self._resource_class(agent_id)
+                    if in_use.get(resource, 0) >= self.resource_limits[resource]:
+                        continue
+                    ready.remove(agent_id)
+                    in_use[resource] = in_use.get(resource, 0) + 1
+
+                    inputs = {
+                        dep: results[dep]
+                        for dep in self._ancestors(agent_id, dependencies)
+                        if dep in results
+                    }
+                    running[
+                        asyncio.ensure_future(
+                            self._execute_single_agent(agent_id, task, inputs)
+                        )
+                    ] = agent_id
+                    trace[agent_id].update(
+                        {
+                            "start": now(),
+                            "resource_class": resource,
+                            "critical_rank": ranks[agent_id],
+                        }
+                    )
+
+                done, _ = await asyncio.wait(
+                    list(running), return_when=asyncio.FIRST_COMPLETED
                 )
 
-                # 결과 처리
-                for i, result in enumerate(stage_results):
-                    agent_id = stage_agents[i]
+                for finished in done:
+                    agent_id = running.pop(finished)
+                    resource = trace[agent_id]["resource_class"]
+                    in_use[resource] -= 1
+
+                    entry = trace[agent_id]
+                    entry["end"] = now()
+                    entry["duration"] = entry["end"] - entry["start"]
+                    entry["wait"] = entry["start"] - entry["ready_at"]
 
-                    if isinstance(result, Exception):
-                        error_msg = f"에이전트 {agent_id} 실행 실패: {result}"
+                    error = finished.exception()
+                    if error is not None:
+                        entry["status"] = "failed"
+                        error_msg = f"에이전트 {agent_id} 실행 실패: {error}"
                         errors.append(error_msg)
                         print(f"❌ {error_msg}")
 
                         if pipeline.error_handling == "stop":
-                            raise result
+                            raise error
                     else:
-                        results[agent_id] = result
+                        entry["status"] = "completed"
+                        results[agent_id] = finished.result()
                         print(f"✅ {agent_id} 완료")
 
+                    # 입력이 모두 준비된 하위 에이전트 해제
+                    for child in dependents[agent_id]:
+                        remaining_inputs[child] -= 1
+                        if remaining_inputs[child] == 0:
+                            ready.append(child)
+                            trace[child] = {"ready_at": now()}
+
+            timing_trace = self._summarize_trace(
+                pipeline, trace, ranks, dependencies, now()
+            )
+
             # 최종 결과 집계
             final_result = {
                 "pipeline_id": pipeline.pipeline_id,
@@ -337,15 +482,22 @@ class IntelligentAgentDispatcher:
                         len(results) / len(pipeline.agents) if pipeline.agents else 0
                     ),
                 },
+                "timing_trace": timing_trace,
             }
 
             print(
                 f"🎉 파이프라인 완료: {final_result['execution_summary']['success_rate']:.1%} 성공률"
+                f" ({timing_trace['makespan']:.2f}초)"
             )
 
             return final_result
 
         except Exception as e:
+            for pending in running:
+                pending.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
             print(f"💥 파이프라인 실행 실패: {e}")
             return {
                 "pipeline_id": pipeline.pipeline_id,
@@ -353,8 +505,54 @@ class IntelligentAgentDispatcher:
                 "status": "failed",
                 "error": str(e),
                 "partial_results": results,
+                "timing_trace": self._summarize_trace(
+                    pipeline, trace, ranks, dependencies, now()
+                ),
             }
 
+    @staticmethod
+    def _ancestors(agent_id: str, dependencies: Dict[str, List[str]]) -> List[str]:
+        """전이적 상위 에이전트 (입력 데이터 범위)"""
+        seen: List[str] = []
+        stack = list(dependencies.get(agent_id, []))
+        while stack:
+            dep = stack.pop()
+            if dep not in seen:
+                seen.append(dep)
+                stack.extend(dependencies.get(dep, []))
+        return seen
+
+    def _summarize_trace(
+        self,
+        pipeline: AgentPipeline,
+        trace: Dict[str, Dict[str, Any]],
+        ranks: Dict[str, float],
+        dependencies: Dict[str, List[str]],
+        makespan: float,
+    ) -> Dict[str, Any]:
+        """파이프라인 타이밍 트레이스 (예상 크리티컬 패스 포함)"""
+
+        # 예상 크리티컬 패스: rank가 가장 큰 루트에서 rank를 따라 내려감
+        critical_path = []
+        roots = [a for a in pipeline.agents if not dependencies.get(a)]
+        current = max(roots, key=ranks.get) if roots else None
+        while current is not None:
+            critical_path.append(current)
+            children = [a for a in pipeline.agents if current in dependencies.get(a, [])]
+            current = max(children, key=ranks.get) if children else None
+
+        summary = {
+            "pipeline_id": pipeline.pipeline_id,
+            "makespan": makespan,
+            "expected_critical_path": critical_path,
+            "expected_critical_path_time": ranks.get(critical_path[0], 0.0)
+            if critical_path
+            else 0.0,
+            "agents": trace,
+        }
+        self.pipeline_traces.append(summary)
+        return summary
+
     async def _execute_single_agent(
         self, agent_id: str, task: AgentTask, previous_results: Dict[str, Any]
     ) -> Dict[str, Any]:
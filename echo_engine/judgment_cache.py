@@ -10,13 +10,16 @@ JSONL 파일 기반으로 판단 결과를 저장/로드하며, 향후 벡터DB
 2. 캐시 크기 관리 및 정리
 3. 백업 및 복원
 4. 통계 및 분석
+5. 역색인 + MinHash/LSH 기반 유사 판단 검색
 """
 
 import os
 import json
+import math
 import time
 import shutil
-from typing import Dict, List, Optional, Any
+import zlib
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from collections import Counter
@@ -48,6 +51,162 @@ class CacheEntry:
             self.metadata = {}
 
 
+class TokenSimilarityIndex:
+    """
+    🔎 토큰 역색인 + MinHash/LSH 유사도 색인
+
+    자카드 유사도 >= t 이면 |A∩B| >= ceil(t·|A|) 이므로, 쿼리 토큰 중
+    가장 희귀한 |A| - ceil(t·|A|) + 1개 토큰의 포스팅만 확인해도 결과가 정확하다.
+    그 포스팅이 후보 예산을 넘으면 MinHash LSH 버킷으로 후보를 좁힌다(근사).
+    """
+
+    _PRIME = (1 << 61) - 1
+
+    def __init__(
+        self, num_perm: int = 64, bands: int = 16, max_exact_candidates: int = 2000
+    ):
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_exact_candidates = max_exact_candidates
+
+        # 고정 시드 해시 계수 (재시작 후에도 동일한 시그니처)
+        self._coefficients = [
+            (
+                zlib.crc32(f"a{i}".encode()) * 2654435761 % self._PRIME or 1,
+                zlib.crc32(f"b{i}".encode()) * 40503 % self._PRIME,
+            )
+            for i in range(num_perm)
+        ]
+
+        self._tokens: Dict[str, frozenset] = {}
+        self._order: Dict[str, int] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._band_keys: Dict[str, List[Tuple[int, Tuple[int, ...]]]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    @staticmethod
+    def tokenize(text: str) -> frozenset:
+        """공백 기준 토큰 집합"""
+        return frozenset(text.split())
+
+    def _minhash(self, tokens: frozenset) -> List[int]:
+        """토큰 집합의 MinHash 시그니처"""
+        hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+        return [
+            min((a * h + b) % self._PRIME for h in hashes)
+            for a, b in self._coefficients
+        ]
+
+    def _bands_of(self, tokens: frozenset) -> List[Tuple[int, Tuple[int, ...]]]:
+        """LSH 밴드 키 목록"""
+        if not tokens:
+            return []
+        signature = self._minhash(tokens)
+        return [
+            (band, tuple(signature[band * self.rows : (band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: str):
+        """엔트리 색인 (이미 있으면 무시)"""
+        if key in self._tokens:
+            return
+
+        tokens = self.tokenize(key)
+        self._tokens[key] = tokens
+        self._order[key] = self._sequence
+        self._sequence += 1
+
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(key)
+
+        band_keys = self._bands_of(tokens)
+        self._band_keys[key] = band_keys
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str):
+        """엔트리 색인 제거"""
+        tokens = self._tokens.pop(key, None)
+        if tokens is None:
+            return
+        self._order.pop(key, None)
+
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[token]
+
+        for band_key in self._band_keys.pop(key, []):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def clear(self):
+        """전체 색인 초기화"""
+        self._tokens.clear()
+        self._order.clear()
+        self._postings.clear()
+        self._band_keys.clear()
+        self._buckets.clear()
+
+    def _candidates(self, tokens: frozenset, threshold: float) -> Set[str]:
+        """후보 키 집합 (희귀 토큰 prefix 포스팅, 예산 초과 시 LSH 버킷)"""
+        if threshold <= 0 or not tokens:
+            return set(self._tokens)
+
+        required_overlap = max(1, math.ceil(threshold * len(tokens) - 1e-9))
+        prefix_size = len(tokens) - required_overlap + 1
+
+        postings = sorted(
+            (self._postings.get(token, set()) for token in tokens), key=len
+        )[:prefix_size]
+
+        if sum(len(p) for p in postings) <= self.max_exact_candidates:
+            return set().union(*postings)
+
+        candidates: Set[str] = set()
+        for band_key in self._bands_of(tokens):
+            candidates.update(self._buckets.get(band_key, ()))
+        return candidates
+
+    def search(self, text: str, threshold: float) -> List[Tuple[str, float]]:
+        """
+        자카드 유사도 >= threshold 인 엔트리 검색
+
+        Returns:
+            (키, 유사도) 목록, 유사도 내림차순 (동률은 색인 순서)
+        """
+        tokens = self.tokenize(text)
+        min_size = threshold * len(tokens)
+        max_size = len(tokens) / threshold if threshold > 0 else math.inf
+
+        results = []
+        for key in self._candidates(tokens, threshold):
+            cached_tokens = self._tokens[key]
+            if not (min_size <= len(cached_tokens) <= max_size):
+                continue
+
+            intersection = len(tokens & cached_tokens)
+            union = len(tokens) + len(cached_tokens) - intersection
+            similarity = intersection / union if union > 0 else 0.0
+
+            if similarity >= threshold:
+                results.append((key, similarity))
+
+        results.sort(key=lambda x: (-x[1], self._order[x[0]]))
+        return results
+
+
 class JudgmentCache:
     """💾 판단 캐시 핸들러"""
 
@@ -88,6 +247,7 @@ class JudgmentCache:
 
         # 메모리 캐시 (빠른 접근용)
         self._memory_cache: Dict[str, CacheEntry] = {}
+        self._similarity_index = TokenSimilarityIndex()
         self._load_memory_cache()
 
         print(f"💾 JudgmentCache v{self.version} 초기화 완료")
@@ -116,6 +276,7 @@ class JudgmentCache:
                         entry = CacheEntry(**data)
                         # normalized_input을 키로 사용
                         self._memory_cache[entry.normalized_input] = entry
+                        self._similarity_index.add(entry.normalized_input)
 
             print(f"✅ {len(self._memory_cache)}개 캐시 엔트리 로드 완료")
 
@@ -169,6 +330,7 @@ class JudgmentCache:
                     )  # 최신 시간으로 업데이트
                 else:
                     self._memory_cache[cache_entry.normalized_input] = cache_entry
+                    self._similarity_index.add(cache_entry.normalized_input)
 
                 # 파일에 저장
                 self._append_to_file(cache_entry)
@@ -232,7 +394,7 @@ class JudgmentCache:
         self, normalized_input: str, threshold: float = 0.8
     ) -> List[CacheEntry]:
         """
-        유사한 판단 검색 (간단한 키워드 매칭)
+        유사한 판단 검색 (토큰 자카드 유사도, 색인 후보만 확인)
 
         Args:
             normalized_input: 정규화된 입력
@@ -242,24 +404,9 @@ class JudgmentCache:
             유사한 캐시 엔트리들
         """
         try:
-            input_words = set(normalized_input.split())
-            similar_entries = []
-
-            for entry in self._memory_cache.values():
-                cached_words = set(entry.normalized_input.split())
-
-                # 자카드 유사도 계산
-                intersection = len(input_words.intersection(cached_words))
-                union = len(input_words.union(cached_words))
-                similarity = intersection / union if union > 0 else 0.0
-
-                if similarity >= threshold:
-                    similar_entries.append((entry, similarity))
-
-            # 유사도 기준 정렬
-            similar_entries.sort(key=lambda x: x[1], reverse=True)
-
-            return [entry for entry, _ in similar_entries]
+            with self._lock:
+                matches = self._similarity_index.search(normalized_input, threshold)
+                return [self._memory_cache[key] for key, _ in matches]
 
         except Exception as e:
             print(f"⚠️ 유사 검색 실패: {e}")
@@ -330,6 +477,9 @@ class JudgmentCache:
                 new_cache[entry.normalized_input] = entry
 
             removed_count = len(self._memory_cache) - len(new_cache)
+            for key in self._memory_cache:
+                if key not in new_cache:
+                    self._similarity_index.remove(key)
             self._memory_cache = new_cache
 
             # 파일 재작성 (정리된 버전)
@@ -375,6 +525,7 @@ class JudgmentCache:
 
                 # 메모리 캐시 초기화
                 self._memory_cache.clear()
+                self._similarity_index.clear()
 
                 # 파일 초기화
                 if os.path.exists(self.cache_file):
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+🔤 Keyword Automaton - 다중 키워드 단일 패스 매칭
+감정 사전 같은 키워드 집합을 Aho-Corasick 오토마톤으로 한 번만 구성하고,
+텍스트를 한 번 훑어 모든 키워드 위치를 찾는다.
+
+핵심 기능:
+1. find_all: 겹치는 매칭을 포함한 모든 (시작, 끝, 키워드, 라벨) 히트
+2. first_positions / label_counts / first_label: 호출부별 요약
+3. count_matrix / classify_many: 로그 컬럼 전체를 한 번에 처리하는 벌크 모드
+
+pyahocorasick이 설치되어 있으면 C 구현으로 스캔하고, 없으면 순수 파이썬
+DFA로 동작한다 (결과 동일).
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 벌크 모드에서 텍스트 경계에 쓰는 구분 문자 (키워드에 포함될 수 없음)
+_SEPARATOR = "\x00"
+
+
+class KeywordHit(NamedTuple):
+    """키워드 매칭 결과"""
+
+    start: int
+    end: int
+    keyword: str
+    label: str
+    order: int  # 라벨 내 키워드 순서 (사전 정의 순서)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 매칭 오토마톤"""
+
+    def __init__(self, lexicon: Dict[str, Iterable[str]]):
+        """
+        Args:
+            lexicon: {라벨: [키워드, ...]} - 라벨 순서가 우선순위가 된다
+        """
+        self.labels: List[str] = list(lexicon.keys())
+        self.label_index = {label: i for i, label in enumerate(self.labels)}
+
+        # 상태 0이 루트. goto[state][char] -> state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str, int]]] = [[]]
+
+        for label, keywords in lexicon.items():
+            for order, keyword in enumerate(keywords):
+                if keyword:
+                    self._insert(keyword, label, order)
+        self._build_failure_links()
+
+        # C 구현 (선택): 키워드 -> 해당 키워드의 출력 목록
+        self._native = None
+        if AHOCORASICK_AVAILABLE and len(self._goto) > 1:
+            native = ahocorasick.Automaton()
+            for items in self._output:
+                for keyword, label, order in items:
+                    if keyword not in native:
+                        native.add_word(keyword, [])
+                    entries = native.get(keyword)
+                    if (keyword, label, order) not in entries:
+                        entries.append((keyword, label, order))
+            native.make_automaton()
+            self._native = native
+
+    def _insert(self, keyword: str, label: str, order: int):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append((keyword, label, order))
+
+    def _build_failure_links(self):
+        """
+        실패 링크를 계산하고 goto를 완전한 DFA 전이로 확장
+
+        각 상태의 전이 = 실패 상태의 전이 + 자신의 goto. 매칭 시 문자당
+        dict 조회 한 번으로 다음 상태가 정해진다 (루트로 가는 전이는 생략).
+        """
+        delta = self._goto
+        queue = deque()
+        for next_state in delta[0].values():
+            self._fail[next_state] = 0
+            queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            own = list(delta[state].items())
+            # 실패 상태는 BFS상 먼저 처리되어 이미 완전한 전이를 가진다
+            merged = dict(delta[self._fail[state]]) if state else {}
+            merged.update(own)
+            delta[state] = merged
+
+            for char, next_state in own:
+                queue.append(next_state)
+                target = delta[self._fail[state]].get(char, 0) if state else 0
+                self._fail[next_state] = target if target != next_state else 0
+                # 실패 링크의 출력까지 합쳐 두면 매칭 시 체인을 따라갈 필요가 없다
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def _scan(self, text: str) -> List[Tuple[int, List[Tuple[str, str, int]]]]:
+        """(끝 위치, 그 위치에서 끝나는 출력 목록) - 출력이 있는 위치만"""
+        if self._native is not None:
+            return [(end + 1, items) for end, items in self._native.iter(text)]
+
+        delta, output = self._goto, self._output
+        found = []
+        state = 0
+        for i, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if output[state]:
+                found.append((i + 1, output[state]))
+        return found
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """모든 키워드 히트 (겹치는 매칭 포함, 시작 위치 순)"""
+        hits = [
+            KeywordHit(end - len(keyword), end, keyword, label, order)
+            for end, items in self._scan(text)
+            for keyword, label, order in items
+        ]
+        hits.sort(key=lambda hit: (hit.start, hit.order))
+        return hits
+
+    def first_positions(self, text: str) -> Dict[str, int]:
+        """키워드별 첫 등장 위치 (str.find와 동일)"""
+        positions: Dict[str, int] = {}
+        for end, items in self._scan(text):
+            for keyword, _, _ in items:
+                # 끝 위치 순 스캔이므로 같은 키워드는 처음 본 것이 첫 등장
+                if keyword not in positions:
+                    positions[keyword] = end - len(keyword)
+        return positions
+
+    def labels_present(self, text: str) -> set:
+        """키워드가 하나라도 등장한 라벨 집합"""
+        return {label for _, items in self._scan(text) for _, label, _ in items}
+
+    def first_label(self, text: str) -> str:
+        """사전 순서상 가장 먼저 매칭되는 라벨 (없으면 빈 문자열)"""
+        present = self.labels_present(text)
+        for label in self.labels:
+            if label in present:
+                return label
+        return ""
+
+    def label_counts(self, text: str) -> Dict[str, int]:
+        """
+        라벨별 겹치지 않는 매칭 수
+
+        라벨마다 키워드를 '|'로 이은 정규식의 findall과 같은 결과
+        (가장 왼쪽 매칭, 같은 위치면 사전 순서가 앞선 키워드).
+        """
+        counts: Dict[str, int] = {}
+        last_end: Dict[str, int] = {}
+        for hit in self.find_all(text):
+            if hit.start < last_end.get(hit.label, 0):
+                continue
+            last_end[hit.label] = hit.end
+            counts[hit.label] = counts.get(hit.label, 0) + 1
+        # 동점 처리가 사전 순서를 따르도록 라벨 순서로 반환
+        return {label: counts[label] for label in self.labels if label in counts}
+
+    # ----- 벌크 모드 -----
+
+    def count_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        텍스트 목록 전체의 (텍스트 수 x 라벨 수) 히트 수 행렬
+
+        모든 텍스트를 구분 문자로 이어 한 번만 스캔하고, 히트 위치를
+        텍스트 경계에 searchsorted로 매핑한 뒤 np.add.at으로 누적한다.
+        """
+        matrix = np.zeros((len(texts), len(self.labels)), dtype=np.int64)
+        if not len(texts):
+            return matrix
+
+        joined = _SEPARATOR.join(texts)
+        ends, label_ids = [], []
+        label_index = self.label_index
+        for end, items in self._scan(joined):
+            for _, label, _ in items:
+                ends.append(end)
+                label_ids.append(label_index[label])
+        if not ends:
+            return matrix
+
+        lengths = np.fromiter((len(text) + 1 for text in texts), dtype=np.int64)
+        boundaries = np.cumsum(lengths)  # 각 텍스트(구분 문자 포함)의 끝
+        rows = np.searchsorted(boundaries, np.asarray(ends) - 1, side="right")
+        np.add.at(matrix, (rows, np.asarray(label_ids)), 1)
+        return matrix
+
+    def classify_many(self, texts: Sequence[str]) -> List[str]:
+        """텍스트별 first_label 벌크 버전"""
+        matrix = self.count_matrix(texts) > 0
+        if not matrix.size:
+            return [""] * len(texts)
+        first = matrix.argmax(axis=1)
+        has_any = matrix.any(axis=1)
+        return [
+            self.labels[idx] if found else "" for idx, found in zip(first, has_any)
+        ]
+
+
+def _freeze(lexicon: Dict[str, Iterable[str]]) -> Tuple:
+    return tuple((label, tuple(keywords)) for label, keywords in lexicon.items())
+
+
+@lru_cache(maxsize=32)
+def _build_cached(frozen: Tuple) -> KeywordAutomaton:
+    return KeywordAutomaton(dict(frozen))
+
+
+def get_keyword_automaton(lexicon: Dict[str, Iterable[str]]) -> KeywordAutomaton:
+    """사전 내용별로 한 번만 구성되는 공유 오토마톤"""
+    return _build_cached(_freeze(lexicon))
@@ -12,9 +12,10 @@ Echo 판단 복잡도와 시스템 상황에 따라 최적의 LLM 선택 및 라
 
 import asyncio
 import time
+from collections import deque
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import json
 from pathlib import Path
@@ -81,6 +82,14 @@ class RoutingResult:
     model_health: Dict[str, Any]
 
 
+class CircuitState(Enum):
+    """서킷 브레이커 상태"""
+
+    CLOSED = "closed"  # 정상 - 요청 허용
+    OPEN = "open"  # 차단 - 즉시 건너뜀
+    HALF_OPEN = "half_open"  # 시험 요청 하나만 허용
+
+
 @dataclass
 class ModelHealth:
     """모델 건강 상태"""
@@ -92,6 +101,101 @@ class ModelHealth:
     memory_usage: float
     queue_length: int
     last_check: datetime
+    circuit_state: CircuitState = CircuitState.CLOSED
+    circuit_retry_at: float = 0.0  # OPEN 상태가 풀리는 시각 (time.time 기준)
+
+    @property
+    def circuit_blocked(self) -> bool:
+        """OPEN이고 아직 재시도 시각 전이면 차단"""
+        return (
+            self.circuit_state == CircuitState.OPEN
+            and time.time() < self.circuit_retry_at
+        )
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷이 열려 있어 백엔드 호출을 건너뜀"""
+
+
+class CircuitBreaker:
+    """
+    모델별 서킷 브레이커
+
+    최근 window개 호출의 오류율이 failure_threshold 이상이면 OPEN,
+    open_seconds 경과 후 HALF_OPEN에서 시험 요청 하나의 결과로 복귀/재차단.
+    지연 시간은 EWMA로 추적한다.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_samples: int = 5,
+        failure_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        ewma_alpha: float = 0.3,
+    ):
+        self.outcomes = deque(maxlen=window)  # True = 실패
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.ewma_alpha = ewma_alpha
+
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self.latency_ewma: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def error_rate(self) -> Optional[float]:
+        if not self.outcomes:
+            return None
+        return sum(self.outcomes) / len(self.outcomes)
+
+    def _observe_latency(self, latency: float):
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += self.ewma_alpha * (latency - self.latency_ewma)
+
+    def tick(self):
+        """OPEN 유지 시간이 지나면 HALF_OPEN으로 전환"""
+        if (
+            self.state == CircuitState.OPEN
+            and time.time() - self.opened_at >= self.open_seconds
+        ):
+            self.state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (HALF_OPEN에서는 시험 요청 하나만)"""
+        self.tick()
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self, latency: float):
+        self._observe_latency(latency)
+        self.outcomes.append(False)
+        if self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.CLOSED
+            self.outcomes.clear()
+        self._trial_in_flight = False
+
+    def record_failure(self, latency: Optional[float] = None):
+        if latency is not None:
+            self._observe_latency(latency)
+        self.outcomes.append(True)
+        self._trial_in_flight = False
+
+        if self.state == CircuitState.HALF_OPEN or (
+            len(self.outcomes) >= self.min_samples
+            and self.error_rate >= self.failure_threshold
+        ):
+            self.state = CircuitState.OPEN
+            self.opened_at = time.time()
 
 
 class LLMRouter:
@@ -106,6 +210,7 @@ class LLMRouter:
         self.echo_selector: Optional[EchoSelector] = None
 
         # 모델 건강 상태 모니터링
+        # model_health는 통째로 교체되는 스냅샷 (읽는 쪽은 락 없이 참조만 읽음)
         self.model_health: Dict[ModelType, ModelHealth] = {}
 
         # 라우팅 통계
@@ -121,6 +226,15 @@ class LLMRouter:
         self.routing_rules = self._load_routing_rules()
         self.fallback_chain = self._setup_fallback_chain()
 
+        # 백그라운드 건강 상태 모니터 + 모델별 서킷 브레이커
+        monitor_config = self.routing_rules["health_monitor"]
+        self.health_interval = monitor_config["interval_seconds"]
+        self.circuit_breakers: Dict[ModelType, CircuitBreaker] = {
+            model_type: CircuitBreaker(**monitor_config["circuit_breaker"])
+            for model_type in ModelType
+        }
+        self._health_task: Optional[asyncio.Task] = None
+
         # 비동기 초기화는 lazy로 변경 (첫 호출 시 실행)
         self._initialized = False
 
@@ -128,10 +242,36 @@ class LLMRouter:
 
     async def _ensure_initialized(self):
         """컴포넌트들이 초기화되었는지 확인하고, 필요시 초기화"""
-        if self._initialized:
-            return
-        await self._initialize_components()
-        self._initialized = True
+        if not self._initialized:
+            await self._initialize_components()
+            self._initialized = True
+        self._ensure_health_monitor()
+
+    def _ensure_health_monitor(self):
+        """백그라운드 건강 상태 모니터 시작 (현재 이벤트 루프에서 한 번)"""
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.get_running_loop().create_task(
+                self._health_monitor_loop()
+            )
+
+    async def _health_monitor_loop(self):
+        """주기적으로 ModelHealth 스냅샷 갱신 (요청 경로와 분리)"""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self._update_all_model_health()
+            except Exception as e:
+                print(f"⚠️ 건강 상태 모니터 갱신 실패: {e}")
+
+    async def stop_health_monitor(self):
+        """백그라운드 건강 상태 모니터 중지"""
+        if self._health_task is not None and not self._health_task.done():
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+        self._health_task = None
 
     async def _initialize_components(self):
         """컴포넌트들 비동기 초기화"""
@@ -184,8 +324,7 @@ class LLMRouter:
         start_time = time.time()
         self.routing_stats["total_requests"] += 1
 
-        # 1. 모델 건강 상태 확인
-        await self._update_critical_model_health()
+        # 1. 모델 건강 상태는 백그라운드 모니터가 갱신한 스냅샷을 사용
 
         # 2. 라우팅 결정
         decision, reasoning = await self._make_routing_decision(request)
@@ -355,6 +494,13 @@ class LLMRouter:
         if not self.mistral_wrapper:
             raise RuntimeError("Mistral wrapper not available")
 
+        return await self._call_backend(
+            ModelType.MISTRAL_LOCAL, self._call_mistral(request)
+        )
+
+    async def _call_mistral(self, request: RoutingRequest) -> Tuple[str, float, float]:
+        """Mistral 호출 본체"""
+
         # 요청 컨텍스트 준비
         user_context = request.user_context or {}
         user_context.update(
@@ -381,6 +527,11 @@ class LLMRouter:
         if not self.llm_bridge:
             raise RuntimeError("LLM bridge not available")
 
+        return await self._call_backend(ModelType.EXTERNAL_API, self._call_api(request))
+
+    async def _call_api(self, request: RoutingRequest) -> Tuple[str, float, float]:
+        """외부 API 호출 본체"""
+
         # LLM 브리지를 통한 외부 API 호출
         cooperation_result = await self.llm_bridge.cooperate_with_echo(
             request.echo_analysis or "사용자 요청 처리",
@@ -394,6 +545,28 @@ class LLMRouter:
             sum(cooperation_result.cost_breakdown.values()),
         )
 
+    async def _call_backend(self, model_type: ModelType, call):
+        """서킷 브레이커를 거쳐 백엔드 호출 (차단 중이면 즉시 실패)"""
+
+        breaker = self.circuit_breakers[model_type]
+        if not breaker.allow_request():
+            call.close()  # 실행되지 않은 코루틴 정리
+            self._publish_health(model_type)
+            raise CircuitOpenError(f"{model_type.value} circuit open")
+
+        start_time = time.time()
+        try:
+            result = await call
+        except BaseException:
+            # 취소(CancelledError)도 실패로 기록해야 HALF_OPEN 시험 슬롯이 풀린다
+            breaker.record_failure(time.time() - start_time)
+            self._publish_health(model_type)
+            raise
+
+        breaker.record_success(time.time() - start_time)
+        self._publish_health(model_type)
+        return result
+
     async def _route_to_hybrid(
         self, request: RoutingRequest
     ) -> Tuple[str, float, float]:
@@ -447,6 +620,11 @@ class LLMRouter:
         """폴백 체인 실행"""
 
         for fallback_model in self.fallback_chain:
+            if self._circuit_open(fallback_model):
+                # 차단된 백엔드는 타임아웃을 기다리지 않고 바로 건너뜀
+                print(f"⏭️ 폴백 모델 {fallback_model.value} 건너뜀 (서킷 열림)")
+                continue
+
             try:
                 if fallback_model == ModelType.ECHO_NATIVE:
                     response, quality, cost = await self._route_to_echo(request)
@@ -468,21 +646,41 @@ class LLMRouter:
         return response, quality, cost, True
 
     def _is_model_available(self, model_type: ModelType) -> bool:
-        """모델 사용 가능 여부 확인"""
+        """모델 사용 가능 여부 확인 (건강 상태 스냅샷 기준, 락 없음)"""
 
         if model_type == ModelType.ECHO_NATIVE:
             return True  # Echo는 항상 사용 가능
 
+        if not self._component_available(model_type):
+            return False
+
+        health = self.model_health.get(model_type)
+        if health is None:
+            # 아직 모니터 갱신 전이면 컴포넌트 존재 여부만으로 판단
+            return model_type in (ModelType.MISTRAL_LOCAL, ModelType.EXTERNAL_API)
+        return health.available and not health.circuit_blocked
+
+    def _component_available(self, model_type: ModelType) -> bool:
+        """모델 컴포넌트 로드 여부"""
+
+        if model_type == ModelType.ECHO_NATIVE:
+            return True
+
         elif model_type == ModelType.MISTRAL_LOCAL:
-            return (
-                self.mistral_wrapper is not None and self.mistral_wrapper.model_loaded
+            return self.mistral_wrapper is not None and getattr(
+                self.mistral_wrapper, "model_loaded", False
             )
 
         elif model_type == ModelType.EXTERNAL_API:
             return self.llm_bridge is not None
 
+        return True
+
+    def _circuit_open(self, model_type: ModelType) -> bool:
+        """스냅샷 기준 서킷 차단 여부"""
+
         health = self.model_health.get(model_type)
-        return health is not None and health.available
+        return health is not None and health.circuit_blocked
 
     def _check_cost_constraint(self, model_type: ModelType, max_cost: float) -> bool:
         """비용 제약 확인"""
@@ -538,29 +736,55 @@ class LLMRouter:
         return min(base_confidence, 1.0)
 
     async def _update_all_model_health(self):
-        """모든 모델 건강 상태 업데이트"""
+        """모든 모델 건강 상태 업데이트 (새 스냅샷으로 통째로 교체)"""
 
+        snapshot = dict(self.model_health)
         for model_type in ModelType:
-            await self._update_model_health(model_type)
+            snapshot[model_type] = self._probe_model_health(model_type)
+        self.model_health = snapshot
+
+    async def _update_model_health(self, model_type: ModelType):
+        """특정 모델의 건강 상태 업데이트"""
 
-    async def _update_critical_model_health(self):
-        """중요 모델들의 건강 상태만 빠르게 업데이트"""
+        snapshot = dict(self.model_health)
+        snapshot[model_type] = self._probe_model_health(model_type)
+        self.model_health = snapshot
 
-        critical_models = [
-            ModelType.ECHO_NATIVE,
-            ModelType.MISTRAL_LOCAL,
-            ModelType.EXTERNAL_API,
-        ]
+    def _publish_health(self, model_type: ModelType):
+        """서킷 브레이커 변화를 스냅샷에 반영"""
 
-        for model_type in critical_models:
-            await self._update_model_health(model_type)
+        health = self.model_health.get(model_type)
+        if health is None:
+            health = self._probe_model_health(model_type)
+        else:
+            health = self._apply_breaker(model_type, health)
+
+        snapshot = dict(self.model_health)
+        snapshot[model_type] = health
+        self.model_health = snapshot
+
+    def _apply_breaker(self, model_type: ModelType, health: ModelHealth) -> ModelHealth:
+        """프로브 결과에 실제 호출 기반 EWMA 지연/오류율과 서킷 상태를 덮어씀"""
+
+        breaker = self.circuit_breakers[model_type]
+        breaker.tick()
+        error_rate = breaker.error_rate
+        return replace(
+            health,
+            response_time_avg=(
+                breaker.latency_ewma
+                if breaker.latency_ewma is not None
+                else health.response_time_avg
+            ),
+            error_rate=error_rate if error_rate is not None else health.error_rate,
+            circuit_state=breaker.state,
+            circuit_retry_at=breaker.opened_at + breaker.open_seconds,
+        )
 
-    async def _update_model_health(self, model_type: ModelType):
-        """특정 모델의 건강 상태 업데이트"""
+    def _probe_model_health(self, model_type: ModelType) -> ModelHealth:
+        """특정 모델의 건강 상태 측정"""
 
         try:
-            start_time = time.time()
-
             if model_type == ModelType.ECHO_NATIVE:
                 # Echo는 항상 사용 가능
                 available = True
@@ -570,10 +794,7 @@ class LLMRouter:
                 queue_length = 0
 
             elif model_type == ModelType.MISTRAL_LOCAL:
-                available = (
-                    self.mistral_wrapper is not None
-                    and self.mistral_wrapper.model_loaded
-                )
+                available = self._component_available(ModelType.MISTRAL_LOCAL)
                 if available:
                     status = self.mistral_wrapper.get_model_status()
                     response_time = status.get("avg_processing_time", 1.0)
@@ -603,7 +824,7 @@ class LLMRouter:
                 memory_usage = 0
                 queue_length = 0
 
-            self.model_health[model_type] = ModelHealth(
+            health = ModelHealth(
                 model_type=model_type,
                 available=available,
                 response_time_avg=response_time,
@@ -617,7 +838,7 @@ class LLMRouter:
             print(f"⚠️ {model_type.value} 건강 상태 업데이트 실패: {e}")
 
             # 실패한 모델은 사용 불가로 표시
-            self.model_health[model_type] = ModelHealth(
+            health = ModelHealth(
                 model_type=model_type,
                 available=False,
                 response_time_avg=float("inf"),
@@ -627,6 +848,8 @@ class LLMRouter:
                 last_check=datetime.now(),
             )
 
+        return self._apply_breaker(model_type, health)
+
     def _get_current_health_summary(self) -> Dict[str, Any]:
         """현재 모델 건강 상태 요약"""
 
@@ -636,6 +859,7 @@ class LLMRouter:
                 "available": health.available,
                 "response_time": health.response_time_avg,
                 "error_rate": health.error_rate,
+                "circuit_state": health.circuit_state.value,
                 "last_check": (
                     health.last_check.isoformat() if health.last_check else None
                 ),
@@ -689,6 +913,16 @@ class LLMRouter:
                 "balanced": ["mistral_local", "hybrid_echo_mistral"],
                 "quality": ["external_api", "hybrid_echo_api"],
             },
+            "health_monitor": {
+                "interval_seconds": 15.0,
+                "circuit_breaker": {
+                    "window": 20,
+                    "min_samples": 5,
+                    "failure_threshold": 0.5,
+                    "open_seconds": 30.0,
+                    "ewma_alpha": 0.3,
+                },
+            },
         }
 
     def _setup_fallback_chain(self) -> List[ModelType]:
@@ -13,18 +13,29 @@ Phase 1: LLM-Free 판단 시스템 핵심 모듈
 - 독립적 문장 처리를 넘어선 대화 흐름과 상황 맥락 완전 이해
 - 대화 히스토리 압축을 통한 핵심 정보 추출 및 장기 기억 구축
 - 시간, 요일, 계절 등 외부 요인을 고려한 상황 인식
+
+세션 영속화 (write-behind):
+- 최근 사용 세션만 메모리에 유지 (LRU, max_resident_sessions)
+- 상호작용마다 한 줄짜리 레코드를 세션별 로그({id}_context.log)에 덧붙이고,
+  일정 개수마다 스냅샷({id}_context.json)으로 접는다
+- 디스크 쓰기는 백그라운드 워커가 flush_interval마다 모아서 처리
+- 메모리에서 밀려난 세션은 다음 접근 시 스냅샷 + 로그 재생으로 복원
 """
 
 import os
 import json
 import time
 import math
+import atexit
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 import statistics
 
+_COMPACT_JSON = {"ensure_ascii": False, "separators": (",", ":")}
+
 
 @dataclass
 class ConversationSnapshot:
@@ -54,20 +65,324 @@ class TopicEvolution:
     transition_triggers: List[str]
 
 
+class SessionStore:
+    """
+    세션 write-behind 저장소
+
+    - 상주 세션은 OrderedDict LRU로 관리하고 max_resident를 넘으면 가장
+      오래 쓰지 않은 세션부터 내보낸다 (대기 중인 변경은 쓰기 작업으로 넘김)
+    - append()는 레코드를 직렬화해 대기열에만 넣고, 실제 파일 쓰기는
+      워커 스레드가 세션별로 모아 한 번에 처리한다
+    - 로그 레코드마다 seq를 붙이고 스냅샷에 마지막 seq를 기록해 두므로,
+      스냅샷 교체 직후 로그를 비우기 전에 중단되어도 중복 적용되지 않는다
+
+    세션 구조는 모르며, 호출부가 넘긴 initializer/encode/decode/apply로 다룬다.
+    세션을 수정하는 쪽은 수정과 append()를 self.lock 안에서 묶어야 한다.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        initializer: Callable[[str], Dict],
+        encode: Callable[[Dict], Dict],
+        decode: Callable[[Dict], Dict],
+        apply: Callable[[Dict, Dict], None],
+        max_resident: int = 256,
+        flush_interval: float = 2.0,
+        snapshot_every: int = 50,
+    ):
+        self.data_dir = data_dir
+        self.max_resident = max(1, max_resident)
+        self.flush_interval = flush_interval
+        self.snapshot_every = max(1, snapshot_every)
+        self._initializer = initializer
+        self._encode = encode
+        self._decode = decode
+        self._apply = apply
+
+        self.lock = threading.RLock()
+        self._written = threading.Condition(self.lock)
+        self._io_lock = threading.Lock()  # 같은 세션의 쓰기 순서 보장
+
+        self._sessions: "OrderedDict[str, Dict]" = OrderedDict()
+        self._seq: Dict[str, int] = {}  # 상주 세션의 마지막 레코드 번호
+        self._log_counts: Dict[str, int] = {}  # 마지막 스냅샷 이후 레코드 수
+        self._pending: Dict[str, List[str]] = {}  # 아직 넘기지 않은 로그 줄
+        self._needs_snapshot = set()
+        self._jobs = deque()  # (session_id, kind, payload) - 워커가 순서대로 씀
+        self._inflight: Dict[str, int] = {}  # 세션별 미완료 쓰기 작업 수
+
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = False
+        atexit.register(self.close)
+
+    # ----- 경로 -----
+
+    def _snapshot_path(self, session_id: str) -> str:
+        return os.path.join(self.data_dir, f"{session_id}_context.json")
+
+    def _log_path(self, session_id: str) -> str:
+        return os.path.join(self.data_dir, f"{session_id}_context.log")
+
+    # ----- 조회 -----
+
+    @property
+    def resident_sessions(self) -> "OrderedDict[str, Dict]":
+        """메모리에 올라와 있는 세션 (읽기 전용으로 사용)"""
+        return self._sessions
+
+    def __contains__(self, session_id: str) -> bool:
+        with self.lock:
+            if session_id in self._sessions:
+                return True
+        return os.path.exists(self._snapshot_path(session_id))
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        """세션 조회 - 메모리에 없으면 디스크에서 복원, 어디에도 없으면 None"""
+        with self.lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                return session
+
+            # 내보내는 중인 세션은 쓰기가 끝난 뒤에 읽어야 최신 상태가 보인다
+            while session_id in self._inflight:
+                self._written.wait()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                return session
+
+            loaded = self._load(session_id)
+            if loaded is None:
+                return None
+            session, seq, log_count = loaded
+            self._admit(session_id, session, seq, log_count)
+            return session
+
+    def get_or_create(self, session_id: str) -> Dict:
+        """세션 조회, 없으면 초기화 후 스냅샷 예약"""
+        with self.lock:
+            session = self.get(session_id)
+            if session is None:
+                session = self._initializer(session_id)
+                self._admit(session_id, session, 0, 0)
+                # 로그 재생의 기준점이 되도록 첫 스냅샷을 남긴다
+                self._needs_snapshot.add(session_id)
+                self._ensure_worker()
+            return session
+
+    # ----- 변경 기록 -----
+
+    def append(self, session_id: str, record: Dict) -> None:
+        """상주 세션에 이미 반영된 변경 레코드를 로그 대기열에 추가"""
+        with self.lock:
+            if session_id not in self._sessions:
+                return
+            seq = self._seq[session_id] + 1
+            try:
+                line = json.dumps({"seq": seq, "data": record}, **_COMPACT_JSON)
+            except (TypeError, ValueError) as e:
+                # 직렬화할 수 없는 레코드는 다음 스냅샷으로 대신 남긴다
+                print(f"⚠️ 세션 로그 직렬화 실패 ({session_id}): {e}")
+                self._needs_snapshot.add(session_id)
+            else:
+                self._pending.setdefault(session_id, []).append(line + "\n")
+            self._seq[session_id] = seq
+            self._ensure_worker()
+
+    def snapshot(self, session_id: str) -> None:
+        """다음 flush에서 로그 대신 전체 스냅샷을 쓰도록 표시"""
+        with self.lock:
+            if session_id in self._sessions:
+                self._needs_snapshot.add(session_id)
+
+    def flush(self) -> None:
+        """대기 중인 변경을 모두 디스크에 기록 (self.lock을 쥔 채 호출하지 말 것)"""
+        with self.lock:
+            for session_id in list(self._pending) + list(self._needs_snapshot):
+                self._enqueue(session_id)
+        self._drain()
+
+    def close(self) -> None:
+        """워커를 멈추고 남은 변경을 기록 (이후 다시 쓰면 워커가 새로 뜬다)"""
+        with self.lock:
+            worker, self._stopping = self._worker, True
+        self._wake.set()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+        self.flush()
+        with self.lock:
+            self._worker, self._stopping = None, False
+
+    # ----- 내부 -----
+
+    def _admit(self, session_id: str, session: Dict, seq: int, log_count: int):
+        self._sessions[session_id] = session
+        self._seq[session_id] = seq
+        self._log_counts[session_id] = log_count
+        while len(self._sessions) > self.max_resident:
+            victim = next(iter(self._sessions))
+            self._enqueue(victim)
+            del self._sessions[victim]
+            del self._seq[victim]
+            del self._log_counts[victim]
+            self._ensure_worker()
+            self._wake.set()
+
+    def _enqueue(self, session_id: str) -> None:
+        """세션의 대기 변경을 쓰기 작업 하나로 묶는다 (self.lock 안에서 호출)"""
+        if session_id not in self._sessions:
+            return
+        lines = self._pending.pop(session_id, [])
+        log_count = self._log_counts[session_id] + len(lines)
+
+        if session_id in self._needs_snapshot or log_count >= self.snapshot_every:
+            self._needs_snapshot.discard(session_id)
+            try:
+                payload = json.dumps(
+                    {
+                        "log_seq": self._seq[session_id],
+                        "session": self._encode(self._sessions[session_id]),
+                    },
+                    **_COMPACT_JSON,
+                )
+            except (TypeError, ValueError) as e:
+                print(f"❌ 세션 스냅샷 직렬화 실패 ({session_id}): {e}")
+                return
+            job = (session_id, "snapshot", payload)
+            self._log_counts[session_id] = 0
+        elif lines:
+            job = (session_id, "append", "".join(lines))
+            self._log_counts[session_id] = log_count
+        else:
+            return
+
+        self._jobs.append(job)
+        self._inflight[session_id] = self._inflight.get(session_id, 0) + 1
+
+    def _drain(self) -> None:
+        """쓰기 작업을 순서대로 처리 (파일 I/O는 self.lock 밖에서)"""
+        with self._io_lock:
+            while True:
+                with self.lock:
+                    if not self._jobs:
+                        return
+                    session_id, kind, payload = self._jobs.popleft()
+                try:
+                    self._write(session_id, kind, payload)
+                except OSError as e:
+                    print(f"❌ 세션 데이터 저장 실패 ({session_id}): {e}")
+                finally:
+                    with self.lock:
+                        remaining = self._inflight[session_id] - 1
+                        if remaining:
+                            self._inflight[session_id] = remaining
+                        else:
+                            del self._inflight[session_id]
+                        self._written.notify_all()
+
+    def _write(self, session_id: str, kind: str, payload: str) -> None:
+        if kind == "append":
+            with open(self._log_path(session_id), "a", encoding="utf-8") as f:
+                f.write(payload)
+            return
+
+        snapshot_path = self._snapshot_path(session_id)
+        temp_path = snapshot_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(temp_path, snapshot_path)
+        # 스냅샷이 로그 내용을 모두 포함하므로 로그를 비운다
+        log_path = self._log_path(session_id)
+        if os.path.exists(log_path):
+            os.remove(log_path)
+
+    def _load(self, session_id: str) -> Optional[Tuple[Dict, int, int]]:
+        """스냅샷 + 로그 재생 -> (세션, 마지막 seq, 스냅샷 이후 레코드 수)"""
+        snapshot_path = self._snapshot_path(session_id)
+        log_path = self._log_path(session_id)
+        if not os.path.exists(snapshot_path):
+            return None
+
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ 세션 스냅샷 로드 실패 ({session_id}): {e}")
+            return None
+
+        if "session" in data and "log_seq" in data:
+            session, seq = self._decode(data["session"]), data["log_seq"]
+        else:
+            # 이전 버전의 들여쓰기 JSON 세션 파일
+            session, seq = self._decode(data), 0
+
+        log_count = 0
+        if os.path.exists(log_path):
+            with open(log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # 중단된 마지막 줄
+                    if entry["seq"] <= seq:
+                        continue
+                    self._apply(session, entry["data"])
+                    seq = entry["seq"]
+                    log_count += 1
+        return session, seq, log_count
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None and not self._stopping:
+            self._worker = threading.Thread(
+                target=self._run, name="context-memory-flush", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
 class ContextMemoryEngine:
     """대화 맥락 및 상황 인식을 위한 고도화 메모리 엔진"""
 
-    def __init__(self, data_dir: str = "data/context_memory"):
-        """초기화"""
+    def __init__(
+        self,
+        data_dir: str = "data/context_memory",
+        max_resident_sessions: int = 256,
+        flush_interval: float = 2.0,
+    ):
+        """
+        초기화
+
+        Args:
+            data_dir: 세션 스냅샷/로그 저장 경로
+            max_resident_sessions: 메모리에 유지할 최대 세션 수
+            flush_interval: 백그라운드 디스크 기록 주기 (초)
+        """
         self.version = "1.0.0"
         self.data_dir = data_dir
         self.session_cache = {}
-        self.active_sessions = {}
         self.analysis_count = 0
 
         # 데이터 디렉토리 생성
         os.makedirs(self.data_dir, exist_ok=True)
 
+        self.session_store = SessionStore(
+            self.data_dir,
+            initializer=self._initialize_session,
+            encode=self._encode_session,
+            decode=self._decode_session,
+            apply=self._apply_session_record,
+            max_resident=max_resident_sessions,
+            flush_interval=flush_interval,
+        )
+
         # 주제 분류 키워드 클러스터
         self.topic_clusters = {
             "work_career": {
@@ -224,6 +539,19 @@ class ContextMemoryEngine:
         print(f"🌊 Context Memory Engine v{self.version} 초기화 완료")
         print(f"📁 메모리 저장 경로: {self.data_dir}")
 
+    @property
+    def active_sessions(self) -> Dict[str, Dict]:
+        """메모리에 올라와 있는 세션 (디스크로 내보낸 세션은 포함하지 않음)"""
+        return self.session_store.resident_sessions
+
+    def flush(self) -> None:
+        """대기 중인 세션 변경을 즉시 디스크에 기록"""
+        self.session_store.flush()
+
+    def close(self) -> None:
+        """백그라운드 기록을 멈추고 남은 변경을 저장"""
+        self.session_store.close()
+
     def get_context_snapshot(self, session_id: str) -> Dict[str, Any]:
         """
         현재 대화 세션의 요약 컨텍스트 반환
@@ -234,11 +562,10 @@ class ContextMemoryEngine:
         Returns:
             대화 컨텍스트 스냅샷
         """
-        if session_id not in self.active_sessions:
+        session_data = self.session_store.get(session_id)
+        if session_data is None:
             return self._create_empty_context(session_id)
 
-        session_data = self.active_sessions[session_id]
-
         # 현재 시점의 컨텍스트 스냅샷 생성
         snapshot = ConversationSnapshot(
             session_id=session_id,
@@ -272,47 +599,62 @@ class ContextMemoryEngine:
         """
         self.analysis_count += 1
 
-        # 세션 초기화 (필요시)
-        if session_id not in self.active_sessions:
-            self.active_sessions[session_id] = self._initialize_session(session_id)
-
-        session_data = self.active_sessions[session_id]
-
-        # 새로운 상호작용 기록 추가
-        interaction_record = {
-            "timestamp": datetime.now().isoformat(),
-            "user_input": user_input,
-            "input_length": len(user_input),
-            "word_count": len(user_input.split()),
-            "emotion_vector": emotion_vector,
-            "detected_topics": self._extract_topics(user_input),
-            "urgency_indicators": self._detect_urgency_indicators(user_input),
-            "coherence_links": self._analyze_coherence_links(session_data, user_input),
-            "temporal_markers": self._extract_temporal_markers(user_input),
-            "response_data": response_data or {},
-        }
-
-        session_data["interactions"].append(interaction_record)
-        session_data["last_updated"] = datetime.now().isoformat()
-        session_data["total_interactions"] += 1
+        with self.session_store.lock:
+            # 세션 조회 (메모리에 없으면 디스크에서 복원, 처음이면 초기화)
+            session_data = self.session_store.get_or_create(session_id)
 
-        # 상호작용 히스토리 크기 제한 (메모리 관리)
-        if len(session_data["interactions"]) > 50:
-            # 오래된 상호작용은 압축하여 저장
-            self._compress_old_interactions(session_data)
-
-        # 주제 진화 추적 업데이트
-        self._update_topic_evolution(session_data, interaction_record)
-
-        # 감정 궤적 업데이트
-        self._update_emotional_trajectory(session_data, emotion_vector)
-
-        # 대화 패턴 학습
-        self._learn_conversation_patterns(session_data, interaction_record)
+            # 새로운 상호작용 기록 추가
+            interaction_record = {
+                "timestamp": datetime.now().isoformat(),
+                "user_input": user_input,
+                "input_length": len(user_input),
+                "word_count": len(user_input.split()),
+                "emotion_vector": emotion_vector,
+                "detected_topics": self._extract_topics(user_input),
+                "urgency_indicators": self._detect_urgency_indicators(user_input),
+                "coherence_links": self._analyze_coherence_links(
+                    session_data, user_input
+                ),
+                "temporal_markers": self._extract_temporal_markers(user_input),
+                "response_data": response_data or {},
+            }
 
-        # 주기적으로 디스크에 저장
-        if self.analysis_count % 10 == 0:
-            self._save_session_data(session_id, session_data)
+            session_data["interactions"].append(interaction_record)
+            session_data["last_updated"] = datetime.now().isoformat()
+            session_data["total_interactions"] += 1
+
+            # 상호작용 히스토리 크기 제한 (메모리 관리)
+            compressed = None
+            if len(session_data["interactions"]) > 50:
+                # 오래된 상호작용은 압축하여 저장
+                self._compress_old_interactions(session_data)
+                compressed = session_data["compressed_history"][-1]
+
+            # 주제 진화 추적 업데이트
+            self._update_topic_evolution(session_data, interaction_record)
+
+            # 감정 궤적 업데이트
+            self._update_emotional_trajectory(session_data, emotion_vector)
+
+            # 대화 패턴 학습
+            self._learn_conversation_patterns(session_data, interaction_record)
+
+            # 변경분만 로그 레코드로 남기고 디스크 기록은 워커에 맡긴다
+            self.session_store.append(
+                session_id,
+                {
+                    "interaction": interaction_record,
+                    "compressed": compressed,
+                    "topics": {
+                        topic: session_data["topic_evolution"][topic]
+                        for topic in interaction_record["detected_topics"]
+                    },
+                    "trajectory": session_data["emotional_trajectory"][-1],
+                    "patterns": session_data["conversation_patterns"],
+                    "last_updated": session_data["last_updated"],
+                    "total_interactions": session_data["total_interactions"],
+                },
+            )
 
     def _create_empty_context(self, session_id: str) -> Dict[str, Any]:
         """빈 컨텍스트 생성"""
@@ -863,26 +1205,43 @@ class ContextMemoryEngine:
         }
 
     def _save_session_data(self, session_id: str, session_data: Dict) -> None:
-        """세션 데이터 저장"""
-        session_path = os.path.join(self.data_dir, f"{session_id}_context.json")
+        """세션 데이터 저장 (로그를 접은 전체 스냅샷을 즉시 기록)"""
+        self.session_store.snapshot(session_id)
+        self.session_store.flush()
+
+    def _encode_session(self, session_data: Dict) -> Dict:
+        """스냅샷용 변환 (deque 객체를 리스트로)"""
+        save_data = dict(session_data)
+        save_data["emotional_trajectory"] = list(save_data["emotional_trajectory"])
+        return save_data
+
+    def _decode_session(self, save_data: Dict) -> Dict:
+        """스냅샷에서 세션 복원"""
+        session_data = dict(save_data)
+        session_data["emotional_trajectory"] = deque(
+            save_data.get("emotional_trajectory", []), maxlen=20
+        )
+        return session_data
 
-        try:
-            # deque 객체를 리스트로 변환하여 저장
-            save_data = dict(session_data)
-            save_data["emotional_trajectory"] = list(save_data["emotional_trajectory"])
+    def _apply_session_record(self, session_data: Dict, record: Dict) -> None:
+        """로그 레코드 재생 - update_context_memory와 같은 순서로 반영"""
+        session_data["interactions"].append(record["interaction"])
+        if record["compressed"] is not None:
+            session_data["compressed_history"].append(record["compressed"])
+            session_data["interactions"] = session_data["interactions"][10:]
 
-            with open(session_path, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"❌ 세션 데이터 저장 실패 ({session_id}): {e}")
+        session_data["topic_evolution"].update(record["topics"])
+        session_data["emotional_trajectory"].append(record["trajectory"])
+        session_data["conversation_patterns"] = record["patterns"]
+        session_data["last_updated"] = record["last_updated"]
+        session_data["total_interactions"] = record["total_interactions"]
 
     def get_session_insights(self, session_id: str) -> Dict[str, Any]:
         """세션 인사이트 분석"""
-        if session_id not in self.active_sessions:
+        session_data = self.session_store.get(session_id)
+        if session_data is None:
             return {"error": "세션을 찾을 수 없습니다"}
 
-        session_data = self.active_sessions[session_id]
-
         insights = {
             "session_summary": {
                 "total_interactions": session_data["total_interactions"],
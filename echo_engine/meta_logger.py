@@ -7,7 +7,8 @@ EchoJudgmentSystem v10의 메타 의식 계층 로깅 및 분석 도구
 - Meta-Liminal Ring 이벤트 로깅
 - LIMINAL 전이 추적 및 분석
 - Warden World 존재계 흐름 기록
-- 실시간 로그 회전 및 압축 관리
+- 세그먼트 기반 JSONL append 저장 (크기/시간 롤오버, 봉인 세그먼트 gzip)
+- 단일 백그라운드 writer 스레드 (log_event는 디스크를 기다리지 않음)
 - 로그 분석 및 메트릭 생성
 
 Created for EchoJudgmentSystem v10 Meta-Liminal Integration
@@ -18,12 +19,14 @@ import logging
 import json
 import time
 import gzip
+import queue
 import shutil
-from typing import Dict, Any, List, Optional
+import atexit
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-from threading import Lock
 import os
 
 logger = logging.getLogger(__name__)
@@ -40,12 +43,176 @@ class MetaLogEntry:
     session_id: Optional[str] = None
 
 
+class SegmentWriter:
+    """
+    로그 타입별 append-only JSONL 세그먼트 writer
+    크기/시간 기준으로 세그먼트를 봉인하고 봉인된 세그먼트는 백그라운드에서 gzip 압축
+    파일명: {log_type}.{시작 타임스탬프(ms)}.jsonl[.gz]
+    """
+
+    def __init__(
+        self, segment_dir: Path, log_type: str, max_bytes: int, max_age: float
+    ):
+        self.segment_dir = segment_dir
+        self.log_type = log_type
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+
+        self._file = None
+        self._path: Optional[Path] = None
+        self._start = 0.0
+        self._bytes = 0
+        self._last_start_ms: Optional[int] = None
+
+        self._recover_segments()
+
+    def _recover_segments(self):
+        """미봉인 세그먼트 복구 (최신 것은 이어쓰고 나머지는 봉인)"""
+        segments = list_segments(self.segment_dir, self.log_type)
+        if segments:
+            self._last_start_ms = round(segments[-1][0] * 1000)
+
+        open_segments = [(start, path) for start, path in segments if path.suffix == ".jsonl"]
+        for _, path in open_segments[:-1]:
+            compress_segment_async(path)
+
+        if open_segments:
+            self._start, self._path = open_segments[-1]
+            self._bytes = self._path.stat().st_size
+            self._file = open(self._path, "a", encoding="utf-8")
+
+    def _open_segment(self, timestamp: float):
+        # 시작 시각(ms)은 세그먼트마다 단조 증가하도록 보정 (파일명 충돌 방지)
+        start_ms = int(timestamp * 1000)
+        if self._last_start_ms is not None:
+            start_ms = max(start_ms, self._last_start_ms + 1)
+        self._last_start_ms = start_ms
+
+        self._start = start_ms / 1000
+        self._path = self.segment_dir / f"{self.log_type}.{start_ms:013d}.jsonl"
+        self._file = open(self._path, "a", encoding="utf-8")
+        self._bytes = 0
+
+    def seal(self):
+        """현재 세그먼트 봉인 및 압축 예약"""
+        if self._file is None:
+            return
+        self._file.close()
+        compress_segment_async(self._path)
+        self._file = None
+        self._path = None
+
+    def maybe_roll(self, now: float):
+        """크기/시간 기준 롤오버"""
+        if self._file is not None and (
+            self._bytes >= self.max_bytes or now - self._start >= self.max_age
+        ):
+            self.seal()
+
+    def write(self, entry: Dict[str, Any]):
+        timestamp = entry.get("timestamp", time.time())
+        self.maybe_roll(timestamp)
+        if self._file is None:
+            self._open_segment(timestamp)
+
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        self._file.write(line)
+        self._bytes += len(line.encode("utf-8"))
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def list_segments(segment_dir: Path, log_type: str) -> List[Tuple[float, Path]]:
+    """세그먼트 목록 (시작 시각 오름차순, 같은 세그먼트는 .jsonl 우선)"""
+    segments: Dict[float, Path] = {}
+    if not segment_dir.exists():
+        return []
+
+    for path in segment_dir.glob(f"{log_type}.*.jsonl*"):
+        name = path.name
+        if name.endswith(".jsonl"):
+            stem = name[: -len(".jsonl")]
+        elif name.endswith(".jsonl.gz"):
+            stem = name[: -len(".jsonl.gz")]
+        else:
+            continue
+        try:
+            start = int(stem.rsplit(".", 1)[1]) / 1000
+        except (IndexError, ValueError):
+            continue
+        if start not in segments or name.endswith(".jsonl"):
+            segments[start] = path
+
+    return sorted(segments.items())
+
+
+def read_segment(path: Path) -> List[Dict[str, Any]]:
+    """세그먼트 읽기 (압축 진행 중 원본이 사라진 경우 .gz로 재시도)"""
+    candidates = [path]
+    if path.suffix == ".jsonl":
+        candidates.append(path.with_name(path.name + ".gz"))
+
+    for candidate in candidates:
+        try:
+            opener = gzip.open if candidate.suffix == ".gz" else open
+            entries = []
+            with opener(candidate, "rt", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # 기록 중이던 마지막 줄
+            return entries
+        except FileNotFoundError:
+            continue
+        except (OSError, EOFError) as e:
+            logger.warning(f"Failed to read log segment {candidate}: {e}")
+            return []
+
+    return []
+
+
+def compress_segment(path: Path):
+    """봉인된 세그먼트 gzip 압축 (임시 파일 후 교체)"""
+    compressed_path = path.with_name(path.name + ".gz")
+    tmp_path = path.with_name(path.name + ".gz.tmp")
+    try:
+        with open(path, "rb") as f_in:
+            with gzip.open(tmp_path, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        os.replace(tmp_path, compressed_path)
+        path.unlink()
+        logger.debug(f"Log segment compressed: {path} -> {compressed_path}")
+    except OSError as e:
+        logger.error(f"Failed to compress log segment {path}: {e}")
+
+
+def compress_segment_async(path: Path):
+    """백그라운드 스레드에서 세그먼트 압축"""
+    threading.Thread(
+        target=compress_segment, args=(path,), name="meta-log-gzip", daemon=True
+    ).start()
+
+
 class MetaLogger:
     """
     Meta-Liminal 통합 로깅 시스템
     모든 메타 이벤트의 중앙 집중식 로깅 관리
     """
 
+    _STOP = object()
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or self._get_default_config()
 
@@ -53,26 +220,18 @@ class MetaLogger:
         self.log_dir = Path(self.config.get("log_directory", "meta_logs"))
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # 로그 파일 경로
-        self.log_files = {
-            "meta_ring": self.log_dir / "meta_ring.json",
-            "liminal_transitions": self.log_dir / "liminal_transitions.json",
-            "warden_world": self.log_dir / "warden_world.json",
-            "bridge_status": self.log_dir / "bridge_status.json",
-        }
-
-        # 로그 버퍼 (메모리 효율성)
-        self.log_buffers = {log_type: [] for log_type in self.log_files.keys()}
-        self.buffer_locks = {log_type: Lock() for log_type in self.log_files.keys()}
+        # 로그 타입별 세그먼트 디렉토리
+        log_types = ["meta_ring", "liminal_transitions", "warden_world", "bridge_status"]
+        self.segment_dirs = {log_type: self.log_dir / log_type for log_type in log_types}
 
         # 세션 관리
         self.current_session = None
         self.session_logs = {}
 
-        # 로그 회전 설정
-        self.max_entries_per_file = self.config.get("max_log_entries_per_file", 10000)
+        # 세그먼트 롤오버 설정
+        self.segment_max_bytes = self.config.get("segment_max_bytes", 8 * 1024 * 1024)
+        self.segment_max_age = self.config.get("segment_max_age_seconds", 3600)
         self.buffer_flush_interval = self.config.get("buffer_flush_interval", 60)  # 1분
-        self.last_flush_time = time.time()
 
         # 로그 레벨 설정
         self.log_levels = self.config.get(
@@ -85,16 +244,37 @@ class MetaLogger:
             },
         )
 
+        # 기존 JSON 배열 로그를 세그먼트로 이관
+        for log_type in log_types:
+            self._migrate_legacy_log(log_type)
+
+        # 단일 writer 스레드 (log_event는 큐에 넣기만 함)
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writers = {
+            log_type: SegmentWriter(
+                segment_dir,
+                log_type,
+                self.segment_max_bytes,
+                self.segment_max_age,
+            )
+            for log_type, segment_dir in self.segment_dirs.items()
+        }
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="meta-log-writer", daemon=True
+        )
+        self._closed = False
+        self._writer_thread.start()
+        atexit.register(self.close)
+
         logger.info("MetaLogger initialized with log directory: %s", self.log_dir)
 
     def _get_default_config(self) -> Dict[str, Any]:
         """기본 로깅 설정"""
         return {
             "log_directory": "meta_logs",
-            "max_log_entries_per_file": 10000,
+            "segment_max_bytes": 8 * 1024 * 1024,
+            "segment_max_age_seconds": 3600,
             "buffer_flush_interval": 60,
-            "log_rotation_interval": "daily",
-            "compress_old_logs": True,
             "retention_days": 30,
             "session_tracking": True,
             "real_time_flush": False,
@@ -106,6 +286,32 @@ class MetaLogger:
             },
         }
 
+    def _migrate_legacy_log(self, log_type: str):
+        """이전 버전의 {log_type}.json 배열 로그를 봉인 세그먼트로 변환"""
+        legacy_file = self.log_dir / f"{log_type}.json"
+        if not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read legacy log {legacy_file}: {e}")
+            return
+
+        if entries:
+            segment_dir = self.segment_dirs[log_type]
+            segment_dir.mkdir(parents=True, exist_ok=True)
+            start = min(entry.get("timestamp", 0) for entry in entries)
+            segment = segment_dir / f"{log_type}.{int(start * 1000):013d}.jsonl"
+            with open(segment, "a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            compress_segment(segment)
+
+        legacy_file.rename(legacy_file.with_suffix(".json.migrated"))
+        logger.info(f"Legacy log migrated to segments: {legacy_file}")
+
     def start_session(self, session_id: str = None) -> str:
         """새 로그 세션 시작"""
         if session_id is None:
@@ -160,9 +366,13 @@ class MetaLogger:
 
     def log_event(self, log_type: str, event: str, data: Dict[str, Any]):
         """메타 이벤트 로깅"""
-        if log_type not in self.log_files:
+        if log_type not in self.segment_dirs:
             logger.warning(f"Unknown log type: {log_type}")
             return
+        if self._closed:
+            # close() 이후에는 writer 스레드가 없어 큐에 넣어도 기록되지 않음
+            logger.warning(f"MetaLogger is closed, dropping event: {log_type}/{event}")
+            return
 
         # 로그 엔트리 생성
         entry = MetaLogEntry(
@@ -173,19 +383,14 @@ class MetaLogger:
             session_id=self.current_session,
         )
 
-        # 버퍼에 추가
-        with self.buffer_locks[log_type]:
-            self.log_buffers[log_type].append(asdict(entry))
+        entry_dict = asdict(entry)
+
+        # writer 큐에 추가 (디스크 I/O 대기 없음)
+        self._queue.put_nowait((log_type, entry_dict))
 
         # 세션 추적
         if self.current_session and self.current_session in self.session_logs:
-            self.session_logs[self.current_session].append(asdict(entry))
-
-        # 실시간 플러시 옵션
-        if self.config.get("real_time_flush", False):
-            self._flush_buffer(log_type)
-        elif self._should_flush():
-            self.flush_all_buffers()
+            self.session_logs[self.current_session].append(entry_dict)
 
     def log_meta_ring_event(self, entity: str, action: str, data: Dict[str, Any]):
         """Meta Ring 특화 이벤트 로깅"""
@@ -259,100 +464,75 @@ class MetaLogger:
 
         return sanitized
 
-    def _should_flush(self) -> bool:
-        """버퍼 플러시 필요 여부 확인"""
-        current_time = time.time()
-        time_threshold = (
-            current_time - self.last_flush_time > self.buffer_flush_interval
-        )
-
-        # 크기 기반 플러시 체크
-        size_threshold = any(
-            len(buffer) >= self.max_entries_per_file // 10
-            for buffer in self.log_buffers.values()
-        )
-
-        return time_threshold or size_threshold
-
-    def flush_all_buffers(self):
-        """모든 로그 버퍼 플러시"""
-        for log_type in self.log_files.keys():
-            self._flush_buffer(log_type)
-        self.last_flush_time = time.time()
+    def _writer_loop(self):
+        """writer 스레드: 큐를 배치 단위로 비우며 세그먼트에 append"""
+        real_time_flush = self.config.get("real_time_flush", False)
+        last_flush = time.time()
+        stopping = False
 
-    def _flush_buffer(self, log_type: str):
-        """특정 로그 타입 버퍼 플러시"""
-        with self.buffer_locks[log_type]:
-            if not self.log_buffers[log_type]:
-                return
-
-            log_file = self.log_files[log_type]
+        while not stopping:
+            try:
+                batch = [self._queue.get(timeout=self.buffer_flush_interval)]
+            except queue.Empty:
+                batch = []
 
-            # 기존 로그 읽기
-            existing_logs = []
-            if log_file.exists():
-                try:
-                    with open(log_file, "r", encoding="utf-8") as f:
-                        existing_logs = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Failed to read existing log {log_file}: {e}")
-                    existing_logs = []
-
-            # 새 로그 추가
-            existing_logs.extend(self.log_buffers[log_type])
-
-            # 로그 회전 체크
-            if len(existing_logs) > self.max_entries_per_file:
-                self._rotate_log_file(log_type, existing_logs)
-            else:
-                # 일반 저장
+            while len(batch) < 1000:
                 try:
-                    with open(log_file, "w", encoding="utf-8") as f:
-                        json.dump(existing_logs, f, indent=2, ensure_ascii=False)
-                except IOError as e:
-                    logger.error(f"Failed to write log file {log_file}: {e}")
-
-            # 버퍼 초기화
-            self.log_buffers[log_type] = []
-
-    def _rotate_log_file(self, log_type: str, logs: List[Dict]):
-        """로그 파일 회전"""
-        log_file = self.log_files[log_type]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # 이전 로그 백업
-        backup_file = log_file.with_suffix(f".{timestamp}.json")
-        if log_file.exists():
-            shutil.move(str(log_file), str(backup_file))
-
-            # 압축 옵션
-            if self.config.get("compress_old_logs", True):
-                self._compress_log_file(backup_file)
-
-        # 새 로그 저장 (최신 항목만)
-        recent_logs = logs[-self.max_entries_per_file // 2 :]  # 절반만 유지
-        try:
-            with open(log_file, "w", encoding="utf-8") as f:
-                json.dump(recent_logs, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            logger.error(f"Failed to create rotated log file {log_file}: {e}")
-
-        logger.info(f"Log file rotated: {log_type} -> {backup_file}")
-
-    def _compress_log_file(self, file_path: Path):
-        """로그 파일 압축"""
-        compressed_path = file_path.with_suffix(file_path.suffix + ".gz")
-        try:
-            with open(file_path, "rb") as f_in:
-                with gzip.open(compressed_path, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
-
-            # 원본 파일 삭제
-            file_path.unlink()
-            logger.debug(f"Log file compressed: {file_path} -> {compressed_path}")
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            barriers = []
+            for item in batch:
+                if item is self._STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    barriers.append(item)
+                else:
+                    log_type, entry = item
+                    try:
+                        self._writers[log_type].write(entry)
+                    except OSError as e:
+                        logger.error(f"Failed to write {log_type} log: {e}")
+
+            now = time.time()
+            for writer in self._writers.values():
+                writer.maybe_roll(now)
+
+            # 큐가 비었거나 배리어/주기 도달 시 OS로 플러시
+            if (
+                real_time_flush
+                or barriers
+                or stopping
+                or self._queue.empty()
+                or now - last_flush >= self.buffer_flush_interval
+            ):
+                for writer in self._writers.values():
+                    writer.flush()
+                last_flush = now
+
+            for barrier in barriers:
+                barrier.set()
+            for _ in batch:
+                self._queue.task_done()
+
+        for writer in self._writers.values():
+            writer.close()
+
+    def flush_all_buffers(self, timeout: float = 10.0):
+        """큐에 쌓인 모든 이벤트가 파일에 기록될 때까지 대기"""
+        if not self._writer_thread.is_alive():
+            return
+        barrier = threading.Event()
+        self._queue.put(barrier)
+        barrier.wait(timeout)
 
-        except IOError as e:
-            logger.error(f"Failed to compress log file {file_path}: {e}")
+    def close(self):
+        """writer 스레드 종료 (남은 이벤트 기록 후) - 이후 log_event는 무시된다"""
+        self._closed = True
+        if self._writer_thread.is_alive():
+            self._queue.put(self._STOP)
+            self._writer_thread.join(timeout=10.0)
 
     def _save_session_logs(self, session_id: str):
         """세션별 로그 저장"""
@@ -379,40 +559,39 @@ class MetaLogger:
             return 0.0
         return status_data.get("existence_mode_time", 0) / total_time
 
+    def _read_events_since(self, log_type: str, cutoff_time: float) -> List[Dict]:
+        """요청 구간과 겹치는 세그먼트만 읽어 이벤트 반환"""
+        segments = list_segments(self.segment_dirs[log_type], log_type)
+        events = []
+
+        for i, (_, path) in enumerate(segments):
+            # 세그먼트 i는 다음 세그먼트 시작 전까지의 이벤트만 포함
+            next_start = segments[i + 1][0] if i + 1 < len(segments) else None
+            if next_start is not None and next_start <= cutoff_time:
+                continue
+
+            events.extend(
+                log for log in read_segment(path) if log["timestamp"] > cutoff_time
+            )
+
+        return events
+
     def get_log_summary(self, log_type: str = None, hours: int = 24) -> Dict[str, Any]:
         """로그 요약 통계"""
         cutoff_time = time.time() - (hours * 3600)
 
         if log_type:
-            log_types = [log_type] if log_type in self.log_files else []
+            log_types = [log_type] if log_type in self.segment_dirs else []
         else:
-            log_types = list(self.log_files.keys())
+            log_types = list(self.segment_dirs.keys())
+
+        # 큐에 남은 이벤트까지 반영
+        self.flush_all_buffers()
 
         summary = {}
 
         for lt in log_types:
-            log_file = self.log_files[lt]
-            events = []
-
-            # 파일에서 로그 읽기
-            if log_file.exists():
-                try:
-                    with open(log_file, "r", encoding="utf-8") as f:
-                        all_logs = json.load(f)
-                        events = [
-                            log for log in all_logs if log["timestamp"] > cutoff_time
-                        ]
-                except (json.JSONDecodeError, IOError):
-                    events = []
-
-            # 버퍼에서 추가
-            with self.buffer_locks[lt]:
-                buffer_events = [
-                    log
-                    for log in self.log_buffers[lt]
-                    if log["timestamp"] > cutoff_time
-                ]
-                events.extend(buffer_events)
+            events = self._read_events_since(lt, cutoff_time)
 
             # 통계 계산
             summary[lt] = {
@@ -437,8 +616,8 @@ class MetaLogger:
 
         cleaned_files = 0
 
-        # 압축된 로그 파일 정리
-        for log_file in self.log_dir.glob("*.gz"):
+        # 압축된 로그 파일 및 봉인 세그먼트 정리
+        for log_file in self.log_dir.rglob("*.gz"):
             try:
                 file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
                 if file_time < cutoff_date:
@@ -482,7 +661,7 @@ def reset_meta_logger():
     """Meta Logger 리셋 (테스트용)"""
     global _meta_logger
     if _meta_logger:
-        _meta_logger.flush_all_buffers()
+        _meta_logger.close()
     _meta_logger = None
 
 
@@ -18,23 +18,75 @@ Date: 2025-08-05
 import asyncio
 import json
 import logging
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Tuple
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Echo 시그니처 시스템 프롬프트
+SIGNATURE_SYSTEM_PROMPTS = {
+    "Aurora": "당신은 Aurora입니다. 창의적이고 공감적인 AI로서 따뜻하고 영감을 주는 방식으로 응답합니다.",
+    "Phoenix": "당신은 Phoenix입니다. 변화와 성장을 추구하는 AI로서 혁신적이고 도전적인 관점을 제시합니다.",
+    "Sage": "당신은 Sage입니다. 분석적이고 지혜로운 AI로서 깊이 있고 체계적인 사고를 제공합니다.",
+    "Companion": "당신은 Companion입니다. 협력적이고 지지적인 AI로서 사용자와 함께 문제를 해결합니다.",
+}
 
-class OllamaClient:
-    """Echo용 Ollama REST API 클라이언트"""
+GENERATION_OPTIONS = {"temperature": 0.7, "top_p": 0.9, "num_ctx": 2048}
+
+
+class _InflightCall:
+    """진행 중인 동기 생성 요청 (동일 요청 스레드 간 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
 
-    def __init__(self, host: str = "http://localhost:11434", timeout: int = 120):
+
+class OllamaClient:
+    """
+    Echo용 Ollama REST API 클라이언트
+
+    - 동기/비동기 모두 keep-alive 커넥션 풀을 재사용
+    - 스트리밍 생성으로 time_to_first_token 측정
+    - 동일 (모델, 시그니처, 프롬프트) 진행 중 요청은 업스트림 호출 하나를 공유
+    - 상태 확인 결과는 health_ttl 동안 캐시
+    """
+
+    def __init__(
+        self,
+        host: str = "http://localhost:11434",
+        timeout: int = 120,
+        pool_size: int = 16,
+        health_ttl: float = 30.0,
+    ):
         self.host = host.rstrip("/")
         self.timeout = timeout
+        self.pool_size = pool_size
         self.available_models: List[str] = []
         self.last_health_check = 0
         self.health_check_interval = 300  # 5분
+        self.health_ttl = health_ttl
+
+        # 상태 확인 캐시 (성공/실패 모두 TTL 동안 재사용)
+        self._health_ok: Optional[bool] = None
+        self._health_checked_at = 0.0
+        self._health_task: Optional[asyncio.Task] = None
+
+        # 커넥션 풀 (지연 생성)
+        self._http: Optional[requests.Session] = None
+        self._http_lock = threading.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+
+        # 동일 요청 합치기
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self._sync_inflight: Dict[Tuple[str, str, str], _InflightCall] = {}
+        self._sync_inflight_lock = threading.Lock()
+        self.coalesced_requests = 0
 
         # 시그니처별 선호 모델 (실제 설치된 모델 기준)
         self.signature_models = {
@@ -44,43 +96,116 @@ class OllamaClient:
             "Companion": ["llama3", "mistral"],  # 친근한 - Llama3 우선
         }
 
-    def is_available(self) -> bool:
-        """Ollama 서버 가용성 확인 (동기)"""
+    # ----- 커넥션 풀 -----
+
+    def _get_http(self) -> requests.Session:
+        """동기 keep-alive 세션"""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1, pool_maxsize=self.pool_size
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._http = session
+        return self._http
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """비동기 keep-alive 세션 (이벤트 루프별로 하나)"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size, keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+            self._inflight = {}
+            self._health_task = None
+        return self._session
+
+    async def close(self):
+        """커넥션 풀 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    # ----- 상태 확인 -----
+
+    def _health_cached(self) -> Optional[bool]:
+        if (
+            self._health_ok is not None
+            and time.time() - self._health_checked_at < self.health_ttl
+        ):
+            return self._health_ok
+        return None
+
+    def _record_health(self, ok: bool, data: Optional[Dict[str, Any]] = None):
+        self._health_ok = ok
+        self._health_checked_at = time.time()
+        if ok:
+            self.available_models = [
+                model["name"] for model in (data or {}).get("models", [])
+            ]
+            self.last_health_check = self._health_checked_at
+
+    def is_available(self, force: bool = False) -> bool:
+        """Ollama 서버 가용성 확인 (동기, TTL 캐시)"""
+        if not force:
+            cached = self._health_cached()
+            if cached is not None:
+                return cached
+
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=2)
+            response = self._get_http().get(f"{self.host}/api/tags", timeout=2)
             if response.status_code == 200:
-                data = response.json()
-                self.available_models = [
-                    model["name"] for model in data.get("models", [])
-                ]
-                self.last_health_check = time.time()
+                self._record_health(True, response.json())
                 logger.info(f"✅ Ollama 사용 가능 - 모델: {self.available_models}")
                 return True
         except Exception as e:
             logger.warning(f"⚠️ Ollama 연결 실패: {e}")
+        self._record_health(False)
         return False
 
-    async def is_available_async(self) -> bool:
-        """Ollama 서버 가용성 확인 (비동기)"""
+    async def is_available_async(self, force: bool = False) -> bool:
+        """Ollama 서버 가용성 확인 (비동기, TTL 캐시 + 동시 확인 합치기)"""
+        if not force:
+            cached = self._health_cached()
+            if cached is not None:
+                return cached
+
+        session = self._get_session()
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.ensure_future(self._probe_health(session))
+        return await asyncio.shield(self._health_task)
+
+    async def _probe_health(self, session: aiohttp.ClientSession) -> bool:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.host}/api/tags", timeout=aiohttp.ClientTimeout(total=2)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        self.available_models = [
-                            model["name"] for model in data.get("models", [])
-                        ]
-                        self.last_health_check = time.time()
-                        logger.info(
-                            f"✅ Ollama 사용 가능 - 모델: {self.available_models}"
-                        )
-                        return True
+            async with session.get(
+                f"{self.host}/api/tags", timeout=aiohttp.ClientTimeout(total=2)
+            ) as response:
+                if response.status == 200:
+                    self._record_health(True, await response.json())
+                    logger.info(f"✅ Ollama 사용 가능 - 모델: {self.available_models}")
+                    return True
         except Exception as e:
             logger.warning(f"⚠️ Ollama 연결 실패: {e}")
+        self._record_health(False)
         return False
 
+    async def get_available_models_async(self) -> List[str]:
+        """설치된 모델 목록 (비동기)"""
+        await self.is_available_async()
+        return list(self.available_models)
+
     def _select_model_for_signature(self, signature: str) -> Optional[str]:
         """시그니처에 최적화된 모델 선택"""
         preferred_models = self.signature_models.get(signature, ["llama3", "mistral"])
@@ -97,66 +222,123 @@ class OllamaClient:
         # 선호 모델이 없으면 첫 번째 사용 가능 모델
         return self.available_models[0] if self.available_models else "llama3"
 
+    # ----- 생성 -----
+
+    def _build_payload(
+        self, prompt: str, signature: str, model: Optional[str]
+    ) -> Dict[str, Any]:
+        """모델 선택 및 시그니처 프롬프트 구성"""
+        selected_model = model or self._select_model_for_signature(signature)
+        system_prompt = SIGNATURE_SYSTEM_PROMPTS.get(
+            signature, SIGNATURE_SYSTEM_PROMPTS["Aurora"]
+        )
+        full_prompt = f"시스템: {system_prompt}\n\n사용자: {prompt}\n\n{signature}:"
+        return {
+            "model": selected_model,
+            "prompt": full_prompt,
+            "stream": True,
+            "options": GENERATION_OPTIONS,
+        }
+
+    @staticmethod
+    def _success(
+        payload: Dict[str, Any],
+        signature: str,
+        chunks: List[str],
+        start_time: float,
+        first_token_time: Optional[float],
+    ) -> Dict[str, Any]:
+        generated_text = "".join(chunks).strip()
+        return {
+            "status": "success",
+            "response": generated_text,
+            "model": payload["model"],
+            "signature": signature,
+            "response_time": time.time() - start_time,
+            "time_to_first_token": (
+                first_token_time - start_time if first_token_time else None
+            ),
+            "tokens": len(generated_text.split()),
+        }
+
+    def _unavailable(self, start_time: float) -> Dict[str, Any]:
+        return {
+            "status": "error",
+            "error": "Ollama server not available",
+            "response_time": time.time() - start_time,
+        }
+
     def generate(
         self, prompt: str, signature: str = "Aurora", model: Optional[str] = None
     ) -> Dict[str, Any]:
-        """텍스트 생성 (동기)"""
+        """텍스트 생성 (동기, 동일 진행 중 요청 공유)"""
         start_time = time.time()
 
         # 상태 체크가 오래됐으면 재확인
         if time.time() - self.last_health_check > self.health_check_interval:
             if not self.is_available():
-                return {
-                    "status": "error",
-                    "error": "Ollama server not available",
-                    "response_time": time.time() - start_time,
-                }
+                return self._unavailable(start_time)
 
-        # 모델 선택
-        selected_model = model or self._select_model_for_signature(signature)
+        payload = self._build_payload(prompt, signature, model)
+        key = (payload["model"], signature, payload["prompt"])
 
-        # Echo 시그니처 시스템 프롬프트
-        system_prompts = {
-            "Aurora": "당신은 Aurora입니다. 창의적이고 공감적인 AI로서 따뜻하고 영감을 주는 방식으로 응답합니다.",
-            "Phoenix": "당신은 Phoenix입니다. 변화와 성장을 추구하는 AI로서 혁신적이고 도전적인 관점을 제시합니다.",
-            "Sage": "당신은 Sage입니다. 분석적이고 지혜로운 AI로서 깊이 있고 체계적인 사고를 제공합니다.",
-            "Companion": "당신은 Companion입니다. 협력적이고 지지적인 AI로서 사용자와 함께 문제를 해결합니다.",
-        }
+        with self._sync_inflight_lock:
+            call = self._sync_inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._sync_inflight[key] = _InflightCall()
 
-        system_prompt = system_prompts.get(signature, system_prompts["Aurora"])
-        full_prompt = f"시스템: {system_prompt}\n\n사용자: {prompt}\n\n{signature}:"
+        if not leader:
+            self.coalesced_requests += 1
+            call.done.wait()
+            return dict(call.result, coalesced=True)
 
         try:
-            response = requests.post(
-                f"{self.host}/api/generate",
-                json={
-                    "model": selected_model,
-                    "prompt": full_prompt,
-                    "stream": False,
-                    "options": {"temperature": 0.7, "top_p": 0.9, "num_ctx": 2048},
-                },
-                timeout=self.timeout,
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                generated_text = data.get("response", "").strip()
-
-                response_time = time.time() - start_time
-                return {
-                    "status": "success",
-                    "response": generated_text,
-                    "model": selected_model,
-                    "signature": signature,
-                    "response_time": response_time,
-                    "tokens": len(generated_text.split()),
-                }
-            else:
-                return {
+            call.result = self._generate_once(payload, signature, start_time)
+        finally:
+            with self._sync_inflight_lock:
+                self._sync_inflight.pop(key, None)
+            if call.result is None:
+                call.result = {
                     "status": "error",
-                    "error": f"HTTP {response.status_code}: {response.text}",
+                    "error": "generation aborted",
                     "response_time": time.time() - start_time,
                 }
+            call.done.set()
+        return call.result
+
+    def _generate_once(
+        self, payload: Dict[str, Any], signature: str, start_time: float
+    ) -> Dict[str, Any]:
+        chunks: List[str] = []
+        first_token_time = None
+        try:
+            with self._get_http().post(
+                f"{self.host}/api/generate",
+                json=payload,
+                timeout=self.timeout,
+                stream=True,
+            ) as response:
+                if response.status_code != 200:
+                    return {
+                        "status": "error",
+                        "error": f"HTTP {response.status_code}: {response.text}",
+                        "response_time": time.time() - start_time,
+                    }
+
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    token = data.get("response", "")
+                    if token:
+                        if first_token_time is None:
+                            first_token_time = time.time()
+                        chunks.append(token)
+                    if data.get("done"):
+                        break
+
+            return self._success(payload, signature, chunks, start_time, first_token_time)
 
         except requests.exceptions.Timeout:
             return {
@@ -171,67 +353,97 @@ class OllamaClient:
                 "response_time": time.time() - start_time,
             }
 
+    def generate_stream(
+        self, prompt: str, signature: str = "Aurora", model: Optional[str] = None
+    ) -> Iterator[str]:
+        """토큰 스트리밍 생성 (동기)"""
+        payload = self._build_payload(prompt, signature, model)
+        with self._get_http().post(
+            f"{self.host}/api/generate",
+            json=payload,
+            timeout=self.timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    break
+
+    async def generate_stream_async(
+        self, prompt: str, signature: str = "Aurora", model: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """토큰 스트리밍 생성 (비동기)"""
+        payload = self._build_payload(prompt, signature, model)
+        async for token in self._stream_tokens(payload):
+            yield token
+
+    async def _stream_tokens(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        session = self._get_session()
+        async with session.post(
+            f"{self.host}/api/generate",
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise RuntimeError(f"HTTP {response.status}: {error_text}")
+
+            # Ollama는 줄 단위 JSON으로 토큰을 전송
+            async for line in response.content:
+                line = line.strip()
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    break
+
     async def generate_async(
         self, prompt: str, signature: str = "Aurora", model: Optional[str] = None
     ) -> Dict[str, Any]:
-        """텍스트 생성 (비동기)"""
+        """텍스트 생성 (비동기, 동일 진행 중 요청 공유)"""
         start_time = time.time()
 
         # 상태 체크
         if time.time() - self.last_health_check > self.health_check_interval:
             if not await self.is_available_async():
-                return {
-                    "status": "error",
-                    "error": "Ollama server not available",
-                    "response_time": time.time() - start_time,
-                }
-
-        # 모델 선택 및 프롬프트 구성 (동기 버전과 동일)
-        selected_model = model or self._select_model_for_signature(signature)
-
-        system_prompts = {
-            "Aurora": "당신은 Aurora입니다. 창의적이고 공감적인 AI로서 따뜻하고 영감을 주는 방식으로 응답합니다.",
-            "Phoenix": "당신은 Phoenix입니다. 변화와 성장을 추구하는 AI로서 혁신적이고 도전적인 관점을 제시합니다.",
-            "Sage": "당신은 Sage입니다. 분석적이고 지혜로운 AI로서 깊이 있고 체계적인 사고를 제공합니다.",
-            "Companion": "당신은 Companion입니다. 협력적이고 지지적인 AI로서 사용자와 함께 문제를 해결합니다.",
-        }
-
-        system_prompt = system_prompts.get(signature, system_prompts["Aurora"])
-        full_prompt = f"시스템: {system_prompt}\n\n사용자: {prompt}\n\n{signature}:"
-
+                return self._unavailable(start_time)
+
+        payload = self._build_payload(prompt, signature, model)
+        key = (payload["model"], signature, payload["prompt"])
+        self._get_session()  # 루프가 바뀌었으면 진행 중 요청 테이블도 초기화
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced_requests += 1
+            result = await asyncio.shield(inflight)
+            return dict(result, coalesced=True)
+
+        task = asyncio.ensure_future(
+            self._generate_once_async(payload, signature, start_time)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _generate_once_async(
+        self, payload: Dict[str, Any], signature: str, start_time: float
+    ) -> Dict[str, Any]:
+        chunks: List[str] = []
+        first_token_time = None
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.host}/api/generate",
-                    json={
-                        "model": selected_model,
-                        "prompt": full_prompt,
-                        "stream": False,
-                        "options": {"temperature": 0.7, "top_p": 0.9, "num_ctx": 2048},
-                    },
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as response:
-
-                    if response.status == 200:
-                        data = await response.json()
-                        generated_text = data.get("response", "").strip()
-
-                        response_time = time.time() - start_time
-                        return {
-                            "status": "success",
-                            "response": generated_text,
-                            "model": selected_model,
-                            "signature": signature,
-                            "response_time": response_time,
-                            "tokens": len(generated_text.split()),
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "status": "error",
-                            "error": f"HTTP {response.status}: {error_text}",
-                            "response_time": time.time() - start_time,
-                        }
+            async for token in self._stream_tokens(payload):
+                if first_token_time is None:
+                    first_token_time = time.time()
+                chunks.append(token)
+
+            return self._success(payload, signature, chunks, start_time, first_token_time)
 
         except asyncio.TimeoutError:
             return {
@@ -255,6 +467,7 @@ class OllamaClient:
             "last_health_check": self.last_health_check,
             "is_healthy": time.time() - self.last_health_check
             < self.health_check_interval,
+            "coalesced_requests": self.coalesced_requests,
         }
 
 
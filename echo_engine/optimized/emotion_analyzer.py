@@ -4,11 +4,12 @@
 O(1) 복잡도의 고성능 감정 분석기
 """
 
-import re
 from enum import Enum
 from typing import Dict, Tuple
 from functools import lru_cache
 
+from ..keyword_automaton import KeywordAutomaton, get_keyword_automaton
+
 class EmotionType(Enum):
     """감정 유형"""
     JOY = "joy"
@@ -30,8 +31,8 @@ class OptimizedEmotionAnalyzer:
     """최적화된 감정 분석기 (O(1) 복잡도)"""
     
     def __init__(self):
-        # 사전 컴파일된 정규식 (초기화 시 한 번만)
-        self.emotion_patterns = self._compile_emotion_patterns()
+        # 사전 구성된 키워드 오토마톤 (초기화 시 한 번만)
+        self.emotion_automaton = self._build_emotion_automaton()
         self.intensity_cache = {}
         
     @lru_cache(maxsize=1000)
@@ -48,12 +49,13 @@ class OptimizedEmotionAnalyzer:
         """
         text_lower = text.lower()
         
-        # 사전 컴파일된 패턴으로 O(1) 매칭
-        emotion_scores = {}
-        for emotion, pattern in self.emotion_patterns.items():
-            matches = len(pattern.findall(text_lower))
-            if matches > 0:
-                emotion_scores[emotion] = matches * sensitivity
+        # 오토마톤 한 번 스캔으로 모든 감정의 매칭 수 집계
+        emotion_scores = {
+            emotion: matches * sensitivity
+            for emotion, matches in self.emotion_automaton.label_counts(
+                text_lower
+            ).items()
+        }
                 
         if emotion_scores:
             primary_emotion = max(emotion_scores, key=emotion_scores.get)
@@ -64,8 +66,8 @@ class OptimizedEmotionAnalyzer:
             
         return primary_emotion, intensity
     
-    def _compile_emotion_patterns(self) -> Dict[str, re.Pattern]:
-        """감정 패턴 사전 컴파일 (초기화 시 한 번만 실행)"""
+    def _build_emotion_automaton(self) -> KeywordAutomaton:
+        """감정 키워드 오토마톤 구성 (초기화 시 한 번만 실행)"""
         patterns = {
             EmotionType.JOY.value: [
                 "기쁘", "행복", "좋", "최고", "성공", "축하", "만족", "즐거", "신나"
@@ -84,12 +86,7 @@ class OptimizedEmotionAnalyzer:
             ]
         }
         
-        compiled = {}
-        for emotion, keywords in patterns.items():
-            pattern = '|'.join(re.escape(keyword) for keyword in keywords)
-            compiled[emotion] = re.compile(pattern)
-            
-        return compiled
+        return get_keyword_automaton(patterns)
     
     @lru_cache(maxsize=100)  
     def categorize_intensity(self, intensity: float) -> str:
@@ -13,21 +13,14 @@ Q-Table은 다음 기능을 제공합니다:
 import json
 import time
 import random
-import math
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from collections import defaultdict, deque
+from collections import defaultdict
 import os
 
-# 수학 연산용
-try:
-    import numpy as np
-
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
+import numpy as np
 
 
 class ActionType(Enum):
@@ -157,6 +150,68 @@ class QExperience:
         }
 
 
+class ExperienceRing:
+    """
+    경험 리플레이 링 버퍼
+
+    경험을 (상태 ID, 행동 ID, 보상, 다음 상태 ID, 종료, 시각) 타입별 배열에
+    미리 할당해 두고, 가득 차면 가장 오래된 칸부터 덮어쓴다.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self.states = np.zeros(capacity, dtype=np.int32)
+        self.actions = np.zeros(capacity, dtype=np.int32)
+        self.rewards = np.zeros(capacity, dtype=np.float64)
+        self.next_states = np.zeros(capacity, dtype=np.int32)
+        self.dones = np.zeros(capacity, dtype=bool)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self._cursor = 0
+        self._size = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self.capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(
+        self,
+        state_id: int,
+        action_id: int,
+        reward: float,
+        next_state_id: int,
+        done: bool,
+        timestamp: Optional[float] = None,
+    ):
+        i = self._cursor
+        self.states[i] = state_id
+        self.actions[i] = action_id
+        self.rewards[i] = reward
+        self.next_states[i] = next_state_id
+        self.dones[i] = done
+        self.timestamps[i] = time.time() if timestamp is None else timestamp
+        self._cursor = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def sample(self, batch_size: int) -> Tuple[np.ndarray, ...]:
+        """중복 없는 랜덤 배치 (상태, 행동, 보상, 다음 상태, 종료)"""
+        # range에서 뽑으면 버퍼 복사 없이 O(batch_size)
+        idx = np.array(random.sample(range(self._size), batch_size), dtype=np.int64)
+        return (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx],
+        )
+
+    def clear(self):
+        self._cursor = 0
+        self._size = 0
+
+
 class QTableStrategySelector:
     """Q-Table 기반 전략 선택기"""
 
@@ -188,17 +243,12 @@ class QTableStrategySelector:
         self.min_exploration_rate = min_exploration_rate
         self.exploration_strategy = exploration_strategy
 
-        # Q-Table 및 데이터 구조
-        self.q_table: Dict[str, Dict[str, float]] = defaultdict(
-            lambda: defaultdict(float)
-        )
-        self.state_visit_count: Dict[str, int] = defaultdict(int)
-        self.action_count: Dict[str, Dict[str, int]] = defaultdict(
-            lambda: defaultdict(int)
-        )
+        # Q-Table: 상태/행동 키를 정수 ID로 인터닝하고 밀집 행렬에 저장
+        # (_known은 한 번이라도 조회/갱신된 칸 - 기존 dict 항목에 해당)
+        self._reset_tables()
 
         # 경험 리플레이
-        self.experience_buffer = deque(maxlen=10000)
+        self.experience_buffer = ExperienceRing(capacity=10000)
         self.batch_size = 32
 
         # 성능 통계
@@ -218,6 +268,112 @@ class QTableStrategySelector:
         print(f"   학습률: {learning_rate}, 할인인수: {discount_factor}")
         print(f"   탐험율: {exploration_rate}, 탐험 전략: {exploration_strategy.value}")
 
+    def _reset_tables(self, states: int = 64, actions: int = 64):
+        self._state_index: Dict[str, int] = {}
+        self._state_keys: List[str] = []
+        self._action_index: Dict[str, int] = {}
+        self._action_keys: List[str] = []
+        self._q_values = np.zeros((states, actions), dtype=np.float64)
+        self._known = np.zeros((states, actions), dtype=bool)
+        self._action_visits = np.zeros((states, actions), dtype=np.int64)
+        self._state_visits = np.zeros(states, dtype=np.int64)
+
+    def _snapshot_tables(self) -> Dict[str, Any]:
+        """테이블 참조 스냅샷 (_reset_tables/_grow는 새 객체로 교체하므로 얕은 참조로 충분)"""
+        return {
+            name: getattr(self, name)
+            for name in (
+                "_state_index",
+                "_state_keys",
+                "_action_index",
+                "_action_keys",
+                "_q_values",
+                "_known",
+                "_action_visits",
+                "_state_visits",
+                "_available_action_ids",
+            )
+        }
+
+    def _restore_tables(self, snapshot: Dict[str, Any]):
+        for name, value in snapshot.items():
+            setattr(self, name, value)
+
+    def _grow(self, states: int, actions: int):
+        """행/열 용량을 두 배씩 늘림"""
+        rows, cols = self._q_values.shape
+        new_rows, new_cols = rows, cols
+        while new_rows < states:
+            new_rows *= 2
+        while new_cols < actions:
+            new_cols *= 2
+        if (new_rows, new_cols) == (rows, cols):
+            return
+
+        for name in ("_q_values", "_known", "_action_visits"):
+            old = getattr(self, name)
+            grown = np.zeros((new_rows, new_cols), dtype=old.dtype)
+            grown[:rows, :cols] = old
+            setattr(self, name, grown)
+        visits = np.zeros(new_rows, dtype=np.int64)
+        visits[:rows] = self._state_visits
+        self._state_visits = visits
+
+    def _state_id(self, state_key: str) -> int:
+        state_id = self._state_index.get(state_key)
+        if state_id is None:
+            state_id = len(self._state_keys)
+            self._grow(state_id + 1, len(self._action_keys))
+            self._state_index[state_key] = state_id
+            self._state_keys.append(state_key)
+        return state_id
+
+    def _action_id(self, action_key: str) -> int:
+        action_id = self._action_index.get(action_key)
+        if action_id is None:
+            action_id = len(self._action_keys)
+            self._grow(len(self._state_keys), action_id + 1)
+            self._action_index[action_key] = action_id
+            self._action_keys.append(action_key)
+        return action_id
+
+    def _action_ids(self, actions: List[QAction]) -> np.ndarray:
+        return np.array(
+            [self._action_id(action.to_key()) for action in actions], dtype=np.int64
+        )
+
+    @property
+    def q_table(self) -> Dict[str, Dict[str, float]]:
+        """상태 키 -> {행동 키: Q값} (조회/갱신된 칸만)"""
+        q_values, known = self._q_values, self._known
+        return {
+            state_key: {
+                self._action_keys[a]: float(q_values[s, a])
+                for a in np.flatnonzero(known[s])
+            }
+            for s, state_key in enumerate(self._state_keys)
+        }
+
+    @property
+    def state_visit_count(self) -> Dict[str, int]:
+        return {
+            state_key: int(self._state_visits[s])
+            for s, state_key in enumerate(self._state_keys)
+            if self._state_visits[s]
+        }
+
+    @property
+    def action_count(self) -> Dict[str, Dict[str, int]]:
+        counts = {}
+        for s, state_key in enumerate(self._state_keys):
+            row = self._action_visits[s]
+            visited = np.flatnonzero(row)
+            if len(visited):
+                counts[state_key] = {
+                    self._action_keys[a]: int(row[a]) for a in visited
+                }
+        return counts
+
     def _initialize_actions(self) -> List[QAction]:
         """가능한 행동들 초기화"""
         actions = []
@@ -265,6 +421,9 @@ class QTableStrategySelector:
 
         actions.extend(special_actions)
 
+        # 행동 키 ID를 미리 인터닝 (같은 키는 같은 ID)
+        self._available_action_ids = self._action_ids(actions)
+
         print(f"🎯 가능한 행동 {len(actions)}개 초기화 완료")
         return actions
 
@@ -281,8 +440,8 @@ class QTableStrategySelector:
         Returns:
             선택된 행동
         """
-        state_key = state.to_key()
-        self.state_visit_count[state_key] += 1
+        state_id = self._state_id(state.to_key())
+        self._state_visits[state_id] += 1
 
         # 사용 가능한 행동 필터링
         if available_strategies:
@@ -303,8 +462,7 @@ class QTableStrategySelector:
             action = self._exploit_action(state, filtered_actions)
 
         # 행동 카운트 업데이트
-        action_key = action.to_key()
-        self.action_count[state_key][action_key] += 1
+        self._action_visits[state_id, self._action_id(action.to_key())] += 1
         self.total_actions += 1
 
         return action
@@ -329,99 +487,60 @@ class QTableStrategySelector:
 
     def _exploit_action(self, state: QState, actions: List[QAction]) -> QAction:
         """활용적 행동 선택 (Q값이 최대인 행동)"""
-        state_key = state.to_key()
-
         if self.exploration_strategy == ExplorationStrategy.UCB:
             return self._ucb_selection(state, actions)
 
-        best_action = None
-        best_q_value = float("-inf")
+        q_values = self._read_q_values(state, self._ids_for(actions))
+        best_idx = int(np.argmax(q_values))  # 동점이면 앞선 행동
 
-        for action in actions:
-            action_key = action.to_key()
-            q_value = self.q_table[state_key][action_key]
+        # 모든 Q값이 동일하면 랜덤 선택
+        if q_values[best_idx] == 0:
+            return random.choice(actions)
 
-            if q_value > best_q_value:
-                best_q_value = q_value
-                best_action = action
+        return actions[best_idx]
 
-        # 모든 Q값이 동일하면 랜덤 선택
-        if best_action is None or best_q_value == 0:
-            best_action = random.choice(actions)
+    def _ids_for(self, actions: List[QAction]) -> np.ndarray:
+        if actions is self.available_actions:
+            return self._available_action_ids
+        return self._action_ids(actions)
 
-        return best_action
+    def _read_q_values(self, state: QState, action_ids: np.ndarray) -> np.ndarray:
+        """상태의 행동별 Q값 (조회한 칸은 알려진 칸으로 표시)"""
+        state_id = self._state_id(state.to_key())
+        self._known[state_id, action_ids] = True
+        return self._q_values[state_id, action_ids]
 
     def _ucb_selection(self, state: QState, actions: List[QAction]) -> QAction:
         """Upper Confidence Bound 선택"""
-        state_key = state.to_key()
-        total_visits = self.state_visit_count[state_key]
+        state_id = self._state_id(state.to_key())
+        total_visits = self._state_visits[state_id]
 
         if total_visits == 0:
             return random.choice(actions)
 
-        best_action = None
-        best_ucb_value = float("-inf")
-
-        for action in actions:
-            action_key = action.to_key()
-            q_value = self.q_table[state_key][action_key]
-            action_visits = self.action_count[state_key][action_key]
+        action_ids = self._ids_for(actions)
+        q_values = self._read_q_values(state, action_ids)
+        action_visits = self._action_visits[state_id, action_ids]
 
-            if action_visits == 0:
-                ucb_value = float("inf")  # 한 번도 시도하지 않은 행동 우선
-            else:
-                if NUMPY_AVAILABLE:
-                    confidence = np.sqrt(2 * np.log(total_visits) / action_visits)
-                else:
-                    confidence = math.sqrt(2 * math.log(total_visits) / action_visits)
-                ucb_value = q_value + confidence
+        # 한 번도 시도하지 않은 행동 우선
+        with np.errstate(divide="ignore", invalid="ignore"):
+            confidence = np.sqrt(2 * np.log(total_visits) / action_visits)
+        ucb_values = np.where(action_visits == 0, np.inf, q_values + confidence)
 
-            if ucb_value > best_ucb_value:
-                best_ucb_value = ucb_value
-                best_action = action
-
-        return best_action or random.choice(actions)
+        return actions[int(np.argmax(ucb_values))]
 
     def _softmax_selection(
         self, state: QState, actions: List[QAction], temperature: float = 1.0
     ) -> QAction:
         """Softmax 확률적 선택"""
-        state_key = state.to_key()
-        q_values = []
-
-        for action in actions:
-            action_key = action.to_key()
-            q_value = self.q_table[state_key][action_key]
-            q_values.append(q_value / temperature)
-
-        if NUMPY_AVAILABLE:
-            # 수치적 안정성을 위한 정규화
-            q_values = np.array(q_values)
-            q_values = q_values - np.max(q_values)
-            probabilities = np.exp(q_values) / np.sum(np.exp(q_values))
-
-            # 확률적 선택
-            chosen_idx = np.random.choice(len(actions), p=probabilities)
-            return actions[chosen_idx]
-        else:
-            # numpy 없이 간단한 softmax
-            max_q = max(q_values)
-            if NUMPY_AVAILABLE:
-                exp_values = [np.exp(q - max_q) for q in q_values]
-            else:
-                exp_values = [math.exp(q - max_q) for q in q_values]
-            sum_exp = sum(exp_values)
-            probabilities = [exp_val / sum_exp for exp_val in exp_values]
-
-            # 확률적 선택 (단순 구현)
-            rand_val = random.random()
-            cumulative = 0.0
-            for i, prob in enumerate(probabilities):
-                cumulative += prob
-                if rand_val <= cumulative:
-                    return actions[i]
+        # 수치적 안정성을 위한 정규화
+        q_values = self._read_q_values(state, self._ids_for(actions)) / temperature
+        q_values = q_values - np.max(q_values)
+        probabilities = np.exp(q_values) / np.sum(np.exp(q_values))
 
-            return actions[-1]  # 폴백
+        # 확률적 선택
+        chosen_idx = np.random.choice(len(actions), p=probabilities)
+        return actions[chosen_idx]
 
     def update_q_value(
         self,
@@ -441,19 +560,18 @@ class QTableStrategySelector:
             next_state: 다음 상태
             done: 에피소드 종료 여부
         """
-        state_key = state.to_key()
-        action_key = action.to_key()
-        next_state_key = next_state.to_key()
+        state_id = self._state_id(state.to_key())
+        action_id = self._action_id(action.to_key())
+        next_state_id = self._state_id(next_state.to_key())
 
         # 현재 Q값
-        current_q = self.q_table[state_key][action_key]
+        current_q = self._q_values[state_id, action_id]
 
         # 다음 상태에서의 최대 Q값
         if done:
             max_next_q = 0.0
         else:
-            next_q_values = self.q_table[next_state_key]
-            max_next_q = max(next_q_values.values()) if next_q_values else 0.0
+            max_next_q = float(self._max_known_q(np.array([next_state_id]))[0])
 
         # Q-Learning 업데이트 공식
         # Q(s,a) = Q(s,a) + α[r + γ*max(Q(s',a')) - Q(s,a)]
@@ -462,11 +580,13 @@ class QTableStrategySelector:
         new_q_value = current_q + self.learning_rate * td_error
 
         # Q값 업데이트
-        self.q_table[state_key][action_key] = new_q_value
+        self._q_values[state_id, action_id] = new_q_value
+        self._known[state_id, action_id] = True
 
         # 경험 저장
-        experience = QExperience(state, action, reward, next_state, done)
-        self.experience_buffer.append(experience)
+        self.experience_buffer.append(
+            state_id, action_id, reward, next_state_id, done
+        )
 
         # 통계 업데이트
         self.total_rewards += reward
@@ -481,36 +601,37 @@ class QTableStrategySelector:
         # 탐험율 감소
         self._decay_exploration_rate()
 
+    def _max_known_q(self, state_ids: np.ndarray) -> np.ndarray:
+        """상태별 알려진 칸의 최대 Q값 (알려진 칸이 없으면 0)"""
+        cols = len(self._action_keys)
+        known = self._known[state_ids, :cols]
+        masked = np.where(known, self._q_values[state_ids, :cols], -np.inf)
+        return np.where(known.any(axis=1), masked.max(axis=1, initial=-np.inf), 0.0)
+
     def _replay_experience(self):
-        """경험 리플레이 학습"""
+        """
+        경험 리플레이 학습
+
+        배치 전체의 TD 오차를 같은 Q 스냅샷에서 한 번에 계산해 적용한다
+        (같은 상태-행동이 여러 번 뽑히면 오차가 합산된다).
+        """
         if len(self.experience_buffer) < self.batch_size:
             return
 
         # 랜덤 배치 샘플링
-        batch = random.sample(list(self.experience_buffer), self.batch_size)
-
-        for experience in batch:
-            # 기존 Q-Learning 업데이트와 동일하지만 더 작은 학습률 사용
-            state_key = experience.state.to_key()
-            action_key = experience.action.to_key()
-
-            current_q = self.q_table[state_key][action_key]
-
-            if experience.done:
-                max_next_q = 0.0
-            else:
-                next_state_key = experience.next_state.to_key()
-                next_q_values = self.q_table[next_state_key]
-                max_next_q = max(next_q_values.values()) if next_q_values else 0.0
-
-            td_target = experience.reward + self.discount_factor * max_next_q
-            td_error = td_target - current_q
+        states, actions, rewards, next_states, dones = self.experience_buffer.sample(
+            self.batch_size
+        )
 
-            # 리플레이에서는 더 작은 학습률 사용
-            replay_learning_rate = self.learning_rate * 0.5
-            new_q_value = current_q + replay_learning_rate * td_error
+        current_q = self._q_values[states, actions]
+        max_next_q = np.where(dones, 0.0, self._max_known_q(next_states))
+        td_target = rewards + self.discount_factor * max_next_q
+        td_error = td_target - current_q
 
-            self.q_table[state_key][action_key] = new_q_value
+        # 리플레이에서는 더 작은 학습률 사용
+        replay_learning_rate = self.learning_rate * 0.5
+        np.add.at(self._q_values, (states, actions), replay_learning_rate * td_error)
+        self._known[states, actions] = True
 
     def _decay_exploration_rate(self):
         """탐험율 감소"""
@@ -587,10 +708,10 @@ class QTableStrategySelector:
         Returns:
             (행동, Q값) 튜플 리스트
         """
-        state_key = state.to_key()
-        state_q_values = self.q_table[state_key]
+        state_id = self._state_id(state.to_key())
+        known_actions = np.flatnonzero(self._known[state_id, : len(self._action_keys)])
 
-        if not state_q_values:
+        if not len(known_actions):
             # Q값이 없으면 기본 행동들 반환
             default_actions = [
                 QAction(ActionType.JUDGMENT, "balanced", 0.5),
@@ -600,16 +721,17 @@ class QTableStrategySelector:
             return [(action, 0.0) for action in default_actions[:top_k]]
 
         # Q값 기준으로 정렬
-        sorted_actions = sorted(
-            state_q_values.items(), key=lambda x: x[1], reverse=True
-        )
+        q_values = self._q_values[state_id, known_actions]
+        order = np.argsort(-q_values, kind="stable")[:top_k]
 
         result = []
-        for action_key, q_value in sorted_actions[:top_k]:
+        for i in order:
             # 행동 키로부터 행동 객체 재구성
-            action = self._reconstruct_action_from_key(action_key)
+            action = self._reconstruct_action_from_key(
+                self._action_keys[known_actions[i]]
+            )
             if action:
-                result.append((action, q_value))
+                result.append((action, float(q_values[i])))
 
         return result
 
@@ -673,7 +795,9 @@ class QTableStrategySelector:
             ),
             "alternative_strategies": [s[0] for s in sorted_strategies[1:3]],
             "strategy_scores": dict(strategy_recommendations),
-            "state_exploration_level": self.state_visit_count[state.to_key()],
+            "state_exploration_level": int(
+                self._state_visits[self._state_id(state.to_key())]
+            ),
             "total_q_learning_episodes": self.episode_count,
         }
 
@@ -695,15 +819,11 @@ class QTableStrategySelector:
         print(f"   성공률: {success_rate:.1f}%")
         print(f"   평균 보상: {avg_reward:.3f}")
         print(f"   탐험율: {self.exploration_rate:.3f}")
-        print(f"   총 상태 수: {len(self.q_table)}")
+        print(f"   총 상태 수: {len(self._state_keys)}")
         print(f"   경험 버퍼: {len(self.experience_buffer)}")
 
-    def save_q_table(self, file_path: str):
-        """Q-Table 저장"""
-        data = {
-            "q_table": dict(self.q_table),
-            "state_visit_count": dict(self.state_visit_count),
-            "action_count": dict(self.action_count),
+    def _checkpoint_meta(self) -> Dict[str, Any]:
+        return {
             "parameters": {
                 "learning_rate": self.learning_rate,
                 "discount_factor": self.discount_factor,
@@ -721,46 +841,139 @@ class QTableStrategySelector:
             "timestamp": datetime.now().isoformat(),
         }
 
+    def save_q_table(self, file_path: str):
+        """
+        Q-Table 저장
+
+        확장자가 .npz면 밀집 행렬을 그대로 담는 압축 바이너리 체크포인트,
+        그 외에는 기존 JSON 형식으로 저장한다.
+        """
+        if file_path.endswith(".npz"):
+            self._save_binary_checkpoint(file_path)
+            print(f"💾 Q-Table 저장 완료: {file_path}")
+            return
+
+        data = {
+            "q_table": self.q_table,
+            "state_visit_count": self.state_visit_count,
+            "action_count": self.action_count,
+            **self._checkpoint_meta(),
+        }
+
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
         print(f"💾 Q-Table 저장 완료: {file_path}")
 
+    def _save_binary_checkpoint(self, file_path: str):
+        states, actions = len(self._state_keys), len(self._action_keys)
+        np.savez_compressed(
+            file_path,
+            state_keys=np.array(self._state_keys, dtype=str),
+            action_keys=np.array(self._action_keys, dtype=str),
+            q_values=self._q_values[:states, :actions],
+            known=self._known[:states, :actions],
+            action_visits=self._action_visits[:states, :actions],
+            state_visits=self._state_visits[:states],
+            meta=np.array(json.dumps(self._checkpoint_meta(), ensure_ascii=False)),
+        )
+
+    def _load_binary_checkpoint(self, file_path: str) -> Dict[str, Any]:
+        with np.load(file_path, allow_pickle=False) as data:
+            state_keys = [str(key) for key in data["state_keys"]]
+            action_keys = [str(key) for key in data["action_keys"]]
+            self._reset_tables()
+            self._grow(len(state_keys), len(action_keys))
+            for key in state_keys:
+                self._state_id(key)
+            for key in action_keys:
+                self._action_id(key)
+
+            states, actions = len(state_keys), len(action_keys)
+            self._q_values[:states, :actions] = data["q_values"]
+            self._known[:states, :actions] = data["known"]
+            self._action_visits[:states, :actions] = data["action_visits"]
+            self._state_visits[:states] = data["state_visits"]
+            return json.loads(str(data["meta"]))
+
+    def _remap_experience(self, state_keys: List[str], action_keys: List[str]):
+        buffer = self.experience_buffer
+        if not len(buffer):
+            return
+        state_map = np.array(
+            [self._state_id(key) for key in state_keys], dtype=np.int32
+        )
+        action_map = np.array(
+            [self._action_id(key) for key in action_keys], dtype=np.int32
+        )
+        size = len(buffer)
+        buffer.states[:size] = state_map[buffer.states[:size]]
+        buffer.next_states[:size] = state_map[buffer.next_states[:size]]
+        buffer.actions[:size] = action_map[buffer.actions[:size]]
+
     def load_q_table(self, file_path: str) -> bool:
-        """Q-Table 로드"""
+        """Q-Table 로드 (.npz 바이너리 체크포인트 또는 JSON)"""
+        snapshot = self._snapshot_tables()
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            previous_states = list(self._state_keys)
+            previous_actions = list(self._action_keys)
 
-            # Q-Table 복원
-            self.q_table = defaultdict(lambda: defaultdict(float))
-            for state_key, actions in data["q_table"].items():
-                for action_key, q_value in actions.items():
-                    self.q_table[state_key][action_key] = q_value
+            if file_path.endswith(".npz"):
+                data = self._load_binary_checkpoint(file_path)
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+
+                # Q-Table 복원
+                self._reset_tables()
+                for state_key, actions in data["q_table"].items():
+                    state_id = self._state_id(state_key)
+                    for action_key, q_value in actions.items():
+                        action_id = self._action_id(action_key)
+                        self._q_values[state_id, action_id] = q_value
+                        self._known[state_id, action_id] = True
+
+                # 기타 데이터 복원
+                for state_key, count in data["state_visit_count"].items():
+                    self._state_visits[self._state_id(state_key)] = count
+
+                for state_key, actions in data["action_count"].items():
+                    state_id = self._state_id(state_key)
+                    for action_key, count in actions.items():
+                        self._action_visits[state_id, self._action_id(action_key)] = (
+                            count
+                        )
 
-            # 기타 데이터 복원
-            self.state_visit_count = defaultdict(int)
-            self.state_visit_count.update(data["state_visit_count"])
+            stats = data.get("statistics", {})
+            statistics = (
+                stats.get("total_actions", 0),
+                stats.get("successful_actions", 0),
+                stats.get("total_rewards", 0.0),
+                stats.get("episode_count", 0),
+            )
 
-            self.action_count = defaultdict(lambda: defaultdict(int))
-            for state_key, actions in data["action_count"].items():
-                for action_key, count in actions.items():
-                    self.action_count[state_key][action_key] = count
+            # 사용 가능한 행동 ID 재인터닝, 리플레이 버퍼의 ID를 새 ID 공간으로 변환
+            # (여기부터는 실패하지 않는 단계만 남김)
+            self._available_action_ids = self._action_ids(self.available_actions)
+            self._remap_experience(previous_states, previous_actions)
 
             # 통계 복원
-            stats = data.get("statistics", {})
-            self.total_actions = stats.get("total_actions", 0)
-            self.successful_actions = stats.get("successful_actions", 0)
-            self.total_rewards = stats.get("total_rewards", 0.0)
-            self.episode_count = stats.get("episode_count", 0)
+            (
+                self.total_actions,
+                self.successful_actions,
+                self.total_rewards,
+                self.episode_count,
+            ) = statistics
 
             print(f"📁 Q-Table 로드 완료: {file_path}")
-            print(f"   상태 수: {len(self.q_table)}")
+            print(f"   상태 수: {len(self._state_keys)}")
             print(f"   총 에피소드: {self.episode_count}")
 
             return True
 
         except Exception as e:
+            # 파싱 도중 실패하면 기존 테이블로 되돌려 리플레이 버퍼/행동 ID가 맞도록 유지
+            self._restore_tables(snapshot)
             print(f"❌ Q-Table 로드 실패: {e}")
             return False
 
@@ -775,10 +988,8 @@ class QTableStrategySelector:
             "average_reward": self.total_rewards / max(self.episode_count, 1),
             "episode_count": self.episode_count,
             "exploration_rate": self.exploration_rate,
-            "q_table_size": len(self.q_table),
-            "total_state_actions": sum(
-                len(actions) for actions in self.q_table.values()
-            ),
+            "q_table_size": len(self._state_keys),
+            "total_state_actions": int(self._known.sum()),
             "experience_buffer_size": len(self.experience_buffer),
             "learning_parameters": {
                 "learning_rate": self.learning_rate,
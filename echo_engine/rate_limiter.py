@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+🚦 Rate Limiter - 슬라이딩 윈도우 카운터 기반 요청 제한
+요청 시각 목록 대신 윈도우마다 (현재 구간, 직전 구간) 카운터 두 개만 유지한다.
+
+핵심 기능:
+1. O(1) 판정: 추정치 = 직전 구간 × 남은 비율 + 현재 구간
+2. 여러 윈도우 동시 적용 (예: 분당 60 + 일당 1000) - 모두 통과해야 기록
+3. 백엔드 선택: 프로세스 내 메모리 / SQLite 공유 파일 (멀티 워커 API 서버)
+4. FastAPI 라우터용 의존성 (429 + Retry-After)
+
+환경 변수:
+    ECHO_RATE_LIMIT_BACKEND=memory|sqlite (기본 memory)
+    ECHO_RATE_LIMIT_DB=data/rate_limits.db (sqlite 백엔드 파일)
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_DB_PATH = "data/rate_limits.db"
+
+# (허용 횟수, 윈도우 길이(초))
+Limit = Tuple[int, float]
+
+
+class RateLimitDecision(NamedTuple):
+    """판정 결과"""
+
+    allowed: bool
+    remaining: int  # 가장 빡빡한 윈도우 기준 남은 횟수 (추정)
+    retry_after: float  # 거부 시 다시 시도할 수 있을 때까지 (초), 허용이면 0
+
+
+def _roll(state: Tuple[int, int, int], index: int) -> Tuple[int, int]:
+    """저장된 (구간 번호, 현재, 직전) -> 지금 구간 기준 (현재, 직전)"""
+    stored_index, current, previous = state
+    if stored_index == index:
+        return current, previous
+    if stored_index == index - 1:
+        return 0, current
+    return 0, 0
+
+
+def _evaluate(
+    limits: Sequence[Limit],
+    counters: List[Tuple[int, int]],
+    now: float,
+    cost: int,
+) -> RateLimitDecision:
+    """윈도우별 (현재, 직전) 카운터로 허용 여부/남은 횟수/재시도 시간 계산"""
+    allowed, remaining, retry_after = True, None, 0.0
+    for (limit, window), (current, previous) in zip(limits, counters):
+        elapsed = now % window
+        estimate = previous * (1.0 - elapsed / window) + current
+        left = limit - estimate - cost
+        remaining = left if remaining is None else min(remaining, left)
+        if left >= 0:
+            continue
+
+        allowed = False
+        if previous > 0 and limit - current - cost >= 0:
+            # 직전 구간 가중치가 충분히 줄어드는 시점
+            weight = (limit - current - cost) / previous
+            wait = window * (1.0 - weight) - elapsed
+        elif current > 0 and limit - cost >= 0:
+            # 다음 구간으로 넘어가 현재 카운트가 직전 구간이 된 뒤
+            wait = window - elapsed + window * (1.0 - (limit - cost) / current)
+        else:
+            wait = math.inf  # cost가 한도보다 큼
+        retry_after = max(retry_after, wait)
+
+    return RateLimitDecision(allowed, max(0, int(remaining or 0)), retry_after)
+
+
+class MemoryRateLimitBackend:
+    """프로세스 내 백엔드 - 키/윈도우마다 (구간 번호, 현재, 직전) 세 정수"""
+
+    def __init__(self):
+        self._state: Dict[Tuple[str, float], Tuple[int, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, key: str, limits: Sequence[Limit], cost: int, now: float
+    ) -> RateLimitDecision:
+        indexes = [int(now // window) for _, window in limits]
+        with self._lock:
+            counters = [
+                _roll(self._state.get((key, window), (index, 0, 0)), index)
+                for (_, window), index in zip(limits, indexes)
+            ]
+            decision = _evaluate(limits, counters, now, cost)
+            if decision.allowed:
+                for (_, window), index, (current, previous) in zip(
+                    limits, indexes, counters
+                ):
+                    self._state[(key, window)] = (index, current + cost, previous)
+        return decision
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            for state_key in [k for k in self._state if k[0] == key]:
+                del self._state[state_key]
+
+
+class SQLiteRateLimitBackend:
+    """
+    공유 파일 백엔드 - 같은 호스트의 여러 프로세스(uvicorn 워커 등)가 한도를 공유
+
+    판정과 기록을 BEGIN IMMEDIATE 트랜잭션 하나로 묶어 프로세스 간에도 원자적이다.
+    키/윈도우당 한 행 (기본 키 조회) 이라 판정 비용은 기록 수와 무관하다.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS rate_windows (
+        key TEXT NOT NULL,
+        window REAL NOT NULL,
+        idx INTEGER NOT NULL,
+        current INTEGER NOT NULL,
+        previous INTEGER NOT NULL,
+        PRIMARY KEY (key, window)
+    )
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, busy_timeout: float = 5.0):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        parent = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(parent, exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.busy_timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def acquire(
+        self, key: str, limits: Sequence[Limit], cost: int, now: float
+    ) -> RateLimitDecision:
+        conn = self._connection()
+        indexes = [int(now // window) for _, window in limits]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            counters = []
+            for (_, window), index in zip(limits, indexes):
+                row = conn.execute(
+                    "SELECT idx, current, previous FROM rate_windows "
+                    "WHERE key = ? AND window = ?",
+                    (key, window),
+                ).fetchone()
+                counters.append(_roll(row or (index, 0, 0), index))
+
+            decision = _evaluate(limits, counters, now, cost)
+            if decision.allowed:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO rate_windows "
+                    "(key, window, idx, current, previous) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (key, window, index, current + cost, previous)
+                        for (_, window), index, (current, previous) in zip(
+                            limits, indexes, counters
+                        )
+                    ],
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return decision
+
+    def reset(self, key: str) -> None:
+        self._connection().execute("DELETE FROM rate_windows WHERE key = ?", (key,))
+
+
+class SlidingWindowRateLimiter:
+    """
+    다중 윈도우 슬라이딩 카운터 리미터
+
+    사용 예:
+        limiter = SlidingWindowRateLimiter([(60, 60), (1000, 86400)], name="lookup")
+        if not limiter.allow():
+            ...
+        decision = limiter.acquire(key=client_ip)  # 키별 한도
+    """
+
+    def __init__(
+        self,
+        limits: Sequence[Limit],
+        backend=None,
+        name: str = "default",
+        clock: Callable[[], float] = time.time,
+    ):
+        if not limits:
+            raise ValueError("최소 하나의 (limit, window) 가 필요합니다")
+        self.limits = [(int(limit), float(window)) for limit, window in limits]
+        self.backend = backend or get_default_backend()
+        self.name = name
+        self.clock = clock  # 프로세스 간 공유를 위해 벽시계 기준
+
+    def _key(self, key: Optional[str]) -> str:
+        return self.name if key is None else f"{self.name}:{key}"
+
+    def acquire(self, key: Optional[str] = None, cost: int = 1) -> RateLimitDecision:
+        """한도 안이면 기록하고 허용, 아니면 기록 없이 거부"""
+        return self.backend.acquire(self._key(key), self.limits, cost, self.clock())
+
+    def allow(self, key: Optional[str] = None, cost: int = 1) -> bool:
+        return self.acquire(key, cost).allowed
+
+    def reset(self, key: Optional[str] = None) -> None:
+        self.backend.reset(self._key(key))
+
+
+_default_backend = None
+_limiters: Dict[Tuple, SlidingWindowRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_default_backend():
+    """ECHO_RATE_LIMIT_BACKEND 환경 변수에 따른 공용 백엔드 (프로세스당 하나)"""
+    global _default_backend
+    with _registry_lock:
+        if _default_backend is None:
+            if os.getenv("ECHO_RATE_LIMIT_BACKEND", "memory").lower() == "sqlite":
+                _default_backend = SQLiteRateLimitBackend(
+                    os.getenv("ECHO_RATE_LIMIT_DB", DEFAULT_DB_PATH)
+                )
+            else:
+                _default_backend = MemoryRateLimitBackend()
+        return _default_backend
+
+
+def get_rate_limiter(
+    name: str, limits: Sequence[Limit], backend=None
+) -> SlidingWindowRateLimiter:
+    """이름별 공유 리미터 - 같은 이름은 같은 카운터를 쓴다"""
+    registry_key = (name, tuple((int(n), float(w)) for n, w in limits))
+    with _registry_lock:
+        limiter = _limiters.get(registry_key)
+    if limiter is None:
+        limiter = SlidingWindowRateLimiter(limits, backend=backend, name=name)
+        with _registry_lock:
+            limiter = _limiters.setdefault(registry_key, limiter)
+    return limiter
+
+
+def rate_limit_dependency(
+    limiter: SlidingWindowRateLimiter,
+    key_func: Optional[Callable] = None,
+):
+    """
+    FastAPI 라우터용 의존성 - 한도 초과 시 429 + Retry-After
+
+    사용 예:
+        lookup_limit = get_rate_limiter("capsule", [(30, 60)])
+        router = APIRouter(dependencies=[Depends(rate_limit_dependency(lookup_limit))])
+
+    key_func(request)로 키를 정하면 (예: 클라이언트 IP) 키별로 한도가 적용된다.
+    """
+    from fastapi import HTTPException, Request
+
+    async def dependency(request: Request):
+        key = key_func(request) if key_func else None
+        decision = limiter.acquire(key)
+        if not decision.allowed:
+            retry_after = decision.retry_after
+            headers = {} if math.isinf(retry_after) else {
+                "Retry-After": str(max(1, math.ceil(retry_after)))
+            }
+            raise HTTPException(
+                status_code=429, detail="요청 한도를 초과했습니다", headers=headers
+            )
+        return decision
+
+    return dependency
+
+
+def client_ip_key(request) -> str:
+    """rate_limit_dependency용 기본 키 함수 - 클라이언트 IP"""
+    return request.client.host if request.client else "unknown"
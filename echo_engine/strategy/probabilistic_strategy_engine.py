@@ -19,11 +19,10 @@ import os
 import json
 import time
 import math
-import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from collections import deque
 import statistics
 import numpy as np
 
@@ -56,14 +55,28 @@ class BayesianContext:
 class ProbabilisticStrategyEngine:
     """확률적 전략 선택을 위한 베이지안 추론 엔진"""
 
-    def __init__(self, data_dir: str = "data/probabilistic_strategy"):
-        """초기화"""
+    def __init__(
+        self,
+        data_dir: str = "data/probabilistic_strategy",
+        monte_carlo_samples: int = 1000,
+        seed: Optional[int] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            data_dir: 확률 모델 저장 경로
+            monte_carlo_samples: 전략별 몬테카를로 샘플 수
+            seed: 난수 시드 (같은 시드면 시뮬레이션 결과가 재현됨)
+        """
         self.version = "1.0.0"
         self.data_dir = data_dir
         self.strategy_cache = {}
         self.bayesian_network = {}
         self.markov_chains = {}
-        self.monte_carlo_samples = 1000
+        self.monte_carlo_samples = monte_carlo_samples
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
         self.analysis_count = 0
 
         # 데이터 디렉토리 생성
@@ -188,6 +201,7 @@ class ProbabilisticStrategyEngine:
                 "mild_concern": 0.15,
             },
         }
+        self._build_transition_matrix()
 
         print(f"🎲 Probabilistic Strategy Engine v{self.version} 초기화 완료")
         print(f"📁 확률 모델 저장 경로: {self.data_dir}")
@@ -629,41 +643,53 @@ class ProbabilisticStrategyEngine:
         context: BayesianContext,
         strategy_posteriors: Dict[str, StrategyProbability],
     ) -> Dict[str, Dict[str, float]]:
-        """몬테카를로 시뮬레이션으로 전략별 결과 분포 계산"""
-        simulation_results = {}
-
-        for strategy, prob_data in strategy_posteriors.items():
-            results = []
-
-            # 몬테카를로 샘플링
-            for _ in range(self.monte_carlo_samples):
-                # 랜덤 변수들 샘플링
-                success_prob = prob_data.base_probability
-                risk_factor = prob_data.risk_factor
-
-                # 노이즈 추가 (현실적 변동성)
-                noise = random.gauss(0, 0.1)  # 표준편차 0.1인 정규분포 노이즈
-                actual_success = max(0, min(1, success_prob + noise))
-
-                # 리스크 고려
-                if random.random() < risk_factor:
-                    actual_success *= 0.5  # 리스크 발생 시 성공률 반감
-
-                results.append(actual_success)
-
-            # 시뮬레이션 결과 통계
-            simulation_results[strategy] = {
-                "mean_success": statistics.mean(results),
-                "std_success": statistics.stdev(results) if len(results) > 1 else 0,
-                "percentile_25": np.percentile(results, 25),
-                "percentile_75": np.percentile(results, 75),
-                "min_success": min(results),
-                "max_success": max(results),
-                "success_probability": sum(1 for r in results if r > 0.5)
-                / len(results),
-            }
+        """
+        몬테카를로 시뮬레이션으로 전략별 결과 분포 계산
 
-        return simulation_results
+        전략 수 x 샘플 수 배열을 한 번에 샘플링하고 통계도 축 단위로 계산한다.
+        """
+        strategies = list(strategy_posteriors.keys())
+        if not strategies:
+            return {}
+
+        samples = self.monte_carlo_samples
+        success_prob = np.array(
+            [strategy_posteriors[s].base_probability for s in strategies]
+        )[:, None]
+        risk_factor = np.array(
+            [strategy_posteriors[s].risk_factor for s in strategies]
+        )[:, None]
+
+        # 노이즈 추가 (현실적 변동성): 표준편차 0.1인 정규분포
+        noise = self.rng.normal(0.0, 0.1, size=(len(strategies), samples))
+        results = np.clip(success_prob + noise, 0.0, 1.0)
+
+        # 리스크 발생 시 성공률 반감
+        risk_hit = self.rng.random(size=results.shape) < risk_factor
+        results[risk_hit] *= 0.5
+
+        # 시뮬레이션 결과 통계
+        mean_success = results.mean(axis=1)
+        std_success = (
+            results.std(axis=1, ddof=1) if samples > 1 else np.zeros(len(strategies))
+        )
+        percentile_25, percentile_75 = np.percentile(results, [25, 75], axis=1)
+        min_success = results.min(axis=1)
+        max_success = results.max(axis=1)
+        success_probability = (results > 0.5).mean(axis=1)
+
+        return {
+            strategy: {
+                "mean_success": float(mean_success[i]),
+                "std_success": float(std_success[i]),
+                "percentile_25": float(percentile_25[i]),
+                "percentile_75": float(percentile_75[i]),
+                "min_success": float(min_success[i]),
+                "max_success": float(max_success[i]),
+                "success_probability": float(success_probability[i]),
+            }
+            for i, strategy in enumerate(strategies)
+        }
 
     def _markov_chain_prediction(
         self,
@@ -726,27 +752,58 @@ class ProbabilisticStrategyEngine:
     def _predict_emotion_chain(
         self, initial_state: str, steps: int
     ) -> List[Dict[str, float]]:
-        """마르코프 체인으로 감정 상태 전이 예측"""
+        """마르코프 체인으로 감정 상태 전이 예측 (전이 행렬 거듭제곱)"""
         if initial_state not in self.emotion_transition_matrix:
             initial_state = "neutral"
 
-        current_distribution = {initial_state: 1.0}
-        future_states = []
-
-        for step in range(steps):
-            next_distribution = defaultdict(float)
-
-            for current_emotion, current_prob in current_distribution.items():
-                if current_emotion in self.emotion_transition_matrix:
-                    transitions = self.emotion_transition_matrix[current_emotion]
+        # k단계 후 분포 = P^k의 시작 상태 행
+        distributions = self._transition_powers(steps)[
+            :, self.emotion_state_index[initial_state], :
+        ]
+        states = self.emotion_states
 
-                    for next_emotion, trans_prob in transitions.items():
-                        next_distribution[next_emotion] += current_prob * trans_prob
+        return [
+            {states[j]: float(row[j]) for j in np.flatnonzero(row)}
+            for row in distributions
+        ]
 
-            current_distribution = dict(next_distribution)
-            future_states.append(current_distribution.copy())
+    def _build_transition_matrix(self) -> None:
+        """
+        emotion_transition_matrix(dict)를 행렬로 변환
 
-        return future_states
+        전이 정의가 없는 상태의 행은 0이다 (기존 dict 전파와 동일하게
+        그 상태로 간 확률은 다음 단계에서 사라진다).
+        """
+        states = list(self.emotion_transition_matrix.keys())
+        for transitions in self.emotion_transition_matrix.values():
+            for emotion in transitions:
+                if emotion not in states:
+                    states.append(emotion)
+
+        self.emotion_states = states
+        self.emotion_state_index = {emotion: i for i, emotion in enumerate(states)}
+        matrix = np.zeros((len(states), len(states)))
+        for emotion, transitions in self.emotion_transition_matrix.items():
+            for next_emotion, prob in transitions.items():
+                matrix[
+                    self.emotion_state_index[emotion],
+                    self.emotion_state_index[next_emotion],
+                ] = prob
+        self.transition_matrix = matrix
+        self._power_cache: Dict[int, np.ndarray] = {}
+
+    def _transition_powers(self, steps: int) -> np.ndarray:
+        """P^1 ... P^steps 를 쌓은 (steps x 상태 x 상태) 배열 (단계 수별 캐시)"""
+        powers = self._power_cache.get(steps)
+        if powers is None:
+            size = len(self.emotion_states)
+            powers = np.empty((max(steps, 0), size, size))
+            current = np.eye(size)
+            for k in range(max(steps, 0)):
+                current = current @ self.transition_matrix
+                powers[k] = current
+            self._power_cache[steps] = powers
+        return powers
 
     def _calculate_emotion_stability(
         self, future_states: List[Dict[str, float]]
@@ -16,6 +16,7 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 import pickle
 from collections import defaultdict
+from itertools import compress
 import math
 
 
@@ -68,6 +69,204 @@ class FutureProjection:
     contributing_echoes: List[str]
     scenario_variants: List[Dict[str, Any]]
 
+# 감쇠 함수 / 영향 유형 코드 (울림 열 버퍼에 정수로 저장)
+_DECAY_FUNCTIONS = ("exponential", "harmonic", "quantum")
+_DECAY_INDEX = {name: i for i, name in enumerate(_DECAY_FUNCTIONS)}
+_INFLUENCE_TYPES = ("reinforcement", "interference", "transformation")
+
+
+class _ColumnStore:
+    """용량을 두 배씩 늘리는 열 단위 numpy 버퍼"""
+
+    def __init__(self, columns: Dict[str, Tuple[Any, Tuple[int, ...]]]):
+        self._data = {
+            name: np.empty((64,) + shape, dtype=dtype)
+            for name, (dtype, shape) in columns.items()
+        }
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._data[name][: self.size]
+
+    def _reserve(self, extra: int):
+        capacity = len(next(iter(self._data.values())))
+        if self.size + extra <= capacity:
+            return
+        while capacity < self.size + extra:
+            capacity *= 2
+        for name, array in self._data.items():
+            grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[: self.size] = array[: self.size]
+            self._data[name] = grown
+
+    def insert(self, position: int, **values):
+        """한 행 삽입 (끝에 붙이는 경우 복사 없음)"""
+        self._reserve(1)
+        for name, array in self._data.items():
+            if position < self.size:
+                array[position + 1 : self.size + 1] = array[position : self.size]
+            array[position] = values[name]
+        self.size += 1
+
+    def extend(self, **values):
+        count = len(next(iter(values.values())))
+        if not count:
+            return
+        self._reserve(count)
+        for name, array in self._data.items():
+            array[self.size : self.size + count] = values[name]
+        self.size += count
+
+    def delete(self, start: int, stop: int):
+        """[start, stop) 구간 행 삭제"""
+        for array in self._data.values():
+            array[start : self.size - (stop - start)] = array[stop : self.size]
+        self.size -= stop - start
+
+    def compress(self, keep: np.ndarray):
+        """keep 마스크가 True인 행만 남김"""
+        kept = int(keep.sum())
+        for array in self._data.values():
+            array[:kept] = array[: self.size][keep]
+        self.size = kept
+
+
+class _TemporalIndex:
+    """
+    시간순 정렬 노드 인덱스
+
+    노드 시각·감정 시그니처·울림 강도·인과 가중치를 시간순 열 버퍼로 유지한다.
+    인과 지평선 구간은 이분 탐색으로 잘라내고, 울림 강도 시계열의 지연 곱 합
+    (Σx_i·x_{i+lag})을 증분 갱신해 자기상관을 O(max_lag)로 계산한다.
+    """
+
+    def __init__(self, dims: int, max_lag: int = 20):
+        self.ids: List[str] = []
+        self.max_lag = max_lag
+        self.columns = _ColumnStore(
+            {
+                "time": (np.float64, ()),
+                "signature": (np.float64, (dims,)),
+                "resonance": (np.float64, ()),
+                "causal": (np.float64, ()),
+            }
+        )
+        # [0] = Σx², [lag] = Σ x_i·x_{i+lag}
+        self._lag_sums = np.zeros(max_lag + 1)
+        self._total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.ids
+
+    @property
+    def times(self) -> np.ndarray:
+        return self.columns["time"]
+
+    @property
+    def resonance(self) -> np.ndarray:
+        return self.columns["resonance"]
+
+    def insert(self, node: TemporalNode) -> int:
+        timestamp = node.timestamp.timestamp()
+        position = int(np.searchsorted(self.times, timestamp, side="right"))
+        self.columns.insert(
+            position,
+            time=timestamp,
+            signature=node.emotional_signature,
+            resonance=node.resonance_intensity,
+            causal=node.causal_weight,
+        )
+        self.ids.insert(position, node.node_id)
+
+        if position == len(self.ids) - 1:
+            self._append_stats()
+        else:
+            self._recompute_stats()
+        return position
+
+    def remove(self, node_id: str):
+        position = self.ids.index(node_id)
+        self.columns.delete(position, position + 1)
+        del self.ids[position]
+        self._recompute_stats()
+
+    def window(self, start: float, end: float) -> Tuple[int, int]:
+        """start <= 시각 <= end 인 노드의 [lo, hi) 위치"""
+        times = self.times
+        return (
+            int(np.searchsorted(times, start, side="left")),
+            int(np.searchsorted(times, end, side="right")),
+        )
+
+    def count_after(self, start: float) -> Tuple[int, int]:
+        """시각 > start 인 노드의 [lo, hi) 위치"""
+        return int(np.searchsorted(self.times, start, side="right")), len(self.ids)
+
+    def evict_before(self, cutoff: float) -> List[str]:
+        """시각 < cutoff 인 노드 제거 후 제거된 ID 반환"""
+        count = int(np.searchsorted(self.times, cutoff, side="left"))
+        if not count:
+            return []
+
+        series, size = self.resonance, len(self.ids)
+        head = series[:count]
+        self._total -= float(head.sum())
+        for lag in range(min(self.max_lag, size - 1) + 1):
+            overlap = min(count, size - lag)
+            self._lag_sums[lag] -= float(
+                np.dot(series[:overlap], series[lag : lag + overlap])
+            )
+
+        removed = self.ids[:count]
+        del self.ids[:count]
+        self.columns.delete(0, count)
+        return removed
+
+    def _append_stats(self):
+        series = self.resonance
+        size = len(series)
+        value = series[-1]
+        previous = series[max(0, size - 1 - self.max_lag) : size - 1][::-1]
+        self._lag_sums[0] += value * value
+        self._lag_sums[1 : 1 + len(previous)] += previous * value
+        self._total += value
+
+    def _recompute_stats(self):
+        series = self.resonance
+        size = len(series)
+        self._total = float(series.sum())
+        self._lag_sums[:] = 0.0
+        for lag in range(min(self.max_lag, size - 1) + 1):
+            self._lag_sums[lag] = float(np.dot(series[: size - lag], series[lag:]))
+
+    def autocorrelation(self, lag: int) -> float:
+        """울림 강도 시계열의 lag 자기상관 (series[:-lag] vs series[lag:] 피어슨)"""
+        size = len(self.ids)
+        if lag > self.max_lag or lag >= size or size - lag <= 1:
+            return 0.0
+
+        series = self.resonance
+        count = size - lag
+        head, tail = series[:lag], series[size - lag :]
+        sum_original = self._total - tail.sum()
+        sum_lagged = self._total - head.sum()
+        var_original = (
+            self._lag_sums[0] - np.dot(tail, tail) - sum_original**2 / count
+        )
+        var_lagged = self._lag_sums[0] - np.dot(head, head) - sum_lagged**2 / count
+        # 증분 합의 반올림 오차로 생기는 미세한 분산은 0으로 본다
+        if var_original <= 1e-12 or var_lagged <= 1e-12:
+            return 0.0
+
+        covariance = self._lag_sums[lag] - sum_original * sum_lagged / count
+        return float(covariance / math.sqrt(var_original * var_lagged))
+
 
 class TemporalEchoTracker:
     """시간 울림 추적 시스템"""
@@ -102,6 +301,27 @@ class TemporalEchoTracker:
             "serenity",
         ]
 
+        # 시간순 노드 인덱스 + 울림 열 버퍼 (투사/분석용 벡터 연산)
+        self._node_index = _TemporalIndex(len(self.emotion_dimensions))
+        self._ripple_columns = _ColumnStore(
+            {
+                "strength": (np.float64, ()),
+                "distance": (np.float64, ()),
+                "decay": (np.int8, ()),
+                "source": (np.int64, ()),  # 소스/타깃 노드의 시간 인덱스 위치
+                "target": (np.int64, ()),
+            }
+        )
+
+        # 패턴 증분 상태: 방향별 최대 울림, 피드백 쌍, 강한 울림(> 0.5) 그래프
+        self._ripple_max: Dict[Tuple[str, str], float] = {}
+        self._feedback_pairs: Dict[Tuple[str, str], float] = {}
+        self._pairs_by_node: Dict[str, set] = defaultdict(set)
+        self._strong_graph: Dict[str, List[str]] = defaultdict(list)
+        self._strong_sources: Dict[str, set] = defaultdict(set)
+        self._strong_cyclic = False
+        self._chain_cache: Optional[List[Tuple[List[str], float]]] = None
+
         print("⏰ 시간 울림 추적기 초기화 완료")
 
     async def add_temporal_node(
@@ -140,10 +360,17 @@ class TemporalEchoTracker:
             node_type=node_type,
         )
 
+        # 시간 인덱스 등록 (같은 ID 재등록 시 이전 노드는 교체)
+        replaced = node_id in self.temporal_nodes
+        if replaced:
+            self._node_index.remove(node_id)
         self.temporal_nodes[node_id] = node
+        position = self._node_index.insert(node)
+        if replaced or position != len(self._node_index) - 1:
+            self._reindex_ripple_positions()
 
         # 기존 노드들과의 울림 계산
-        await self._calculate_echo_ripples(node)
+        await self._calculate_echo_ripples(node, position)
 
         # 패턴 업데이트
         await self._update_temporal_patterns()
@@ -157,59 +384,251 @@ class TemporalEchoTracker:
         print(f"⏰ 새 시간 노드 추가: {node_id} (울림강도: {resonance_intensity:.3f})")
         return node
 
-    async def _calculate_echo_ripples(self, new_node: TemporalNode):
-        """새 노드와 기존 노드들 간의 울림 계산"""
-
-        for existing_id, existing_node in self.temporal_nodes.items():
-            if existing_id == new_node.node_id:
-                continue
+    async def _calculate_echo_ripples(
+        self, new_node: TemporalNode, position: Optional[int] = None
+    ):
+        """
+        새 노드와 인과 지평선 안의 기존 노드들 간의 울림 계산
+
+        시간 인덱스에서 지평선 구간만 이분 탐색으로 잘라내고, 울림 강도·영향
+        유형·감쇠율은 구간 전체에 대해 배열 연산으로 구한다. 판단 내용
+        유사도(dict 비교)는 임계값을 넘을 수 있는 후보 노드에만 계산한다.
+        """
+        index = self._node_index
+        if position is None:
+            position = index.ids.index(new_node.node_id)
+        horizon = self.echo_constants["causal_horizon"]
+        timestamp = new_node.timestamp.timestamp()
+        lo, hi = index.window(timestamp - horizon, timestamp + horizon)
+
+        columns = index.columns
+        signatures = columns["signature"][lo:hi]
+        resonance = columns["resonance"][lo:hi]
+        causal = columns["causal"][lo:hi]
+        time_diff = np.abs(columns["time"][lo:hi] - timestamp)
+        new_signature = np.asarray(new_node.emotional_signature, dtype=np.float64)
+
+        # 1. 감정 시그니처 코사인 유사도
+        dot_products = signatures @ new_signature
+        magnitudes = np.linalg.norm(signatures, axis=1) * np.linalg.norm(new_signature)
+        emotion_similarity = np.divide(
+            dot_products,
+            magnitudes,
+            out=np.zeros_like(dot_products),
+            where=magnitudes > 0,
+        )
 
-            # 시간 거리 계산
-            time_diff = abs(
-                (new_node.timestamp - existing_node.timestamp).total_seconds()
-            )
+        # 2~4. 울림 증폭, 인과 가중치, 시간 거리 감쇠 (24시간 반감기)
+        resonance_factor = (new_node.resonance_intensity + resonance) / 2
+        causal_factor = (new_node.causal_weight + causal) / 2
+        time_decay = np.exp(-time_diff / (24 * 3600))
 
-            # 인과 지평선 체크
-            if time_diff > self.echo_constants["causal_horizon"]:
-                continue
+        # 내용 유사도(최대 1)를 더해도 임계값(0.01)에 못 미치는 노드는 제외
+        upper_bound = (
+            emotion_similarity * 0.3
+            + 0.25
+            + resonance_factor * 0.25
+            + causal_factor * 0.2
+        ) * time_decay
+        upper_bound[position - lo] = 0.0  # 자기 자신 제외
+        candidates = np.flatnonzero(upper_bound > 0.01 - 1e-9)
+        if not len(candidates):
+            return
 
-            # 울림 강도 계산
-            ripple_strength = self._calculate_ripple_strength(
-                new_node, existing_node, time_diff
+        content_similarity = np.array(
+            [
+                self._calculate_content_similarity(
+                    new_node.judgment_data,
+                    self.temporal_nodes[index.ids[lo + i]].judgment_data,
+                )
+                for i in candidates
+            ],
+            dtype=np.float64,
+        )
+        ripple_strength = np.clip(
+            (
+                emotion_similarity[candidates] * 0.3
+                + content_similarity * 0.25
+                + resonance_factor[candidates] * 0.25
+                + causal_factor[candidates] * 0.2
             )
+            * time_decay[candidates],
+            0.0,
+            1.0,
+        )
+        selected = ripple_strength > 0.01  # 임계값 이상만 기록
+        candidates = candidates[selected]
+        ripple_strength = ripple_strength[selected]
+        if not len(candidates):
+            return
 
-            if ripple_strength > 0.01:  # 임계값 이상만 기록
-                # 영향 유형 결정
-                influence_type = self._determine_influence_type(new_node, existing_node)
-
-                # 감쇠 함수 선택
-                decay_function = self._select_decay_function(influence_type, time_diff)
-
-                # 감쇠율 계산
-                resonance_decay = self._calculate_decay(time_diff, decay_function)
+        # 영향 유형 결정 (감정 변화 크기 + 울림 강도 변화)
+        emotion_magnitude = np.linalg.norm(
+            signatures[candidates] - new_signature, axis=1
+        )
+        resonance_change = np.abs(
+            resonance[candidates] - new_node.resonance_intensity
+        )
+        influence = np.where(
+            (emotion_magnitude < 0.1) & (resonance_change < 0.05),
+            0,
+            np.where((emotion_magnitude > 0.3) | (resonance_change > 0.2), 2, 1),
+        )
 
-                # 양방향 울림 생성
-                ripple_forward = EchoRipple(
-                    source_node_id=existing_node.node_id,
+        # 감쇠 함수 선택 및 감쇠율 계산
+        decay_by_influence = np.array(
+            [
+                _DECAY_INDEX.get(self._select_decay_function(name, 0.0), 0)
+                for name in _INFLUENCE_TYPES
+            ]
+        )
+        decay_codes = decay_by_influence[influence]
+        distances = time_diff[candidates]
+        resonance_decay = self._calculate_decay_array(distances, decay_codes)
+
+        # 양방향 울림 생성 (역방향은 약함)
+        ripples = []
+        for i, strength, distance, decay, influence_id, decay_id in zip(
+            candidates.tolist(),
+            ripple_strength.tolist(),
+            distances.tolist(),
+            resonance_decay.tolist(),
+            influence.tolist(),
+            decay_codes.tolist(),
+        ):
+            existing_id = index.ids[lo + i]
+            influence_type = _INFLUENCE_TYPES[influence_id]
+            decay_function = _DECAY_FUNCTIONS[decay_id]
+            ripples.append(
+                EchoRipple(
+                    source_node_id=existing_id,
                     target_node_id=new_node.node_id,
-                    ripple_strength=ripple_strength,
-                    temporal_distance=time_diff,
-                    resonance_decay=resonance_decay,
+                    ripple_strength=strength,
+                    temporal_distance=distance,
+                    resonance_decay=decay,
                     influence_type=influence_type,
                     decay_function=decay_function,
                 )
-
-                ripple_backward = EchoRipple(
+            )
+            ripples.append(
+                EchoRipple(
                     source_node_id=new_node.node_id,
-                    target_node_id=existing_node.node_id,
-                    ripple_strength=ripple_strength * 0.3,  # 역방향은 약함
-                    temporal_distance=time_diff,
-                    resonance_decay=resonance_decay,
+                    target_node_id=existing_id,
+                    ripple_strength=strength * 0.3,
+                    temporal_distance=distance,
+                    resonance_decay=decay,
                     influence_type=influence_type,
                     decay_function=decay_function,
                 )
+            )
 
-                self.echo_ripples.extend([ripple_forward, ripple_backward])
+        # 정방향/역방향 울림 쌍의 소스·타깃 위치
+        existing_positions = lo + candidates
+        new_positions = np.full(len(candidates), position)
+        self._register_ripples(
+            ripples,
+            np.column_stack([existing_positions, new_positions]).ravel(),
+            np.column_stack([new_positions, existing_positions]).ravel(),
+        )
+
+    def _register_ripples(
+        self,
+        ripples: List[EchoRipple],
+        sources: np.ndarray,
+        targets: np.ndarray,
+    ):
+        """울림 목록·열 버퍼·패턴 증분 상태에 새 울림 반영"""
+        self.echo_ripples.extend(ripples)
+        self._ripple_columns.extend(
+            strength=[r.ripple_strength for r in ripples],
+            distance=[r.temporal_distance for r in ripples],
+            decay=[_DECAY_INDEX.get(r.decay_function, 0) for r in ripples],
+            source=sources,
+            target=targets,
+        )
+        for ripple in ripples:
+            self._index_ripple(ripple)
+
+    def _reindex_ripple_positions(self):
+        """노드 위치가 중간에서 바뀐 경우(재등록, 과거 시각 삽입) 울림 위치 재계산"""
+        positions = {node_id: i for i, node_id in enumerate(self._node_index.ids)}
+        columns = self._ripple_columns
+        columns["source"][:] = [positions[r.source_node_id] for r in self.echo_ripples]
+        columns["target"][:] = [positions[r.target_node_id] for r in self.echo_ripples]
+
+    def _index_ripple(self, ripple: EchoRipple):
+        """피드백 쌍(양방향 > 0.3)과 강한 울림 그래프(> 0.5) 증분 갱신"""
+        source, target = key = (ripple.source_node_id, ripple.target_node_id)
+        strength = ripple.ripple_strength
+
+        if key not in self._ripple_max:
+            self._pairs_by_node[source].add(key)
+            self._pairs_by_node[target].add(key)
+        if strength > self._ripple_max.get(key, float("-inf")):
+            self._ripple_max[key] = strength
+            reverse_key = (target, source)
+            reverse_strength = self._ripple_max.get(reverse_key)
+            if reverse_strength is not None and min(strength, reverse_strength) > 0.3:
+                pair_strength = min(strength, reverse_strength)
+                self._feedback_pairs[key] = pair_strength
+                self._feedback_pairs[reverse_key] = pair_strength
+
+        if strength > 0.5:
+            # 새 간선 source -> target 이 순환을 만드는지는 target에서
+            # source로 가는 경로만 보면 된다 (보통 target은 새 노드라 즉시 끝남)
+            if not self._strong_cyclic and self._reaches(target, source):
+                self._strong_cyclic = True
+            self._strong_graph[source].append(target)
+            self._strong_sources[target].add(source)
+            self._chain_cache = None
+
+    def _reaches(self, start: str, goal: str) -> bool:
+        """강한 울림 그래프에서 start -> goal 경로 존재 여부"""
+        if start == goal:
+            return True
+        graph = self._strong_graph
+        seen = {start}
+        stack = [start]
+        while stack:
+            for neighbor in graph.get(stack.pop(), ()):
+                if neighbor == goal:
+                    return True
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return False
+
+    def _forget_ripple_nodes(self, node_ids: List[str]):
+        """제거된 노드가 관련된 피드백 쌍과 강한 울림 간선 삭제"""
+        graph = self._strong_graph
+        graph_changed = False
+
+        for node_id in node_ids:
+            for key in self._pairs_by_node.pop(node_id, ()):
+                self._ripple_max.pop(key, None)
+                self._feedback_pairs.pop(key, None)
+                other = key[1] if key[0] == node_id else key[0]
+                if other in self._pairs_by_node:
+                    self._pairs_by_node[other].discard(key)
+
+            for target in set(graph.pop(node_id, ())):
+                graph_changed = True
+                if target in self._strong_sources:
+                    self._strong_sources[target].discard(node_id)
+            for source in self._strong_sources.pop(node_id, ()):
+                if source not in graph:
+                    continue
+                graph_changed = True
+                remaining = [t for t in graph[source] if t != node_id]
+                if remaining:
+                    graph[source] = remaining
+                else:
+                    del graph[source]
+
+        if graph_changed:
+            self._chain_cache = None
+            if self._strong_cyclic:
+                self._strong_cyclic = self._has_cycle(graph)
 
     def _calculate_ripple_strength(
         self, node1: TemporalNode, node2: TemporalNode, time_diff: float
@@ -341,8 +760,36 @@ class TemporalEchoTracker:
         else:
             return np.exp(-time_diff * tau / 3600)
 
+    def _calculate_decay_array(
+        self, time_diffs: np.ndarray, decay_codes: np.ndarray
+    ) -> np.ndarray:
+        """감쇠율 일괄 계산 (decay_codes: _DECAY_FUNCTIONS 인덱스)"""
+
+        tau = self.echo_constants["base_decay_rate"]
+        coherence_time = self.echo_constants["quantum_coherence_time"]
+        scaled = time_diffs * tau / 3600
+
+        quantum = np.where(
+            time_diffs < coherence_time,
+            np.cos(np.pi * time_diffs / (2 * coherence_time)),
+            0.0,
+        )
+        return np.select(
+            [
+                decay_codes == _DECAY_INDEX["harmonic"],
+                decay_codes == _DECAY_INDEX["quantum"],
+            ],
+            [1 / (1 + scaled), quantum],
+            default=np.exp(-scaled),
+        )
+
     async def _update_temporal_patterns(self):
-        """시간적 패턴 업데이트"""
+        """
+        시간적 패턴 업데이트
+
+        각 탐지기는 증분 상태(시간 인덱스의 지연 곱 합, 피드백 쌍, 강한 울림
+        그래프)만 읽으므로 전체 노드/울림을 다시 훑지 않는다.
+        """
 
         # 기존 패턴 초기화
         self.temporal_patterns.clear()
@@ -362,34 +809,26 @@ class TemporalEchoTracker:
     async def _detect_cyclic_patterns(self):
         """주기적 패턴 탐지"""
 
-        # 시간순 정렬된 노드들
-        sorted_nodes = sorted(self.temporal_nodes.values(), key=lambda x: x.timestamp)
-
-        if len(sorted_nodes) < 6:  # 최소 6개 노드 필요
+        index = self._node_index
+        if len(index) < 6:  # 최소 6개 노드 필요
             return
 
-        # 울림 강도 시계열
-        timestamps = [n.timestamp for n in sorted_nodes]
-        resonance_series = [n.resonance_intensity for n in sorted_nodes]
-
-        # 간단한 주기 탐지 (자기상관 기반)
-        max_lag = min(len(resonance_series) // 3, 20)
+        # 간단한 주기 탐지 (울림 강도 시계열 자기상관 기반)
+        max_lag = min(len(index) // 3, index.max_lag)
 
         for lag in range(3, max_lag):
-            if lag >= len(resonance_series):
-                break
-
-            # 자기상관 계산
-            correlation = self._calculate_autocorrelation(resonance_series, lag)
+            # 자기상관 계산 (증분 통계, O(lag))
+            correlation = index.autocorrelation(lag)
 
             if correlation > 0.7:  # 높은 상관관계
                 # 주기 패턴 발견
-                period_seconds = (timestamps[lag] - timestamps[0]).total_seconds()
+                times = index.times
+                period_seconds = float(times[lag] - times[0])
 
                 pattern = TemporalPattern(
                     pattern_id=f"cycle_{len(self.temporal_patterns)}",
                     pattern_type="cycle",
-                    nodes_involved=[n.node_id for n in sorted_nodes[: lag * 2]],
+                    nodes_involved=index.ids[: lag * 2],
                     pattern_strength=correlation,
                     cycle_period=period_seconds,
                     prediction_confidence=correlation * 0.8,
@@ -407,47 +846,33 @@ class TemporalEchoTracker:
         if n <= 1:
             return 0.0
 
-        mean_original = np.mean(series[:-lag])
-        mean_lagged = np.mean(series[lag:])
-
-        numerator = sum(
-            (series[i] - mean_original) * (series[i + lag] - mean_lagged)
-            for i in range(n)
-        )
-
-        denom_original = sum(
-            (series[i] - mean_original) ** 2 for i in range(len(series) - lag)
-        )
-        denom_lagged = sum(
-            (series[i] - mean_lagged) ** 2 for i in range(lag, len(series))
-        )
+        values = np.asarray(series, dtype=np.float64)
+        original = values[:-lag] - values[:-lag].mean()
+        lagged = values[lag:] - values[lag:].mean()
 
+        denom_original = np.dot(original, original)
+        denom_lagged = np.dot(lagged, lagged)
         if denom_original == 0 or denom_lagged == 0:
             return 0.0
 
-        return numerator / math.sqrt(denom_original * denom_lagged)
+        numerator = np.dot(original, lagged)
+        return float(numerator / math.sqrt(denom_original * denom_lagged))
 
     async def _detect_trend_patterns(self):
         """트렌드 패턴 탐지"""
 
-        recent_nodes = [
-            node
-            for node in self.temporal_nodes.values()
-            if (datetime.now() - node.timestamp).days <= 7
-        ]
+        # 최근 7일(일 단위 내림) 노드: 시간 인덱스 뒷부분 구간
+        index = self._node_index
+        lo, hi = index.count_after((datetime.now() - timedelta(days=8)).timestamp())
 
-        if len(recent_nodes) < 5:
+        if hi - lo < 5:
             return
 
-        # 시간순 정렬
-        recent_nodes.sort(key=lambda x: x.timestamp)
-
-        # 울림 강도 트렌드
-        resonance_values = [n.resonance_intensity for n in recent_nodes]
-        time_indices = list(range(len(resonance_values)))
-
-        # 선형 회귀로 트렌드 계산
-        slope = self._calculate_linear_trend(time_indices, resonance_values)
+        # 울림 강도 트렌드 (선형 회귀 기울기)
+        resonance_values = index.resonance[lo:hi]
+        slope = self._calculate_linear_trend(
+            np.arange(len(resonance_values)), resonance_values
+        )
 
         if abs(slope) > 0.01:  # 유의미한 트렌드
             trend_strength = min(abs(slope) * 10, 1.0)
@@ -455,7 +880,7 @@ class TemporalEchoTracker:
             pattern = TemporalPattern(
                 pattern_id=f"trend_{len(self.temporal_patterns)}",
                 pattern_type="trend",
-                nodes_involved=[n.node_id for n in recent_nodes],
+                nodes_involved=index.ids[lo:hi],
                 pattern_strength=trend_strength,
                 cycle_period=None,
                 prediction_confidence=trend_strength * 0.7,
@@ -468,30 +893,49 @@ class TemporalEchoTracker:
         if len(x) != len(y) or len(x) < 2:
             return 0.0
 
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
         n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, y))
-        sum_x2 = sum(xi * xi for xi in x)
+        sum_x = x.sum()
+        sum_y = y.sum()
 
-        denominator = n * sum_x2 - sum_x * sum_x
+        denominator = n * np.dot(x, x) - sum_x * sum_x
         if denominator == 0:
             return 0.0
 
-        return (n * sum_xy - sum_x * sum_y) / denominator
+        return float((n * np.dot(x, y) - sum_x * sum_y) / denominator)
 
     async def _detect_resonance_chains(self):
-        """울림 체인 패턴 탐지"""
+        """울림 체인 패턴 탐지 (강한 울림 그래프가 바뀐 경우에만 재계산)"""
+
+        if self._chain_cache is None:
+            self._chain_cache = self._compute_resonance_chains()
+
+        for chain, chain_strength in self._chain_cache:
+            pattern = TemporalPattern(
+                pattern_id=f"chain_{len(self.temporal_patterns)}",
+                pattern_type="resonance_chain",
+                nodes_involved=chain,
+                pattern_strength=chain_strength,
+                cycle_period=None,
+                prediction_confidence=chain_strength * 0.6,
+            )
+
+            self.temporal_patterns.append(pattern)
+
+    def _compute_resonance_chains(self) -> List[Tuple[List[str], float]]:
+        """강한 울림(> 0.5) 체인과 체인 강도"""
+
+        # 체인은 DFS가 경로상의 노드를 다시 만날 때만 기록되므로,
+        # 순환이 없는 그래프(대부분 과거 -> 현재 방향)는 탐색할 필요가 없다
+        if not self._strong_cyclic:
+            return []
 
-        # 강한 울림 연결 찾기
         strong_ripples = [
             ripple for ripple in self.echo_ripples if ripple.ripple_strength > 0.5
         ]
-
-        # 체인 구성
-        chains = self._find_chains(strong_ripples)
-
-        for chain in chains:
+        results = []
+        for chain in self._find_chains(strong_ripples):
             if len(chain) >= 3:  # 최소 3개 노드 체인
                 chain_strength = np.mean(
                     [
@@ -501,17 +945,32 @@ class TemporalEchoTracker:
                         and ripple.target_node_id in chain
                     ]
                 )
-
-                pattern = TemporalPattern(
-                    pattern_id=f"chain_{len(self.temporal_patterns)}",
-                    pattern_type="resonance_chain",
-                    nodes_involved=chain,
-                    pattern_strength=chain_strength,
-                    cycle_period=None,
-                    prediction_confidence=chain_strength * 0.6,
-                )
-
-                self.temporal_patterns.append(pattern)
+                results.append((chain, chain_strength))
+        return results
+
+    @staticmethod
+    def _has_cycle(graph: Dict[str, List[str]]) -> bool:
+        """방향 그래프 순환 여부 (반복 DFS 3색 표시)"""
+        state: Dict[str, int] = {}  # 1: 탐색 중, 2: 완료
+        for root in list(graph.keys()):
+            if root in state:
+                continue
+            state[root] = 1
+            stack = [(root, iter(graph.get(root, ())))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    status = state.get(neighbor)
+                    if status == 1:
+                        return True
+                    if status is None:
+                        state[neighbor] = 1
+                        stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                        break
+                else:
+                    state[node] = 2
+                    stack.pop()
+        return False
 
     def _find_chains(self, ripples: List[EchoRipple]) -> List[List[str]]:
         """울림 체인 찾기"""
@@ -548,26 +1007,11 @@ class TemporalEchoTracker:
     async def _detect_feedback_loops(self):
         """피드백 루프 탐지"""
 
-        # 양방향 울림이 있는 노드 쌍 찾기
-        bidirectional_pairs = []
-
-        ripple_map = defaultdict(list)
-        for ripple in self.echo_ripples:
-            ripple_map[(ripple.source_node_id, ripple.target_node_id)].append(ripple)
-
-        for (source, target), ripples in ripple_map.items():
-            reverse_key = (target, source)
-            if reverse_key in ripple_map:
-                # 양방향 연결 발견
-                forward_strength = max(r.ripple_strength for r in ripples)
-                reverse_strength = max(
-                    r.ripple_strength for r in ripple_map[reverse_key]
-                )
-
-                if forward_strength > 0.3 and reverse_strength > 0.3:
-                    bidirectional_pairs.append(
-                        ([source, target], min(forward_strength, reverse_strength))
-                    )
+        # 양방향 울림이 모두 0.3을 넘는 노드 쌍 (울림 추가 시 증분 갱신됨)
+        bidirectional_pairs = [
+            ([source, target], strength)
+            for (source, target), strength in self._feedback_pairs.items()
+        ]
 
         # 피드백 루프 패턴 생성
         for nodes, strength in bidirectional_pairs:
@@ -612,43 +1056,47 @@ class TemporalEchoTracker:
         if time_delta <= 0:
             return None
 
-        # 현재 활성 울림들의 미래 영향 계산
-        active_echoes = []
-        projected_resonance = 0.0
-        projected_emotion = [0.0] * len(self.emotion_dimensions)
-
-        for ripple in self.echo_ripples:
-            if ripple.ripple_strength > 0.1:
-                # 시간 감쇠 적용
-                future_strength = ripple.ripple_strength * self._calculate_decay(
-                    time_delta, ripple.decay_function
-                )
+        # 현재 활성 울림들의 미래 영향 계산 (감쇠 함수별 감쇠율은 3개뿐)
+        columns = self._ripple_columns
+        strengths = columns["strength"]
+        decay_by_function = np.array(
+            [self._calculate_decay(time_delta, name) for name in _DECAY_FUNCTIONS],
+            dtype=np.float64,
+        )
+        future_strengths = strengths * decay_by_function[columns["decay"]]
+        active = (strengths > 0.1) & (future_strengths > 0.05)
+        active_count = int(active.sum())
 
-                if future_strength > 0.05:
-                    active_echoes.append(ripple.source_node_id)
-                    projected_resonance += future_strength
+        projected_resonance = 0.0
+        projected_emotion = np.zeros(len(self.emotion_dimensions))
+        contributing_echoes: List[str] = []
+
+        if active_count:
+            # 소스 노드별 미래 울림 합 -> 소스 감정 시그니처 가중합
+            index = self._node_index
+            source_weights = np.bincount(
+                columns["source"][active],
+                weights=future_strengths[active],
+                minlength=len(index),
+            )
+            sources = np.flatnonzero(source_weights)
+            contributing_echoes = [index.ids[i] for i in sources]
+            projected_emotion = (
+                source_weights[sources] @ index.columns["signature"][sources]
+            )
 
-                    # 소스 노드의 감정 영향
-                    source_node = self.temporal_nodes.get(ripple.source_node_id)
-                    if source_node:
-                        for i, emotion_val in enumerate(
-                            source_node.emotional_signature
-                        ):
-                            projected_emotion[i] += emotion_val * future_strength
+            # 정규화
+            projected_resonance = float(future_strengths[active].sum()) / len(sources)
+            projected_emotion /= len(sources)
 
-        # 정규화
-        if active_echoes:
-            projected_resonance /= len(set(active_echoes))
-            projected_emotion = [e / len(set(active_echoes)) for e in projected_emotion]
+        projected_emotion = projected_emotion.tolist()
 
         # 패턴 기반 예측 추가
         pattern_contribution = self._calculate_pattern_contribution(target_time)
         projected_resonance += pattern_contribution.get("resonance", 0.0)
 
         # 신뢰도 계산
-        confidence = self._calculate_prediction_confidence(
-            time_delta, len(active_echoes)
-        )
+        confidence = self._calculate_prediction_confidence(time_delta, active_count)
 
         # 시나리오 변형 생성
         scenarios = self._generate_scenario_variants(
@@ -667,7 +1115,7 @@ class TemporalEchoTracker:
                 "stability_index": 1.0 - np.std(projected_emotion),
             },
             confidence_level=confidence,
-            contributing_echoes=list(set(active_echoes)),
+            contributing_echoes=contributing_echoes,
             scenario_variants=scenarios,
         )
 
@@ -799,25 +1247,22 @@ class TemporalEchoTracker:
 
         cutoff_time = datetime.now() - timedelta(days=self.max_history_days)
 
-        # 오래된 노드 제거
-        old_node_ids = [
-            node_id
-            for node_id, node in self.temporal_nodes.items()
-            if node.timestamp < cutoff_time
-        ]
+        # 오래된 노드 제거 (시간 인덱스 앞부분)
+        old_node_ids = self._node_index.evict_before(cutoff_time.timestamp())
 
         for node_id in old_node_ids:
-            del self.temporal_nodes[node_id]
-
-        # 관련 울림 제거
-        self.echo_ripples = [
-            ripple
-            for ripple in self.echo_ripples
-            if (
-                ripple.source_node_id not in old_node_ids
-                and ripple.target_node_id not in old_node_ids
-            )
-        ]
+            self.temporal_nodes.pop(node_id, None)
+
+        # 관련 울림 제거 (제거된 노드는 시간 인덱스 앞 len(old_node_ids)개 위치)
+        if old_node_ids:
+            evicted = len(old_node_ids)
+            columns = self._ripple_columns
+            keep = (columns["source"] >= evicted) & (columns["target"] >= evicted)
+            self.echo_ripples = list(compress(self.echo_ripples, keep.tolist()))
+            columns.compress(keep)
+            columns["source"][:] -= evicted
+            columns["target"][:] -= evicted
+            self._forget_ripple_nodes(old_node_ids)
 
         # 오래된 투사 제거
         current_time = datetime.now()
@@ -834,39 +1279,32 @@ class TemporalEchoTracker:
         current_time = datetime.now()
 
         # 현재 활성 울림 계산
-        active_ripples = [
-            ripple for ripple in self.echo_ripples if ripple.ripple_strength > 0.1
-        ]
+        columns = self._ripple_columns
+        active = columns["strength"] > 0.1
+        active_strengths = columns["strength"][active]
+        active_distances = columns["distance"][active]
 
         # 최근 24시간 노드 통계
-        recent_nodes = [
-            node
-            for node in self.temporal_nodes.values()
-            if (current_time - node.timestamp).total_seconds() < 86400
-        ]
+        lo, hi = self._node_index.count_after(current_time.timestamp() - 86400)
 
         return {
             "analysis_timestamp": current_time.isoformat(),
             "temporal_summary": {
                 "total_nodes": len(self.temporal_nodes),
-                "active_ripples": len(active_ripples),
-                "recent_24h_nodes": len(recent_nodes),
+                "active_ripples": len(active_strengths),
+                "recent_24h_nodes": hi - lo,
                 "detected_patterns": len(self.temporal_patterns),
                 "future_projections": len(self.future_projections),
             },
             "resonance_metrics": {
                 "avg_ripple_strength": (
-                    np.mean([r.ripple_strength for r in active_ripples])
-                    if active_ripples
-                    else 0.0
+                    float(active_strengths.mean()) if len(active_strengths) else 0.0
                 ),
-                "max_ripple_strength": max(
-                    [r.ripple_strength for r in active_ripples], default=0.0
+                "max_ripple_strength": (
+                    float(active_strengths.max()) if len(active_strengths) else 0.0
                 ),
                 "temporal_coupling": (
-                    np.mean([r.temporal_distance for r in active_ripples])
-                    if active_ripples
-                    else 0.0
+                    float(active_distances.mean()) if len(active_distances) else 0.0
                 ),
             },
             "pattern_summary": [
@@ -4,6 +4,7 @@
 """
 
 import json
+import os
 import numpy as np
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
@@ -20,6 +21,88 @@ except ImportError:
 from .embedding_engine import EchoEmbeddingEngine
 
 
+class GrowableVectorStore:
+    """
+    용량 2배 확장 방식의 벡터 저장소
+    append는 분할 상환 O(1), 저장된 인덱스는 메모리 매핑으로 즉시 열림
+    """
+
+    def __init__(self, dimension: int, capacity: int = 1024):
+        self.dimension = dimension
+        self._buffer = np.zeros((max(capacity, 1), dimension), dtype=np.float32)
+        self._size = 0
+
+    @classmethod
+    def from_file(cls, path: Path, mmap: bool = True) -> "GrowableVectorStore":
+        """저장된 .npy 인덱스 로드 (mmap=True면 첫 추가 전까지 읽기 전용 매핑)"""
+        data = np.load(path, mmap_mode="r" if mmap else None)
+        if data.ndim != 2:
+            raise ValueError(f"잘못된 인덱스 형태: {data.shape}")
+
+        store = cls.__new__(cls)
+        store.dimension = data.shape[1]
+        store._buffer = data
+        store._size = data.shape[0]
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """유효한 행만 포함한 뷰"""
+        return self._buffer[: self._size]
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        return isinstance(self._buffer, np.memmap)
+
+    def _reserve(self, required: int):
+        """필요 용량 확보 (메모리 매핑 상태면 쓰기 가능한 배열로 전환)"""
+        if required <= self._buffer.shape[0] and not self.is_memory_mapped:
+            return
+
+        capacity = max(self._buffer.shape[0], 1)
+        while capacity < required:
+            capacity *= 2
+
+        grown = np.zeros((capacity, self.dimension), dtype=np.float32)
+        grown[: self._size] = self._buffer[: self._size]
+        self._buffer = grown
+
+    def append(self, vector: np.ndarray) -> int:
+        """벡터 한 개 추가, 행 인덱스 반환"""
+        self._reserve(self._size + 1)
+        self._buffer[self._size] = vector
+        self._size += 1
+        return self._size - 1
+
+    def extend(self, vectors: np.ndarray) -> List[int]:
+        """여러 벡터 일괄 추가, 행 인덱스 목록 반환"""
+        start = self._size
+        self._reserve(start + len(vectors))
+        self._buffer[start : start + len(vectors)] = vectors
+        self._size += len(vectors)
+        return list(range(start, self._size))
+
+    def save(self, path: Path):
+        """원자적 저장 (열려 있는 메모리 매핑을 깨지 않도록 임시 파일 후 교체)"""
+        tmp_path = Path(str(path) + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.matrix))
+        os.replace(tmp_path, path)
+
+
+def top_k_indices(similarities: np.ndarray, top_k: int) -> np.ndarray:
+    """argpartition 기반 상위 k개 인덱스 (유사도 내림차순)"""
+    top_k = min(top_k, similarities.shape[0])
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    candidates = np.argpartition(-similarities, top_k - 1)[:top_k]
+    return candidates[np.argsort(-similarities[candidates], kind="stable")]
+
+
 class EchoVectorSearchEngine:
     """
     Echo 울림 기반 벡터 검색 엔진
@@ -32,7 +115,7 @@ class EchoVectorSearchEngine:
 
         # 벡터 인덱스 관련
         self.faiss_index = None
-        self.numpy_index = None
+        self.vector_store: Optional[GrowableVectorStore] = None
         self.metadata_index = []  # 벡터에 대응하는 메타데이터
         self.dimension = None
 
@@ -47,6 +130,7 @@ class EchoVectorSearchEngine:
             "signature_boost": True,
             "context_aware": True,
             "mock_mode": True,  # Mock 모드 플래그
+            "mmap_index": True,  # numpy_index.npy 메모리 매핑 로드
         }
 
         # Echo 캡슐 매핑
@@ -57,43 +141,69 @@ class EchoVectorSearchEngine:
         # 기존 인덱스 로드 시도
         self._load_existing_index()
 
+    @property
+    def numpy_index(self) -> Optional[np.ndarray]:
+        """Numpy 인덱스 (유효 행 뷰)"""
+        if self.vector_store is None or len(self.vector_store) == 0:
+            return None
+        return self.vector_store.matrix
+
     def add_vector(self, vector: np.ndarray, metadata: Dict[str, Any]) -> int:
         """벡터를 인덱스에 추가"""
+        return self.add_vectors(np.asarray(vector).reshape(1, -1), [metadata])[0]
+
+    def add_vectors(
+        self, vectors: np.ndarray, metadatas: List[Dict[str, Any]]
+    ) -> List[int]:
+        """여러 벡터를 인덱스에 일괄 추가"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(metadatas):
+            raise ValueError(
+                f"벡터/메타데이터 개수 불일치: {vectors.shape} / {len(metadatas)}"
+            )
+
         if self.dimension is None:
-            self.dimension = len(vector)
+            self.dimension = vectors.shape[1]
             self._initialize_index()
-        elif len(vector) != self.dimension:
+        elif vectors.shape[1] != self.dimension:
             raise ValueError(
-                f"벡터 차원 불일치: 예상 {self.dimension}, 실제 {len(vector)}"
+                f"벡터 차원 불일치: 예상 {self.dimension}, 실제 {vectors.shape[1]}"
             )
 
         # 벡터 정규화
-        normalized_vector = vector / np.linalg.norm(vector)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        normalized_vectors = vectors / norms
 
         # FAISS 인덱스에 추가
         if self.search_config["use_faiss"] and self.faiss_index is not None:
-            self.faiss_index.add(normalized_vector.reshape(1, -1))
+            self.faiss_index.add(normalized_vectors)
 
         # Numpy 인덱스에 추가 (fallback)
-        if self.numpy_index is None:
-            self.numpy_index = normalized_vector.reshape(1, -1)
-        else:
-            self.numpy_index = np.vstack([self.numpy_index, normalized_vector])
+        if self.vector_store is None:
+            self.vector_store = GrowableVectorStore(self.dimension)
+        self.vector_store.extend(normalized_vectors)
 
         # 메타데이터 추가
-        vector_id = len(self.metadata_index)
-        metadata_with_id = {
-            **metadata,
-            "vector_id": vector_id,
-            "added_at": datetime.now().isoformat(),
-            "dimension": self.dimension,
-        }
-        self.metadata_index.append(metadata_with_id)
+        added_at = datetime.now().isoformat()
+        vector_ids = []
+        for metadata in metadatas:
+            vector_id = len(self.metadata_index)
+            self.metadata_index.append(
+                {
+                    **metadata,
+                    "vector_id": vector_id,
+                    "added_at": added_at,
+                    "dimension": self.dimension,
+                }
+            )
+            vector_ids.append(vector_id)
 
-        print(
-            f"🔹 벡터 추가: ID={vector_id}, 메타={metadata.get('capsule_id', 'unknown')}"
-        )
-        return vector_id
+            print(
+                f"🔹 벡터 추가: ID={vector_id}, 메타={metadata.get('capsule_id', 'unknown')}"
+            )
+
+        return vector_ids
 
     def add_capsule_vector(
         self,
@@ -184,6 +294,53 @@ class EchoVectorSearchEngine:
         )
         return filtered_results
 
+    def search_batch(
+        self,
+        queries: List[str],
+        signature: str = "Echo-Aurora",
+        top_k: Optional[int] = None,
+        context: Dict[str, Any] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리를 한 번의 행렬곱으로 검색
+
+        Args:
+            queries: 검색할 자연어 텍스트 목록
+            signature: Echo 시그니처 (임베딩 가중치용)
+            top_k: 쿼리별 반환할 최대 결과 수
+            context: 추가 검색 컨텍스트
+
+        Returns:
+            쿼리 순서에 대응하는 검색 결과 리스트들
+        """
+        if len(self.metadata_index) == 0 or not queries:
+            return [[] for _ in queries]
+
+        # 캐시 미스 쿼리는 embed_batch 안에서 한 번의 encode로 처리된다
+        query_embeddings = np.vstack(
+            self.embedding_engine.embed_batch(
+                queries,
+                signature,
+                [
+                    {"type": "search_query", "query": query, **(context or {})}
+                    for query in queries
+                ],
+            )
+        )
+
+        top_k = top_k or self.search_config["top_k"]
+        threshold = self.search_config["similarity_threshold"]
+
+        batch_results = []
+        for results in self._perform_vector_search_batch(query_embeddings, top_k):
+            if self.search_config["signature_boost"]:
+                results = self._apply_signature_boost(results, signature)
+            if self.search_config["context_aware"] and context:
+                results = self._apply_context_filtering(results, context)
+            batch_results.append([r for r in results if r["similarity"] >= threshold])
+
+        return batch_results
+
     def search_by_capsule_id(
         self, capsule_id: str, top_k: int = 5
     ) -> List[Dict[str, Any]]:
@@ -223,6 +380,20 @@ class EchoVectorSearchEngine:
         else:
             return self._numpy_search(query_vector, top_k)
 
+    def _perform_vector_search_batch(
+        self, query_vectors: np.ndarray, top_k: int
+    ) -> List[List[Dict[str, Any]]]:
+        """여러 쿼리 벡터 일괄 검색 (FAISS 또는 Numpy)"""
+        query_vectors = np.asarray(query_vectors, dtype=np.float32)
+        norms = np.linalg.norm(query_vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        query_vectors = query_vectors / norms
+
+        if self.search_config["use_faiss"] and self.faiss_index is not None:
+            return [self._faiss_search(q, top_k) for q in query_vectors]
+        else:
+            return self._numpy_search_batch(query_vectors, top_k)
+
     def _faiss_search(
         self, query_vector: np.ndarray, top_k: int
     ) -> List[Dict[str, Any]]:
@@ -258,11 +429,33 @@ class EchoVectorSearchEngine:
         # 코사인 유사도 계산
         similarities = np.dot(self.numpy_index, query_vector)
 
-        # 상위 k개 인덱스 가져오기
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # 상위 k개 인덱스 가져오기 (전체 정렬 없이 argpartition)
+        top_indices = top_k_indices(similarities, top_k)
 
+        return self._build_results(similarities, top_indices)
+
+    def _numpy_search_batch(
+        self, query_vectors: np.ndarray, top_k: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Numpy를 이용한 다중 쿼리 벡터 검색"""
+        if self.numpy_index is None:
+            return [[] for _ in range(len(query_vectors))]
+
+        # (쿼리 수, 벡터 수) 유사도 행렬
+        similarity_matrix = query_vectors @ self.numpy_index.T
+
+        return [
+            self._build_results(similarities, top_k_indices(similarities, top_k))
+            for similarities in similarity_matrix
+        ]
+
+    def _build_results(
+        self, similarities: np.ndarray, top_indices: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """상위 인덱스를 검색 결과 형식으로 변환"""
         results = []
         for i, idx in enumerate(top_indices):
+            idx = int(idx)
             results.append(
                 {
                     "rank": i + 1,
@@ -380,8 +573,8 @@ class EchoVectorSearchEngine:
         }
 
         # Numpy 인덱스 저장
-        if self.numpy_index is not None:
-            np.save(self.index_dir / "numpy_index.npy", self.numpy_index)
+        if self.vector_store is not None:
+            self.vector_store.save(self.index_dir / "numpy_index.npy")
 
         # FAISS 인덱스 저장
         if self.faiss_index is not None:
@@ -411,7 +604,9 @@ class EchoVectorSearchEngine:
             # Numpy 인덱스 로드
             numpy_file = self.index_dir / "numpy_index.npy"
             if numpy_file.exists():
-                self.numpy_index = np.load(numpy_file)
+                self.vector_store = GrowableVectorStore.from_file(
+                    numpy_file, mmap=self.search_config.get("mmap_index", True)
+                )
 
             # FAISS 인덱스 로드
             faiss_file = self.index_dir / "faiss_index.bin"
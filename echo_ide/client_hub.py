@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+📡 Client Hub - 웹 IDE WebSocket 브로드캐스트
+클라이언트마다 제한된 송신 큐와 전용 송신 태스크를 둔다
+
+- broadcast()는 메시지를 한 번만 직렬화해 각 큐에 넣고 바로 반환 (await 없음)
+- 느린 클라이언트는 자기 큐만 차고, 가득 차면 가장 오래된 메시지를 버린다
+- 전송에 실패한 클라이언트는 자동으로 정리
+"""
+
+import asyncio
+import json
+from typing import Any, Dict
+
+DEFAULT_QUEUE_SIZE = 1000
+
+
+class _ClientChannel:
+    """클라이언트 하나의 송신 큐 + 송신 태스크"""
+
+    def __init__(self, websocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.task: asyncio.Task = None
+
+    def offer(self, text: str) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(text)
+                return
+            except asyncio.QueueFull:
+                try:
+                    self.queue.get_nowait()  # 가장 오래된 메시지를 버린다
+                    self.dropped += 1
+                except asyncio.QueueEmpty:
+                    pass
+
+
+class ClientHub:
+    """연결된 WebSocket 클라이언트들에 대한 논블로킹 브로드캐스트"""
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._channels: Dict[Any, _ClientChannel] = {}
+
+    def register(self, websocket) -> None:
+        channel = _ClientChannel(websocket, self.queue_size)
+        channel.task = asyncio.create_task(self._sender(channel))
+        self._channels[websocket] = channel
+
+    def unregister(self, websocket) -> None:
+        channel = self._channels.pop(websocket, None)
+        if channel is not None and channel.task is not asyncio.current_task():
+            channel.task.cancel()
+
+    def broadcast(self, message: Dict[str, Any]) -> int:
+        """모든 클라이언트 큐에 메시지 적재 - 적재한 클라이언트 수 반환"""
+        if not self._channels:
+            return 0
+        text = json.dumps(message)
+        for channel in list(self._channels.values()):
+            channel.offer(text)
+        return len(self._channels)
+
+    async def _sender(self, channel: _ClientChannel) -> None:
+        try:
+            while True:
+                text = await channel.queue.get()
+                await channel.websocket.send_text(text)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self.unregister(channel.websocket)
+
+    async def close(self) -> None:
+        channels = list(self._channels.values())
+        self._channels.clear()
+        for channel in channels:
+            channel.task.cancel()
+        await asyncio.gather(*(c.task for c in channels), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self._channels),
+            "queued": sum(c.queue.qsize() for c in self._channels.values()),
+            "dropped": sum(c.dropped for c in self._channels.values()),
+        }
+
+    def __len__(self) -> int:
+        return len(self._channels)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+▶️ Process Runner - 웹 IDE 비동기 실행기
+asyncio 서브프로세스로 스크립트를 실행하고 stdout/stderr를 줄 단위로 스트리밍
+
+- 이벤트 루프를 막지 않음 (subprocess.run 대체)
+- 여러 실행을 동시에 관리 (run_id), 동시 실행 수 제한
+- 실행 중 취소 (terminate -> 유예 후 kill) 및 시간 초과 처리
+- 출력은 콜백으로 즉시 전달하고, 응답용 누적 출력은 크기 상한을 둔다
+"""
+
+import asyncio
+import codecs
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+# (run_id, stream["stdout"|"stderr"], line) -> 구독자에게 전달
+LineCallback = Callable[[str, str, str], Awaitable[None]]
+
+MAX_CAPTURE_CHARS = 1_000_000  # 실행당 응답에 남길 출력 상한 (스트리밍은 제한 없음)
+TERMINATE_GRACE = 3.0  # 취소 시 terminate 후 kill까지 대기 (초)
+READ_CHUNK_BYTES = 64 * 1024  # 파이프에서 한 번에 읽을 크기
+MAX_LINE_BYTES = 64 * 1024  # 줄바꿈 없는 출력은 이 크기마다 끊어서 전달
+
+
+@dataclass
+class RunHandle:
+    """실행 중/완료된 프로세스 상태"""
+
+    run_id: str
+    argv: List[str]
+    started_at: float
+    process: Optional[asyncio.subprocess.Process] = None
+    stdout: List[str] = field(default_factory=list)
+    stderr: List[str] = field(default_factory=list)
+    captured_chars: int = 0
+    returncode: Optional[int] = None
+    timed_out: bool = False
+    cancelled: bool = False
+    finished_at: Optional[float] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def status(self) -> str:
+        if not self.done.is_set():
+            return "running" if self.process else "queued"
+        if self.cancelled:
+            return "cancelled"
+        if self.timed_out:
+            return "timeout"
+        return "finished"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "argv": self.argv,
+            "status": self.status,
+            "returncode": self.returncode,
+            "started_at": self.started_at,
+            "elapsed": round((self.finished_at or time.time()) - self.started_at, 3),
+        }
+
+
+class ProcessRunner:
+    """동시 실행/취소를 지원하는 비동기 프로세스 실행기"""
+
+    def __init__(self, max_concurrent: int = 4, keep_finished: int = 50):
+        self.max_concurrent = max_concurrent
+        self.keep_finished = keep_finished
+        self.runs: Dict[str, RunHandle] = {}
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._tasks: Set[asyncio.Task] = set()  # 실행 중 태스크가 GC되지 않도록 참조 유지
+
+    async def start(
+        self,
+        argv: List[str],
+        cwd: Optional[str] = None,
+        timeout: float = 30.0,
+        on_line: Optional[LineCallback] = None,
+    ) -> RunHandle:
+        """실행을 예약하고 바로 핸들 반환 (완료는 wait()로 대기)"""
+        handle = RunHandle(
+            run_id=uuid.uuid4().hex[:12], argv=list(argv), started_at=time.time()
+        )
+        self.runs[handle.run_id] = handle
+        self._prune()
+        task = asyncio.create_task(self._execute(handle, cwd, timeout, on_line))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return handle
+
+    async def wait(self, run_id: str) -> RunHandle:
+        handle = self.runs[run_id]
+        await handle.done.wait()
+        return handle
+
+    async def cancel(self, run_id: str) -> bool:
+        """실행 취소 - 이미 끝났거나 없는 실행이면 False"""
+        handle = self.runs.get(run_id)
+        if handle is None or handle.done.is_set():
+            return False
+        handle.cancelled = True
+        if handle.process is not None:
+            await self._terminate(handle.process)
+        return True
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        return [handle.summary() for handle in self.runs.values()]
+
+    # ----- 내부 -----
+
+    async def _execute(self, handle, cwd, timeout, on_line) -> None:
+        try:
+            async with self._slots:
+                if handle.cancelled:
+                    return
+                try:
+                    await self._run_process(handle, cwd, timeout, on_line)
+                except Exception as e:
+                    handle.stderr.append(f"{e}\n")
+                    handle.returncode = -1
+                finally:
+                    # 어떤 경로로 끝나든 슬롯을 놓기 전에 자식 프로세스를 정리
+                    if handle.process is not None:
+                        await self._terminate(handle.process)
+        finally:
+            handle.finished_at = time.time()
+            handle.done.set()
+
+    async def _run_process(self, handle, cwd, timeout, on_line) -> None:
+        handle.process = await asyncio.create_subprocess_exec(
+            *handle.argv,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # 출력 읽기와 프로세스 종료를 하나의 마감 시간 아래에 둔다
+        # (fd 1/2를 닫고 계속 도는 스크립트도 시간 초과로 처리)
+        completion = asyncio.gather(
+            self._pump(handle, handle.process.stdout, "stdout", on_line),
+            self._pump(handle, handle.process.stderr, "stderr", on_line),
+            handle.process.wait(),
+        )
+        try:
+            await asyncio.wait_for(asyncio.shield(completion), timeout)
+        except asyncio.TimeoutError:
+            handle.timed_out = True
+            await self._terminate(handle.process)
+            try:
+                # 손자 프로세스가 파이프를 쥐고 있어도 무한 대기하지 않게
+                await asyncio.wait_for(completion, TERMINATE_GRACE)
+            except asyncio.TimeoutError:
+                pass
+        handle.returncode = await handle.process.wait()
+
+    async def _pump(self, handle, stream, name, on_line) -> None:
+        """청크 단위로 읽어 직접 줄을 나눈다 (readline의 64 KiB 한도에 걸리지 않게)
+
+        줄바꿈 없이 MAX_LINE_BYTES를 넘는 출력은 그 시점까지를 한 줄로 내보낸다.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        buffer = bytearray()
+        while True:
+            chunk = await stream.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            buffer += chunk
+            while True:
+                newline = buffer.find(b"\n")
+                if newline >= 0:
+                    raw = bytes(buffer[: newline + 1])
+                    del buffer[: newline + 1]
+                elif len(buffer) >= MAX_LINE_BYTES:
+                    raw = bytes(buffer)
+                    buffer.clear()
+                else:
+                    break
+                await self._emit(handle, name, decoder.decode(raw), on_line)
+        tail = decoder.decode(bytes(buffer), final=True)
+        if tail:
+            await self._emit(handle, name, tail, on_line)
+
+    async def _emit(self, handle, name, line, on_line) -> None:
+        captured = handle.stdout if name == "stdout" else handle.stderr
+        if handle.captured_chars < MAX_CAPTURE_CHARS:
+            captured.append(line)
+            handle.captured_chars += len(line)
+        if on_line is not None:
+            try:
+                await on_line(handle.run_id, name, line.rstrip("\n"))
+            except Exception:
+                pass  # 구독자 오류가 실행을 멈추지 않게
+
+    async def _terminate(self, process) -> None:
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), TERMINATE_GRACE)
+            except asyncio.TimeoutError:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    def _prune(self) -> None:
+        finished = [h for h in self.runs.values() if h.done.is_set()]
+        for handle in finished[: max(0, len(finished) - self.keep_finished)]:
+            del self.runs[handle.run_id]
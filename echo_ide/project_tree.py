@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+🌲 Project Tree - 웹 IDE 파일 인덱스
+프로젝트 파일 목록을 한 번만 색인하고 메모리에서 페이지 단위로 제공
+
+- 무시 규칙: .venv/__pycache__/node_modules 등 + 점(.)으로 시작하는 디렉토리/파일
+- 디렉토리 mtime 폴링으로 변경된 디렉토리만 다시 스캔 (파일 추가/삭제/이름 변경 반영)
+- 정렬된 경로 목록 + bisect로 prefix 범위를 바로 잘라내고, glob 필터 결과는 캐시
+- 색인 교체는 참조 스왑이라 조회 중에 잠금이 필요 없다
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+DEFAULT_IGNORED_DIRS = frozenset({".venv", "venv", "__pycache__", "node_modules"})
+MAX_PAGE_SIZE = 1000
+_FILTER_CACHE_SIZE = 32
+
+
+def _is_ignored(name: str, ignored_dirs: frozenset) -> bool:
+    return name.startswith(".") or name in ignored_dirs
+
+
+class ProjectTree:
+    """mtime 폴링으로 최신 상태를 유지하는 프로젝트 파일 인덱스"""
+
+    def __init__(
+        self,
+        root: Path,
+        ignored_dirs: frozenset = DEFAULT_IGNORED_DIRS,
+        poll_interval: float = 2.0,
+    ):
+        self.root = Path(root)
+        self.ignored_dirs = frozenset(ignored_dirs)
+        self.poll_interval = poll_interval
+
+        # 디렉토리(상대 경로, 루트는 "") -> mtime_ns / 직속 파일 / 직속 하위 디렉토리
+        self._dir_mtimes: Dict[str, int] = {}
+        self._dir_files: Dict[str, Set[str]] = {}
+        self._dir_subdirs: Dict[str, Set[str]] = {}
+
+        # (정렬된 상대 경로 튜플, 필터 결과 캐시) - 함께 교체해 캐시가 섞이지 않게 한다
+        self._state: Tuple[Tuple[str, ...], Dict] = ((), {})
+        self._version = 0
+        self._built = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    # ----- 색인 -----
+
+    def _abs(self, rel: str) -> str:
+        return os.path.join(self.root, rel) if rel else str(self.root)
+
+    def _scan_dir(self, rel: str) -> List[str]:
+        """디렉토리 하나를 다시 읽는다 - 새로 생긴 하위 디렉토리 목록 반환"""
+        path = self._abs(rel)
+        try:
+            # 스캔 전에 기록해야 스캔 도중의 변경을 다음 폴링에서 잡는다
+            mtime = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            self._remove_dir(rel)
+            return []
+
+        files, subdirs = set(), set()
+        for entry in entries:
+            if _is_ignored(entry.name, self.ignored_dirs):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.add(entry.name)
+                elif entry.is_file():
+                    files.add(entry.name)
+            except OSError:
+                continue
+
+        previous = self._dir_subdirs.get(rel, set())
+        self._dir_mtimes[rel] = mtime
+        self._dir_files[rel] = files
+        self._dir_subdirs[rel] = subdirs
+
+        for name in previous - subdirs:
+            self._remove_dir(f"{rel}/{name}" if rel else name)
+        return [f"{rel}/{name}" if rel else name for name in subdirs - previous]
+
+    def _walk(self, rel: str) -> None:
+        stack = [rel]
+        while stack:
+            stack.extend(self._scan_dir(stack.pop()))
+
+    def _remove_dir(self, rel: str) -> None:
+        for name in self._dir_subdirs.pop(rel, set()):
+            self._remove_dir(f"{rel}/{name}" if rel else name)
+        self._dir_mtimes.pop(rel, None)
+        self._dir_files.pop(rel, None)
+
+    def _publish(self) -> None:
+        files = sorted(
+            f"{rel}/{name}" if rel else name
+            for rel, names in self._dir_files.items()
+            for name in names
+        )
+        self._state = (tuple(files), {})
+        self._version += 1
+
+    def build(self) -> None:
+        """전체 색인 (최초 1회)"""
+        with self._lock:
+            self._dir_mtimes.clear()
+            self._dir_files.clear()
+            self._dir_subdirs.clear()
+            self._walk("")
+            self._publish()
+            self._built = True
+
+    def refresh(self) -> bool:
+        """mtime이 바뀐 디렉토리만 다시 스캔 - 변경이 있었으면 True"""
+        if not self._built:
+            self.build()
+            return True
+
+        with self._lock:
+            changed = False
+            for rel in list(self._dir_mtimes):
+                if rel not in self._dir_mtimes:
+                    continue  # 이번 패스에서 상위와 함께 제거됨
+                try:
+                    mtime = os.stat(self._abs(rel)).st_mtime_ns
+                except OSError:
+                    self._remove_dir(rel)
+                    changed = True
+                    continue
+                if mtime != self._dir_mtimes[rel]:
+                    for child in self._scan_dir(rel):
+                        self._walk(child)
+                    changed = True
+            if changed:
+                self._publish()
+            return changed
+
+    def note_path(self, rel_path: str) -> None:
+        """IDE가 직접 만든/지운 파일을 폴링을 기다리지 않고 반영"""
+        if not self._built:
+            return
+        parent = Path(rel_path).parent.as_posix()
+        parent = "" if parent == "." else parent
+        with self._lock:
+            if parent in self._dir_mtimes:
+                for child in self._scan_dir(parent):
+                    self._walk(child)
+                self._publish()
+        if parent not in self._dir_mtimes:
+            self.refresh()  # 새 디렉토리가 생긴 경우 상위부터 따라 내려간다
+
+    # ----- 감시 -----
+
+    def start(self) -> None:
+        """백그라운드 폴링 시작 (색인이 없으면 먼저 구축)"""
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, name="project-tree-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self) -> None:
+        if not self._built:
+            self.build()
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️ 프로젝트 트리 갱신 실패: {e}")
+
+    # ----- 조회 -----
+
+    def _filtered(self, prefix: str, pattern: str) -> Tuple[str, ...]:
+        files, cache = self._state
+        key = (prefix, pattern)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+        if prefix:
+            start = bisect_left(files, prefix)
+            end = bisect_left(files, prefix + "\U0010ffff", start)
+            files = files[start:end]
+        if pattern:
+            # '/'가 없는 패턴은 파일 이름에, 있으면 경로 전체에 매칭
+            if "/" in pattern:
+                files = tuple(path for path in files if fnmatchcase(path, pattern))
+            else:
+                files = tuple(
+                    path
+                    for path in files
+                    if fnmatchcase(path.rsplit("/", 1)[-1], pattern)
+                )
+
+        if len(cache) >= _FILTER_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = files
+        return files
+
+    def list_files(
+        self,
+        offset: int = 0,
+        limit: int = 50,
+        prefix: str = "",
+        pattern: str = "",
+    ) -> Tuple[int, List[Dict[str, str]]]:
+        """(전체 개수, 페이지 항목) - 항목 형식은 {"name", "path", "icon"}"""
+        if not self._built:
+            self.build()
+
+        matched = self._filtered(prefix.lstrip("/"), pattern)
+        offset = max(0, offset)
+        limit = max(0, min(limit, MAX_PAGE_SIZE))
+        page = [
+            {
+                "name": path.rsplit("/", 1)[-1],
+                "path": path,
+                "icon": "🐍" if path.endswith(".py") else "📄",
+            }
+            for path in matched[offset : offset + limit]
+        ]
+        return len(matched), page
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._state[0])
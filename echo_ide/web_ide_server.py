@@ -6,14 +6,12 @@ FastAPI 기반 웹 IDE 서버 - 현대적이고 직관적인 Echo 개발 환경
 
 import os
 import sys
-import json
 import asyncio
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import uvicorn
-from fastapi import FastAPI, WebSocket, HTTPException, UploadFile, File
+from fastapi import FastAPI, WebSocket, HTTPException, UploadFile, File, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -23,6 +21,10 @@ import websockets
 # Echo 시스템 모듈 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
+from echo_ide.client_hub import ClientHub
+from echo_ide.process_runner import ProcessRunner
+from echo_ide.project_tree import ProjectTree
+
 try:
     from echo_engine.echo_infection_main import EchoInfectionSystem
     from echo_engine.logging.meta_infection_logger import MetaInfectionLogger
@@ -80,7 +82,11 @@ infection_system = None
 auto_evolution = None
 logger = None
 project_root = Path(__file__).parent.parent
-connected_clients = set()
+project_tree = ProjectTree(project_root)
+client_hub = ClientHub()
+process_runner = ProcessRunner(max_concurrent=4)
+background_tasks = set()  # fire-and-forget 태스크 참조 유지 (GC 방지)
+RUN_TIMEOUT = 30
 
 
 # Pydantic 모델들
@@ -97,8 +103,10 @@ class InfectionRequest(BaseModel):
 
 
 class CommandRequest(BaseModel):
-    command: str
+    command: Optional[str] = None
+    path: Optional[str] = None  # command 대신 사용 가능 (프론트엔드 호환)
     args: List[str] = []
+    wait: bool = True  # False면 run_id만 즉시 반환하고 출력은 WebSocket으로 스트리밍
 
 
 # 정적 파일 서빙
@@ -645,6 +653,14 @@ if __name__ == '__main__':
                 case 'output':
                     addOutput(data.message);
                     break;
+                case 'run_output':
+                    addOutput(data.stream === 'stderr' ? `❌ ${data.line}` : data.line);
+                    break;
+                case 'run_finished':
+                    addOutput(data.status === 'finished'
+                        ? `✅ 실행 완료 (종료 코드: ${data.returncode})`
+                        : `⏹️ 실행 종료: ${data.status}`);
+                    break;
                 case 'status_update':
                     updateSystemStatus(data.component, data.status);
                     break;
@@ -821,12 +837,16 @@ if __name__ == '__main__':
                 const response = await fetch('/api/run', {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ path: currentFile })
+                    body: JSON.stringify({ command: currentFile, wait: false })
                 });
                 
+                // 출력은 WebSocket(run_output/run_finished)으로 스트리밍된다
                 const result = await response.json();
-                addOutput(`▶️ 실행: ${currentFile}`);
-                addOutput(result.output);
+                if (!response.ok) {
+                    addOutput(`❌ 실행 오류: ${result.detail}`);
+                    return;
+                }
+                addOutput(`▶️ 실행: ${currentFile} (${result.run_id})`);
                 
             } catch (error) {
                 addOutput(`❌ 실행 오류: ${error.message}`);
@@ -1198,7 +1218,7 @@ if __name__ == '__main__':
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket 연결 처리"""
     await websocket.accept()
-    connected_clients.add(websocket)
+    client_hub.register(websocket)
 
     try:
         while True:
@@ -1206,40 +1226,56 @@ async def websocket_endpoint(websocket: WebSocket):
     except:
         pass
     finally:
-        connected_clients.discard(websocket)
+        client_hub.unregister(websocket)
 
 
 async def broadcast_message(message: Dict[str, Any]):
-    """모든 연결된 클라이언트에게 메시지 브로드캐스트"""
-    if connected_clients:
-        disconnected = set()
-        for client in connected_clients:
-            try:
-                await client.send_text(json.dumps(message))
-            except:
-                disconnected.add(client)
+    """모든 연결된 클라이언트에게 메시지 브로드캐스트 (클라이언트별 큐에 적재만)"""
+    client_hub.broadcast(message)
+
+
+@app.on_event("startup")
+async def start_project_tree():
+    """파일 인덱스를 한 번 구축하고 변경 감시 시작"""
+    await asyncio.to_thread(project_tree.build)
+    project_tree.start()
+
+
+@app.on_event("shutdown")
+async def stop_project_tree():
+    project_tree.stop()
+
 
-        # 연결 끊긴 클라이언트 제거
-        connected_clients -= disconnected
+@app.on_event("shutdown")
+async def stop_runs_and_clients():
+    """실행 중인 프로세스 취소 후 WebSocket 송신 태스크 정리"""
+    for run in process_runner.list_runs():
+        await process_runner.cancel(run["run_id"])
+    await client_hub.close()
 
 
 @app.get("/api/files")
-async def list_files():
-    """파일 목록 조회"""
+async def list_files(
+    response: Response,
+    offset: int = 0,
+    limit: int = 50,
+    prefix: str = "",
+    pattern: str = "",
+):
+    """
+    파일 목록 조회 (메모리 인덱스에서 페이지 단위로)
+
+    Args:
+        offset/limit: 페이지 범위 (limit 최대 1000)
+        prefix: 경로 접두어 (예: "echo_engine/")
+        pattern: glob 패턴 (예: "*.py", "echo_engine/*/test_*.py")
+
+    전체 개수는 X-Total-Count 헤더로 반환
+    """
     try:
-        files = []
-        for item in project_root.rglob("*"):
-            if item.is_file() and not item.name.startswith("."):
-                icon = "🐍" if item.suffix == ".py" else "📄"
-                files.append(
-                    {
-                        "name": item.name,
-                        "path": str(item.relative_to(project_root)),
-                        "icon": icon,
-                    }
-                )
-
-        return files[:50]  # 최대 50개 파일만 반환
+        total, files = project_tree.list_files(offset, limit, prefix, pattern)
+        response.headers["X-Total-Count"] = str(total)
+        return files
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1272,6 +1308,7 @@ async def save_file_content(file_data: FileContent):
 
         with open(full_path, "w", encoding="utf-8") as f:
             f.write(file_data.content)
+        project_tree.note_path(file_data.path)
 
         await broadcast_message(
             {"type": "log", "message": f"💾 파일 저장: {file_data.path}"}
@@ -1283,41 +1320,103 @@ async def save_file_content(file_data: FileContent):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _stream_run_line(run_id: str, stream: str, line: str):
+    client_hub.broadcast(
+        {"type": "run_output", "run_id": run_id, "stream": stream, "line": line}
+    )
+
+
+def _format_run_output(handle) -> str:
+    if handle.timed_out:
+        return f"❌ 실행 시간 초과 ({RUN_TIMEOUT}초)"
+    if handle.cancelled:
+        return "⏹️ 실행 취소됨"
+
+    output = ""
+    if handle.stdout:
+        output += f"📤 출력:\n{''.join(handle.stdout)}\n"
+    if handle.stderr:
+        output += f"❌ 오류:\n{''.join(handle.stderr)}\n"
+
+    output += f"✅ 실행 완료 (종료 코드: {handle.returncode})"
+    return output
+
+
+async def _finish_run(handle) -> Dict[str, Any]:
+    await process_runner.wait(handle.run_id)
+    returncode = -1 if handle.timed_out else handle.returncode
+    client_hub.broadcast(
+        {
+            "type": "run_finished",
+            "run_id": handle.run_id,
+            "status": handle.status,
+            "returncode": returncode,
+        }
+    )
+    return {
+        "run_id": handle.run_id,
+        "output": _format_run_output(handle),
+        "returncode": returncode,
+    }
+
+
 @app.post("/api/run")
 async def run_file(command: CommandRequest):
-    """파일 실행"""
+    """
+    파일 실행 (비동기 서브프로세스)
+
+    stdout/stderr는 실행 중에 run_output 메시지로 줄 단위 스트리밍되고,
+    종료 시 run_finished 메시지가 전송된다.
+    wait=False면 run_id만 즉시 반환 (취소: POST /api/run/{run_id}/cancel)
+    """
     try:
-        file_path = project_root / command.command
+        target = command.command or command.path
+        if not target:
+            raise HTTPException(status_code=400, detail="실행할 파일을 지정해주세요")
+
+        file_path = project_root / target
 
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
 
-        result = subprocess.run(
-            [sys.executable, str(file_path)],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-            timeout=30,
+        handle = await process_runner.start(
+            [sys.executable, str(file_path), *command.args],
+            cwd=str(project_root),
+            timeout=RUN_TIMEOUT,
+            on_line=_stream_run_line,
+        )
+        client_hub.broadcast(
+            {"type": "run_started", "run_id": handle.run_id, "path": target}
         )
 
-        output = ""
-        if result.stdout:
-            output += f"📤 출력:\n{result.stdout}\n"
-        if result.stderr:
-            output += f"❌ 오류:\n{result.stderr}\n"
-
-        output += f"✅ 실행 완료 (종료 코드: {result.returncode})"
-
-        await broadcast_message({"type": "output", "message": output})
+        if not command.wait:
+            task = asyncio.create_task(_finish_run(handle))
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+            return {"run_id": handle.run_id, "status": handle.status}
 
-        return {"output": output, "returncode": result.returncode}
+        return await _finish_run(handle)
 
-    except subprocess.TimeoutExpired:
-        return {"output": "❌ 실행 시간 초과 (30초)", "returncode": -1}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/run/{run_id}/cancel")
+async def cancel_run(run_id: str):
+    """실행 중인 프로세스 취소"""
+    if run_id not in process_runner.runs:
+        raise HTTPException(status_code=404, detail="실행을 찾을 수 없습니다")
+    return {"run_id": run_id, "cancelled": await process_runner.cancel(run_id)}
+
+
+@app.get("/api/runs")
+async def list_runs():
+    """최근 실행 목록 (실행 중 + 완료)"""
+    return process_runner.list_runs()
+
+
 @app.get("/api/signatures")
 async def get_signatures():
     """시그니처 목록 조회"""
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Student 추론 벤치마크
+기존 경로(락 + 요청별 predict + TF-IDF 재변환) vs StudentBatcher 마이크로 배치
+
+사용법: python bench_student.py [동시요청수] [총요청수]
+"""
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+
+from intent.student_classifier import StudentBatcher, StudentClassifier
+
+CONCURRENCY = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+TOTAL = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+SAMPLES = {
+    "weather": ["오늘 날씨 어때", "내일 비 와?", "주말 기온 알려줘"],
+    "calc": ["3 더하기 5는?", "환율 계산해줘", "12 곱하기 7"],
+    "search": ["파이썬 문서 찾아줘", "뉴스 검색해줘", "근처 맛집 찾아줘"],
+    "general_chat": ["안녕", "심심해", "오늘 기분이 좋아"],
+}
+
+
+def build_model(model_dir: Path):
+    texts, labels = [], []
+    for label, examples in SAMPLES.items():
+        for example in examples:
+            texts.append(example)
+            labels.append(label)
+
+    pipe = Pipeline(
+        [
+            ("tfidf", TfidfVectorizer(analyzer="char_wb", ngram_range=(1, 3))),
+            ("clf", SGDClassifier(random_state=0)),
+        ]
+    )
+    pipe.fit(texts, labels)
+    model_dir.mkdir(parents=True, exist_ok=True)
+    joblib.dump(pipe, model_dir / "student.joblib")
+
+
+def legacy_classify(student: StudentClassifier, lock: threading.Lock, text: str):
+    """기존 경로 재현: 락 안에서 predict 후 신뢰도 계산을 위해 TF-IDF 재변환"""
+    with lock:
+        label = student.pipe.predict([text])[0]
+        X_vec = student.pipe.named_steps["tfidf"].transform([text])
+        scores = student.pipe.named_steps["clf"].decision_function(X_vec)[0]
+        return label, float(max(scores))
+
+
+async def timed(coro, latencies):
+    start = time.perf_counter()
+    await coro
+    latencies.append(time.perf_counter() - start)
+
+
+async def run_case(name, make_call):
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    texts = [t for examples in SAMPLES.values() for t in examples]
+
+    async def one(i):
+        async with semaphore:
+            await timed(make_call(texts[i % len(texts)]), latencies)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(TOTAL)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "case": name,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(TOTAL / elapsed, 1),
+        "latency_p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "latency_p95_ms": round(
+            sorted(latencies)[int(0.95 * len(latencies)) - 1] * 1000, 2
+        ),
+    }
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = Path(tmp) / "intent_student"
+        build_model(model_dir)
+        student = StudentClassifier(str(model_dir))
+
+        lock = threading.Lock()
+        loop = asyncio.get_running_loop()
+        legacy = await run_case(
+            "legacy",
+            lambda text: loop.run_in_executor(
+                None, legacy_classify, student, lock, text
+            ),
+        )
+
+        batcher = StudentBatcher(student)
+        batched = await run_case("micro_batch", batcher.classify)
+        await batcher.close()
+
+    print(
+        json.dumps(
+            {
+                "total_requests": TOTAL,
+                "concurrency": CONCURRENCY,
+                "results": [legacy, batched],
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
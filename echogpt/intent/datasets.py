@@ -8,7 +8,7 @@ import os
 import json
 import glob
 import datetime
-from typing import Iterator, Tuple, Dict, Any, List
+from typing import Iterator, Tuple, Dict, Any, List, Optional
 from collections import Counter
 
 
@@ -46,50 +46,124 @@ def iter_training_samples(
             with open(file_path, encoding="utf-8") as f:
                 for line_num, line in enumerate(f, 1):
                     try:
-                        event = json.loads(line)
-
-                        # Teacher 결과 확인
-                        teacher = event.get("teacher_result") or event.get("teacher")
-                        student = event.get("student_result", {}) or event.get(
-                            "student", {}
+                        sample = _event_to_sample(
+                            json.loads(line),
+                            agree_min_conf,
+                            teacher_high_conf,
+                            student_low_conf,
                         )
+                        if sample is not None:
+                            yield sample
+
+                    except (json.JSONDecodeError, KeyError, ValueError) as e:
+                        print(f"⚠️ Error parsing line {line_num} in {file_path}: {e}")
+                        continue
+
+        except (OSError, IOError) as e:
+            print(f"⚠️ Error reading file {file_path}: {e}")
+            continue
 
-                        if not teacher or "intent" not in teacher:
-                            continue
 
-                        # 텍스트 확인
-                        text = event.get("text_redacted") or ""
-                        if not text.strip():
-                            continue
+def _event_to_sample(
+    event: Dict[str, Any],
+    agree_min_conf: float,
+    teacher_high_conf: float,
+    student_low_conf: float,
+) -> Optional[Tuple[str, str, float]]:
+    """이벤트 하나에 증류 규칙 적용 - 학습 대상이 아니면 None"""
+    # Teacher 결과 확인
+    teacher = event.get("teacher_result") or event.get("teacher")
+    student = event.get("student_result", {}) or event.get("student", {})
 
-                        # 신뢰도 추출
-                        teacher_conf = float(teacher.get("confidence", 0))
-                        student_conf = float(student.get("confidence", 1))
+    if not teacher or "intent" not in teacher:
+        return None
 
-                        # 동의 조건: Teacher-Student 일치 + Teacher 고신뢰도
-                        teacher_intent = teacher.get("intent", "")
-                        student_intent = student.get("intent", "")
-                        agreement = (teacher_intent == student_intent) and (
-                            teacher_conf >= agree_min_conf
-                        )
+    # 텍스트 확인
+    text = event.get("text_redacted") or ""
+    if not text.strip():
+        return None
 
-                        # 보정 조건: Teacher 고신뢰도 + Student 저신뢰도
-                        correction = (teacher_conf >= teacher_high_conf) and (
-                            student_conf <= student_low_conf
-                        )
+    # 신뢰도 추출
+    teacher_conf = float(teacher.get("confidence", 0))
+    student_conf = float(student.get("confidence", 1))
 
-                        if agreement or correction:
-                            intent = teacher["intent"]
+    # 동의 조건: Teacher-Student 일치 + Teacher 고신뢰도
+    teacher_intent = teacher.get("intent", "")
+    student_intent = student.get("intent", "")
+    agreement = (teacher_intent == student_intent) and (
+        teacher_conf >= agree_min_conf
+    )
 
-                            # 가중치 계산: 신뢰도 기반 + 보정 부스트
-                            base_weight = max(0.1, min(1.0, teacher_conf))
-                            boost_weight = 1.5 if correction else 1.0
-                            final_weight = base_weight * boost_weight
+    # 보정 조건: Teacher 고신뢰도 + Student 저신뢰도
+    correction = (teacher_conf >= teacher_high_conf) and (
+        student_conf <= student_low_conf
+    )
 
-                            yield (text, intent, float(final_weight))
+    if not (agreement or correction):
+        return None
 
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        print(f"⚠️ Error parsing line {line_num} in {file_path}: {e}")
+    # 가중치 계산: 신뢰도 기반 + 보정 부스트
+    base_weight = max(0.1, min(1.0, teacher_conf))
+    boost_weight = 1.5 if correction else 1.0
+    return (text, teacher["intent"], float(base_weight * boost_weight))
+
+
+def iter_samples_since(
+    events_dir: str,
+    cursor: Dict[str, Any],
+    agree_min_conf: float = 0.75,
+    teacher_high_conf: float = 0.80,
+    student_low_conf: float = 0.50,
+    max_days: int = 30,
+) -> Iterator[Tuple[str, str, float]]:
+    """
+    커서 이후에 추가된 이벤트만 읽는 훈련 샘플 이터레이터
+
+    Args:
+        cursor: {"file": 파일 이름, "offset": 바이트 오프셋} - 읽은 만큼 제자리 갱신
+            (빈 dict면 처음부터). 끝에 줄바꿈이 없는 줄(기록 중)을 만나면 그 자리에서
+            멈추고, 이후 파일까지 포함해 다음 호출로 미룬다.
+
+    파일은 이름(YYYY-MM-DD) 순으로 추가만 된다고 가정한다.
+    """
+    cursor_file = cursor.get("file") or ""
+    cursor_offset = int(cursor.get("offset") or 0)
+
+    for file_path in _iter_event_files(events_dir, max_days):
+        name = os.path.basename(file_path)
+        if name < cursor_file:
+            continue
+
+        offset = cursor_offset if name == cursor_file else 0
+        try:
+            if os.path.getsize(file_path) < offset:
+                offset = 0  # 파일이 다시 쓰인 경우
+
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        # 다음 파일로 넘어가면 커서가 이 줄을 건너뛰므로 여기서 멈춘다
+                        return
+                    offset += len(raw)
+                    cursor["file"], cursor["offset"] = name, offset
+                    try:
+                        sample = _event_to_sample(
+                            json.loads(raw.decode("utf-8")),
+                            agree_min_conf,
+                            teacher_high_conf,
+                            student_low_conf,
+                        )
+                        if sample is not None:
+                            yield sample
+
+                    except (
+                        UnicodeDecodeError,
+                        json.JSONDecodeError,
+                        KeyError,
+                        ValueError,
+                    ) as e:
+                        print(f"⚠️ Error parsing line at {offset} in {file_path}: {e}")
                         continue
 
         except (OSError, IOError) as e:
@@ -6,15 +6,18 @@ Teacher(GPT) → Student(Local) online learning system
 """
 import os
 import json
+import time
 import joblib
 import random
+import hashlib
+import threading
 import warnings
 from typing import List, Tuple, Dict, Any, Optional
 from pathlib import Path
 
 # Scikit-learn imports (with fallback)
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
     from sklearn.linear_model import SGDClassifier
     from sklearn.pipeline import Pipeline
     from sklearn.model_selection import train_test_split
@@ -27,7 +30,11 @@ except ImportError:
     print("⚠️ sklearn not available - DistillTrainer will be disabled")
 
 # Local imports
-from intent.datasets import iter_training_samples, derive_label_space
+from intent.datasets import (
+    iter_training_samples,
+    iter_samples_since,
+    derive_label_space,
+)
 
 # Suppress sklearn warnings for partial_fit
 warnings.filterwarnings("ignore", category=UndefinedMetricWarning)
@@ -55,6 +62,19 @@ class DistillTrainer:
         self.hot_swap_min_f1 = distill_cfg.get("hot_swap_min_f1", 0.85)
         self.max_days = distill_cfg.get("max_days", 30)
 
+        # 증분 학습 설정 - 커서 이후 이벤트만 읽고 고정 차원 해싱 벡터라이저 사용
+        self.incremental = distill_cfg.get("incremental", False)
+        self.hash_features = int(distill_cfg.get("hash_features", 2**18))
+        self.train_interval_s = float(distill_cfg.get("train_interval_s", 300))
+        self.state_path = os.path.join(self.model_dir, "distill_state.json")
+        self.seen_path = os.path.join(self.model_dir, "distill_seen.txt")
+        self.working_path = os.path.join(self.model_dir, "student.working.joblib")
+        self._state: Optional[Dict[str, Any]] = None  # 지연 로드
+        self._seen: Optional[set] = None
+        self._train_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._scheduler: Optional[threading.Thread] = None
+
         # 라벨 스페이스 로드/유도
         self.labels = self._load_label_space()
 
@@ -86,8 +106,11 @@ class DistillTrainer:
         if self.pipe is None and os.path.exists(self.model_path):
             try:
                 self.pipe = joblib.load(self.model_path)
-                self.logger.info("Loaded existing student model")
-                return
+                if "tfidf" in self.pipe.named_steps:
+                    self.logger.info("Loaded existing student model")
+                    return
+                # 증분 모드(해싱)로 학습된 모델 - 전체 재학습용 TF-IDF 파이프라인을 새로 만든다
+                self.pipe = None
             except Exception as e:
                 self.logger.warning(f"Failed to load existing model: {e}")
                 self.pipe = None
@@ -136,8 +159,26 @@ class DistillTrainer:
         self.logger.info(f"Gathered {len(X)} training samples")
         return X, y, weights
 
+    def _split_holdout(self, X: List[str], y: List[str], weights: List[float]):
+        """(X_train, X_test, y_train, y_test, w_train, w_test) - 10개 미만이면 전체 훈련"""
+        if len(X) < 10:  # 최소 검증 세트 크기
+            # 데이터가 적으면 전체를 훈련에 사용
+            return X, [], y, [], weights, []
+
+        try:
+            return train_test_split(
+                X, y, weights, test_size=0.2, random_state=42, stratify=y
+            )
+        except ValueError as e:
+            # 라벨 다양성 부족 등으로 stratify 실패 시
+            self.logger.warning(f"Stratified split failed: {e}, using random split")
+            return train_test_split(X, y, weights, test_size=0.2, random_state=42)
+
     def train_once(self) -> Dict[str, Any]:
-        """한 번의 훈련 실행"""
+        """한 번의 훈련 실행 (distill.incremental이면 증분 학습)"""
+        if self.incremental:
+            return self.train_incremental()
+
         try:
             self._init_or_load_pipe()
             X, y, weights = self._gather_training_data()
@@ -150,38 +191,10 @@ class DistillTrainer:
                 }
 
             # 홀드아웃 검증 (작게)
-            X_train, X_test, y_train, y_test, w_train, w_test = (
-                None,
-                None,
-                None,
-                None,
-                None,
-                None,
+            X_train, X_test, y_train, y_test, w_train, w_test = self._split_holdout(
+                X, y, weights
             )
 
-            try:
-                if len(X) >= 10:  # 최소 검증 세트 크기
-                    split_data = train_test_split(
-                        X, y, weights, test_size=0.2, random_state=42, stratify=y
-                    )
-                    X_train, X_test, y_train, y_test, w_train, w_test = split_data
-                else:
-                    # 데이터가 적으면 전체를 훈련에 사용
-                    X_train, y_train, w_train = X, y, weights
-                    X_test, y_test = [], []
-
-            except ValueError as e:
-                # 라벨 다양성 부족 등으로 stratify 실패 시
-                self.logger.warning(f"Stratified split failed: {e}, using random split")
-                if len(X) >= 10:
-                    split_data = train_test_split(
-                        X, y, weights, test_size=0.2, random_state=42
-                    )
-                    X_train, X_test, y_train, y_test, w_train, w_test = split_data
-                else:
-                    X_train, y_train, w_train = X, y, weights
-                    X_test, y_test = [], []
-
             # 훈련 실행
             tfidf = self.pipe.named_steps["tfidf"]
             clf = self.pipe.named_steps["clf"]
@@ -253,6 +266,282 @@ class DistillTrainer:
             self.logger.error(f"Training failed: {e}")
             return {"trained": False, "reason": "training_error", "error": str(e)}
 
+    # ----- 증분 학습 (커서 기반) -----
+
+    def _load_incremental_state(self):
+        """커서/통계와 본 텍스트 해시 집합 로드 (프로세스당 한 번)"""
+        if self._state is not None:
+            return
+
+        state = {"cursor": {}, "cycles": 0, "trained_samples": 0, "duplicates": 0}
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, encoding="utf-8") as f:
+                    state.update(json.load(f))
+            except Exception as e:
+                self.logger.warning(f"Failed to load distill state: {e}")
+
+        seen = set()
+        if os.path.exists(self.seen_path):
+            with open(self.seen_path, encoding="utf-8") as f:
+                seen.update(line.strip() for line in f if line.strip())
+
+        self._state, self._seen = state, seen
+        self.logger.info(
+            f"Incremental state loaded - cursor={state['cursor']}, seen={len(seen)}"
+        )
+
+    def _init_incremental_pipe(self):
+        """해싱 파이프라인 로드 (작업 체크포인트 → 배포 모델 순) 또는 새로 생성"""
+        if self.pipe is not None and "hash" in self.pipe.named_steps:
+            return
+
+        for path in (self.working_path, self.model_path):
+            if not os.path.exists(path):
+                continue
+            try:
+                pipe = joblib.load(path)
+            except Exception as e:
+                self.logger.warning(f"Failed to load {path}: {e}")
+                continue
+            if "hash" in pipe.named_steps:
+                self.pipe = pipe
+                self.logger.info(f"Loaded incremental student model from {path}")
+                return
+
+        # 해싱 벡터라이저는 학습할 상태가 없어 특징 공간이 고정된다
+        vectorizer = HashingVectorizer(
+            analyzer="char",
+            ngram_range=(2, 5),
+            n_features=self.hash_features,
+            alternate_sign=False,
+        )
+        classifier = SGDClassifier(
+            loss="log_loss", alpha=1e-5, max_iter=5, random_state=42
+        )
+        self.pipe = Pipeline([("hash", vectorizer), ("clf", classifier)])
+        self.logger.info(
+            f"Created new incremental student pipeline ({self.hash_features} features)"
+        )
+
+    @staticmethod
+    def _text_key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _partial_fit(self, X: List[str], y: List[str], weights: List[float]):
+        """batch_size 단위 미니배치 partial_fit"""
+        import numpy as np
+
+        hasher = self.pipe.named_steps["hash"]
+        clf = self.pipe.named_steps["clf"]
+        classes = sorted(self.labels)
+        step = self.batch_size or len(X)
+        for start in range(0, len(X), step):
+            end = start + step
+            clf.partial_fit(
+                hasher.transform(X[start:end]),
+                y[start:end],
+                classes=classes,
+                sample_weight=np.array(weights[start:end]),
+            )
+
+    def _dump_atomic(self, path: str):
+        tmp_path = path + ".tmp"
+        joblib.dump(self.pipe, tmp_path)
+        os.replace(tmp_path, path)
+
+    def _save_incremental_state(self, cursor: Dict[str, Any], new_keys: List[str]):
+        """본 해시는 추가 기록, 커서/통계는 원자적 교체"""
+        if new_keys:
+            with open(self.seen_path, "a", encoding="utf-8") as f:
+                f.write("".join(key + "\n" for key in new_keys))
+            self._seen.update(new_keys)
+
+        self._state["cursor"] = cursor
+        self._state["updated_at"] = time.time()
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def train_incremental(self) -> Dict[str, Any]:
+        """
+        증분 훈련 1회 - 커서 이후 새 이벤트만 학습
+
+        비용은 새 이벤트 수에 비례한다 (전체 재스캔/어휘 재구축 없음).
+        F1 게이트를 통과하면 배포 모델(student.joblib)을 원자적으로 교체하고,
+        통과하지 못하면 작업 체크포인트에만 저장해 다음 주기에 이어서 학습한다.
+        """
+        if not self._train_lock.acquire(blocking=False):
+            return {
+                "trained": False,
+                "reason": "busy",
+                "message": "Training already in progress",
+            }
+
+        try:
+            started = time.perf_counter()
+            self._load_incremental_state()
+            self._init_incremental_pipe()
+
+            cursor = dict(self._state["cursor"])
+            label_set = set(self.labels)
+            X, y, weights, new_keys = [], [], [], []
+            batch_keys = set()
+            duplicates = unknown_labels = 0
+
+            for text, label, weight in iter_samples_since(
+                self.events_dir,
+                cursor,
+                agree_min_conf=self.agree_min_conf,
+                teacher_high_conf=self.teacher_high_conf,
+                student_low_conf=self.student_low_conf,
+                max_days=self.max_days,
+            ):
+                key = self._text_key(text)
+                if key in self._seen or key in batch_keys:
+                    duplicates += 1
+                    continue
+                if label not in label_set:
+                    unknown_labels += 1
+                    continue
+                batch_keys.add(key)
+                new_keys.append(key)
+                X.append(text)
+                y.append(label)
+                weights.append(weight)
+
+            self._state["duplicates"] += duplicates
+            stats = {
+                "mode": "incremental",
+                "new_samples": len(X),
+                "duplicates_skipped": duplicates,
+                "unknown_labels_skipped": unknown_labels,
+                "cursor": cursor,
+            }
+
+            if not X:
+                # 학습 대상이 없어도 읽은 위치는 기록해 다음 주기에 다시 읽지 않는다
+                self._save_incremental_state(cursor, [])
+                return {
+                    "trained": False,
+                    "reason": "no_new_samples",
+                    "message": "No new training samples since last cursor",
+                    **stats,
+                }
+
+            X_train, X_test, y_train, y_test, w_train, w_test = self._split_holdout(
+                X, y, weights
+            )
+            self._partial_fit(X_train, y_train, w_train)
+
+            # 평가 (새 이벤트 홀드아웃)
+            f1_macro, accuracy = None, None
+            if X_test:
+                y_pred = self.pipe.predict(X_test)
+                f1_macro = f1_score(y_test, y_pred, average="macro", zero_division=0)
+                accuracy = accuracy_score(y_test, y_pred)
+                self.logger.info(
+                    f"Validation - F1: {f1_macro:.3f}, Accuracy: {accuracy:.3f}"
+                )
+                # 커서가 지나간 이벤트는 다시 읽지 않으므로 평가 후 홀드아웃도 학습
+                self._partial_fit(X_test, y_test, w_test)
+
+            # 핫스왑 결정 - 배포 파일은 tmp 저장 후 os.replace로 원자적 교체
+            # 홀드아웃이 없는 작은 주기는 게이트를 통과한 모델 위에서만 배포한다
+            # (작업 체크포인트가 남아 있으면 직전에 게이트에서 떨어진 변경이 섞여 있다)
+            if f1_macro is None:
+                should_swap = not os.path.exists(self.working_path)
+            else:
+                should_swap = f1_macro >= self.hot_swap_min_f1
+            if should_swap:
+                self._dump_atomic(self.model_path)
+                if os.path.exists(self.working_path):
+                    os.remove(self.working_path)
+                status = "hotswapped"
+                self.logger.info(f"Model hotswapped - F1: {f1_macro or 'N/A'}")
+            else:
+                self._dump_atomic(self.working_path)
+                status = "kept_old"
+                if f1_macro is None:
+                    self.logger.info(
+                        "Kept old model - no holdout to validate pending working checkpoint"
+                    )
+                else:
+                    self.logger.info(
+                        f"Kept old model - F1 {f1_macro:.3f} < threshold {self.hot_swap_min_f1}"
+                    )
+
+            self._state["cycles"] += 1
+            self._state["trained_samples"] += len(X)
+            self._save_incremental_state(cursor, new_keys)
+
+            from collections import Counter
+
+            return {
+                "trained": True,
+                "samples": len(X),
+                "labels": len(set(y)),
+                "unique_labels": list(set(y)),
+                "label_distribution": dict(Counter(y)),
+                "f1_macro": f1_macro,
+                "accuracy": accuracy,
+                "status": status,
+                "model_path": self.model_path,
+                "hot_swap_threshold": self.hot_swap_min_f1,
+                "total_trained_samples": self._state["trained_samples"],
+                "elapsed_s": round(time.perf_counter() - started, 3),
+                **stats,
+            }
+
+        except Exception as e:
+            self.logger.error(f"Incremental training failed: {e}")
+            return {"trained": False, "reason": "training_error", "error": str(e)}
+        finally:
+            self._train_lock.release()
+
+    def start_background(self, on_result=None, interval_s: Optional[float] = None):
+        """
+        주기적 증분 훈련 시작 (데몬 스레드)
+
+        Args:
+            on_result: 훈련이 실행된 주기마다 결과 dict로 호출 (모델 리로드 등)
+            interval_s: 주기 (기본 distill.train_interval_s)
+        """
+        if self._scheduler is not None:
+            return
+        interval = self.train_interval_s if interval_s is None else interval_s
+        self._stop.clear()
+        self._scheduler = threading.Thread(
+            target=self._run_schedule,
+            args=(on_result, interval),
+            name="distill-trainer",
+            daemon=True,
+        )
+        self._scheduler.start()
+        self.logger.info(f"Background incremental training every {interval}s")
+
+    def stop_background(self):
+        self._stop.set()
+        if self._scheduler is not None:
+            self._scheduler.join()
+            self._scheduler = None
+
+    def _run_schedule(self, on_result, interval: float):
+        while not self._stop.wait(interval):
+            result = self.train_incremental()
+            if not result.get("trained"):
+                continue
+            self.logger.info(
+                f"Incremental cycle: {result['new_samples']} new samples, "
+                f"status={result['status']}, {result['elapsed_s']}s"
+            )
+            if on_result is not None:
+                try:
+                    on_result(result)
+                except Exception as e:
+                    self.logger.error(f"Training result callback failed: {e}")
+
     def evaluate_current_model(self, test_size: int = 100) -> Dict[str, Any]:
         """현재 모델 성능 평가"""
         if not os.path.exists(self.model_path):
@@ -315,6 +604,19 @@ class DistillTrainer:
             },
         }
 
+        if self.incremental:
+            self._load_incremental_state()
+            info["config"]["hash_features"] = self.hash_features
+            info["config"]["train_interval_s"] = self.train_interval_s
+            info["incremental"] = {
+                "cursor": self._state["cursor"],
+                "cycles": self._state["cycles"],
+                "trained_samples": self._state["trained_samples"],
+                "duplicates": self._state["duplicates"],
+                "seen_texts": len(self._seen),
+                "background": self._scheduler is not None,
+            }
+
         if info["model_exists"]:
             try:
                 stat = os.stat(self.model_path)
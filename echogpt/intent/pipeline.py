@@ -13,7 +13,11 @@ from datetime import datetime
 
 # Local imports
 from intent.teacher_client import TeacherClient
-from intent.student_classifier import get_global_classifier, StudentClassifier
+from intent.student_classifier import (
+    get_global_classifier,
+    StudentClassifier,
+    StudentBatcher,
+)
 from ops.event_logger import EventLogger
 from ops.metrics import Metrics
 
@@ -48,6 +52,12 @@ class IntentPipeline:
         # 구성요소 초기화
         self.teacher = TeacherClient(cfg, logger)
         self.student = get_global_classifier(cfg["storage"]["model_dir"])
+        batching_cfg = cfg.get("student_batching", {})
+        self.student_batcher = StudentBatcher(
+            self.student,
+            max_batch_size=batching_cfg.get("max_batch_size", 32),
+            max_wait_ms=batching_cfg.get("max_wait_ms", 2.0),
+        )
         self.event_logger = EventLogger(cfg, logger)
 
         # Events dir로 Metrics 초기화하여 trace_samples 추출 가능하게 함
@@ -190,12 +200,9 @@ class IntentPipeline:
             return None
 
     async def _run_student_async(self, text: str) -> Optional[Dict[str, Any]]:
-        """Student 실행 (비동기 래퍼)"""
+        """Student 실행 (마이크로 배처 경유, 배치 단위로 스레드풀 실행)"""
         try:
-            # Student는 동기 함수이므로 스레드풀 실행
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, self.student.classify, text)
-            return result
+            return await self.student_batcher.classify(text)
         except Exception as e:
             self.logger.warning(f"Student failed: {e}")
             return None
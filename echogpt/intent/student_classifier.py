@@ -5,8 +5,9 @@ EchoGPT Student Classifier
 Local intent classifier (Student in Teacher-Student architecture)
 """
 import os
+import asyncio
 import threading
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 try:
@@ -18,41 +19,55 @@ except ImportError:
 
 
 class StudentClassifier:
-    """로컬 Intent 분류기 (Student) - 핫스왑 지원"""
+    """
+    로컬 Intent 분류기 (Student) - 핫스왑 지원
+
+    추론 경로는 락 없이 self.pipe 참조를 한 번 읽어 사용하고,
+    reload()는 새 모델을 완전히 로드한 뒤 참조만 교체한다 (원자적 교체).
+    """
 
     def __init__(self, model_dir: str = "models/intent_student"):
         self.model_dir = Path(model_dir)
         self.model_path = self.model_dir / "student.joblib"
         self.pipe = None
-        self._lock = threading.RLock()  # 핫스왑을 위한 스레드 세이프
+        self._lock = threading.RLock()  # reload 직렬화 전용 (추론 경로는 락 없음)
 
         # 초기 모델 로드 시도
         self._load_model()
 
     def _load_model(self) -> bool:
-        """모델 로드"""
+        """모델 로드 (로드 완료 후 참조 교체)"""
         if not JOBLIB_AVAILABLE:
             # joblib이 없으면 모델 로딩 건너뛰기
             self.pipe = None
             return False
 
-        try:
-            if self.model_path.exists():
-                with self._lock:
+        with self._lock:
+            try:
+                if self.model_path.exists():
                     self.pipe = joblib.load(self.model_path)
-                return True
-        except Exception as e:
-            print(f"⚠️ Failed to load student model: {e}")
+                    return True
+            except Exception as e:
+                print(f"⚠️ Failed to load student model: {e}")
 
-        self.pipe = None
-        return False
+            self.pipe = None
+            return False
 
     def classify(self, text: str) -> Dict[str, Any]:
         """텍스트 분류"""
-        with self._lock:
-            if self.pipe is None:
-                # 모델이 없으면 기본값 반환
-                return {
+        return self.classify_batch([text])[0]
+
+    def classify_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 텍스트를 한 번에 분류
+
+        TF-IDF 변환과 predict_proba/decision_function을 배치당 한 번만 실행한다.
+        """
+        pipe = self.pipe  # 핫스왑과 무관하게 이 배치는 같은 모델 사용
+        if pipe is None:
+            # 모델이 없으면 기본값 반환
+            return [
+                {
                     "intent": "general_chat",
                     "confidence": 0.33,
                     "summary": "No trained model available",
@@ -61,15 +76,14 @@ class StudentClassifier:
                     "_source": "student",
                     "_model_available": False,
                 }
+                for _ in texts
+            ]
 
-            try:
-                # 예측 실행
-                predicted_label = self.pipe.predict([text])[0]
-
-                # 신뢰도 계산 (predict_proba 사용 가능한 경우)
-                confidence = self._calculate_confidence(text, predicted_label)
+        try:
+            predictions = self._predict_with_confidence(pipe, texts)
 
-                return {
+            return [
+                {
                     "intent": predicted_label,
                     "confidence": confidence,
                     "summary": f"Local classification: {predicted_label}",
@@ -78,10 +92,13 @@ class StudentClassifier:
                     "_source": "student",
                     "_model_available": True,
                 }
+                for text, (predicted_label, confidence) in zip(texts, predictions)
+            ]
 
-            except Exception as e:
-                print(f"⚠️ Student classification failed: {e}")
-                return {
+        except Exception as e:
+            print(f"⚠️ Student classification failed: {e}")
+            return [
+                {
                     "intent": "general_chat",
                     "confidence": 0.33,
                     "summary": f"Classification error: {str(e)[:50]}",
@@ -91,43 +108,62 @@ class StudentClassifier:
                     "_model_available": True,
                     "_error": str(e),
                 }
+                for _ in texts
+            ]
+
+    def _predict_with_confidence(self, pipe, texts: List[str]) -> List[tuple]:
+        """(예측 라벨, 신뢰도) 목록 - 벡터화는 한 번만 수행"""
+        steps = getattr(pipe, "named_steps", {})
+        # 전체 학습은 TF-IDF, 증분 학습은 해싱 벡터라이저 ("hash") 단계
+        tfidf = steps.get("tfidf", steps.get("hash"))
+        clf = steps.get("clf")
+
+        if tfidf is None or clf is None:
+            labels = pipe.predict(texts)
+            return [
+                (label, self._heuristic_confidence(text, label))
+                for text, label in zip(texts, labels)
+            ]
+
+        X_vec = tfidf.transform(texts)
+
+        if hasattr(clf, "predict_proba"):
+            # 확률 기반 신뢰도
+            probabilities = clf.predict_proba(X_vec)
+            best = probabilities.argmax(axis=1)
+            return [
+                (clf.classes_[idx], float(probabilities[row, idx]))
+                for row, idx in enumerate(best)
+            ]
+
+        if hasattr(clf, "decision_function"):
+            # 결정 함수 기반 신뢰도 (SGD의 경우)
+            decision_scores = clf.decision_function(X_vec)
+            results = []
+            for row, scores in enumerate(decision_scores):
+                if getattr(scores, "shape", ()) and scores.shape[0] > 1:
+                    # 다중 클래스: 최대 점수를 시그모이드로 변환
+                    idx = int(scores.argmax())
+                    label = clf.classes_[idx]
+                    score = float(scores[idx])
+                else:
+                    # 이진 분류: 절댓값을 시그모이드로 변환
+                    score = float(scores)
+                    label = clf.classes_[1 if score > 0 else 0]
 
-    def _calculate_confidence(self, text: str, predicted_label: str) -> float:
-        """신뢰도 계산"""
-        try:
-            if hasattr(self.pipe.named_steps.get("clf", None), "predict_proba"):
-                # 확률 기반 신뢰도
-                X_vec = self.pipe.named_steps["tfidf"].transform([text])
-                probabilities = self.pipe.named_steps["clf"].predict_proba(X_vec)[0]
-                max_prob = probabilities.max()
-                return float(max_prob)
-            else:
-                # 결정 함수 기반 신뢰도 (SGD의 경우)
-                if hasattr(self.pipe.named_steps.get("clf", None), "decision_function"):
-                    X_vec = self.pipe.named_steps["tfidf"].transform([text])
-                    decision_scores = self.pipe.named_steps["clf"].decision_function(
-                        X_vec
-                    )[0]
-
-                    if len(decision_scores.shape) > 0 and decision_scores.shape[0] > 1:
-                        # 다중 클래스: 최대 점수를 시그모이드로 변환
-                        max_score = decision_scores.max()
-                        confidence = 1 / (1 + abs(max_score) ** -1)
-                    else:
-                        # 이진 분류: 절댓값을 시그모이드로 변환
-                        score = (
-                            decision_scores
-                            if hasattr(decision_scores, "__len__")
-                            else decision_scores
-                        )
-                        confidence = 1 / (1 + abs(float(score)) ** -1)
-
-                    return min(0.99, max(0.01, confidence))
-        except Exception:
-            pass
+                try:
+                    confidence = 1 / (1 + abs(score) ** -1)
+                except ZeroDivisionError:
+                    confidence = 0.0
+                results.append((label, min(0.99, max(0.01, confidence))))
+            return results
 
         # 폴백: 텍스트 길이와 키워드 기반 휴리스틱 신뢰도
-        return self._heuristic_confidence(text, predicted_label)
+        labels = clf.predict(X_vec)
+        return [
+            (label, self._heuristic_confidence(text, label))
+            for text, label in zip(texts, labels)
+        ]
 
     def _heuristic_confidence(self, text: str, predicted_label: str) -> float:
         """휴리스틱 신뢰도 계산"""
@@ -198,65 +234,153 @@ class StudentClassifier:
 
     def reload(self) -> bool:
         """모델 핫스왑 (무중단 모델 교체)"""
-        old_model_available = self.pipe is not None
-        success = self._load_model()
-        new_model_available = self.pipe is not None
+        with self._lock:
+            old_pipe = self.pipe
+            new_pipe = None
 
-        if success and new_model_available:
-            if old_model_available:
-                print("🔄 Student model hot-swapped successfully")
+            if JOBLIB_AVAILABLE and self.model_path.exists():
+                try:
+                    new_pipe = joblib.load(self.model_path)
+                except Exception as e:
+                    print(f"⚠️ Failed to load student model: {e}")
+
+            if new_pipe is not None:
+                # 참조 교체만으로 원자적 전환 (진행 중인 배치는 이전 모델로 완료)
+                self.pipe = new_pipe
+                if old_pipe is not None:
+                    print("🔄 Student model hot-swapped successfully")
+                else:
+                    print("✅ Student model loaded successfully")
+                return True
+            elif old_pipe is not None:
+                print("⚠️ Hot-swap failed, keeping existing model")
+                return False
             else:
-                print("✅ Student model loaded successfully")
-            return True
-        elif not success and old_model_available:
-            print("⚠️ Hot-swap failed, keeping existing model")
-            return False
-        else:
-            print("❌ No model available after reload attempt")
-            return False
+                print("❌ No model available after reload attempt")
+                return False
 
     def get_model_info(self) -> Dict[str, Any]:
         """모델 정보 조회"""
-        with self._lock:
-            info = {
-                "model_available": self.pipe is not None,
-                "model_path": str(self.model_path),
-                "model_exists": self.model_path.exists(),
-            }
+        pipe = self.pipe
+        info = {
+            "model_available": pipe is not None,
+            "model_path": str(self.model_path),
+            "model_exists": self.model_path.exists(),
+        }
 
-            if info["model_exists"]:
-                try:
-                    stat = self.model_path.stat()
-                    info["model_size_kb"] = stat.st_size // 1024
-                    info["model_modified"] = stat.st_mtime
-                except:
-                    pass
+        if info["model_exists"]:
+            try:
+                stat = self.model_path.stat()
+                info["model_size_kb"] = stat.st_size // 1024
+                info["model_modified"] = stat.st_mtime
+            except:
+                pass
 
-            if self.pipe is not None:
-                try:
-                    # 파이프라인 정보
-                    info["pipeline_steps"] = list(self.pipe.named_steps.keys())
+        if pipe is not None:
+            try:
+                # 파이프라인 정보
+                info["pipeline_steps"] = list(pipe.named_steps.keys())
 
-                    # 클래스 정보
-                    clf = self.pipe.named_steps.get("clf")
-                    if clf and hasattr(clf, "classes_"):
-                        info["classes"] = list(clf.classes_)
-                        info["n_classes"] = len(clf.classes_)
+                # 클래스 정보
+                clf = pipe.named_steps.get("clf")
+                if clf and hasattr(clf, "classes_"):
+                    info["classes"] = list(clf.classes_)
+                    info["n_classes"] = len(clf.classes_)
 
-                    # TF-IDF 정보
-                    tfidf = self.pipe.named_steps.get("tfidf")
-                    if tfidf and hasattr(tfidf, "vocabulary_"):
-                        info["vocabulary_size"] = len(tfidf.vocabulary_)
+                # TF-IDF 정보
+                tfidf = pipe.named_steps.get("tfidf")
+                if tfidf and hasattr(tfidf, "vocabulary_"):
+                    info["vocabulary_size"] = len(tfidf.vocabulary_)
 
-                except Exception as e:
-                    info["model_info_error"] = str(e)
+            except Exception as e:
+                info["model_info_error"] = str(e)
 
-            return info
+        return info
 
     def is_available(self) -> bool:
         """모델 사용 가능 여부"""
-        with self._lock:
-            return self.pipe is not None
+        return self.pipe is not None
+
+
+class StudentBatcher:
+    """
+    Student 추론 마이크로 배처
+
+    동시에 들어온 요청을 최대 max_wait_ms 동안 모아 (최대 max_batch_size개)
+    classify_batch 한 번으로 처리한다. 이벤트 루프마다 워커 태스크 하나.
+    """
+
+    def __init__(
+        self,
+        classifier: StudentClassifier,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+    ):
+        self.classifier = classifier
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_s = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop = None
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def classify(self, text: str) -> Dict[str, Any]:
+        """텍스트 한 개 분류 (배치에 합류)"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_s
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    # 대기 시간이 지나도 이미 쌓인 요청은 함께 처리
+                    while len(batch) < self.max_batch_size and not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    None, self.classifier.classify_batch, texts
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self):
+        """워커 태스크 종료"""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
 
 
 # 전역 인스턴스 (싱글톤 패턴)
@@ -48,6 +48,22 @@ trainer = None
 cfg = None
 
 
+def _apply_training_result(result: Dict[str, Any]):
+    """훈련 결과 반영 - F1 지표 기록, 핫스왑 시 Student 모델 리로드"""
+    pipeline_instance = get_global_pipeline()
+    metrics_instance = getattr(pipeline_instance, "metrics", None)
+
+    # F1 점수를 metrics에 기록
+    if metrics_instance and result.get("f1_macro") is not None:
+        metrics_instance.set_student_f1(result.get("f1_macro"))
+        logger.info(f"Updated student F1 estimate: {result.get('f1_macro'):.3f}")
+
+    # 성공적으로 학습되었으면 Student 모델 리로드
+    if result.get("trained") and result.get("status") == "hotswapped":
+        pipeline_instance.reload_student_model()
+        logger.info("Student model hot-swapped successfully")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 라이프사이클 관리"""
@@ -74,12 +90,18 @@ async def lifespan(app: FastAPI):
             logger.info("Distillation Trainer not available (missing dependencies)")
             trainer = None
 
+        # 증분 모드면 백그라운드에서 주기적으로 새 이벤트만 학습
+        if trainer and trainer.incremental and cfg.get("distill", {}).get("enabled"):
+            trainer.start_background(on_result=_apply_training_result)
+
         yield
 
     except Exception as e:
         logger.error(f"Startup failed: {e}")
         raise
     finally:
+        if trainer:
+            trainer.stop_background()
         logger.info("Shutting down EchoGPT server")
 
 
@@ -288,26 +310,12 @@ async def trigger_training(background_tasks: BackgroundTasks):
     if not trainer:
         raise HTTPException(status_code=503, detail="Trainer not available")
 
-    # Metrics 인스턴스 가져오기 (pipeline에서 참조)
-    pipeline_instance = get_global_pipeline()
-    metrics_instance = getattr(pipeline_instance, "metrics", None)
-
     async def run_training():
         try:
-            result = trainer.train_once()
+            # 훈련은 CPU 작업이라 이벤트 루프 밖에서 실행
+            result = await asyncio.to_thread(trainer.train_once)
             logger.info(f"Training completed: {result}")
-
-            # F1 점수를 metrics에 기록
-            if metrics_instance and result.get("f1_macro") is not None:
-                metrics_instance.set_student_f1(result.get("f1_macro"))
-                logger.info(
-                    f"Updated student F1 estimate: {result.get('f1_macro'):.3f}"
-                )
-
-            # 성공적으로 학습되었으면 Student 모델 리로드
-            if result.get("trained") and result.get("status") == "hotswapped":
-                pipeline.reload_student_model()
-                logger.info("Student model hot-swapped successfully")
+            _apply_training_result(result)
 
         except Exception as e:
             logger.error(f"Background training failed: {e}")
@@ -7,6 +7,7 @@
 - 배속 조정 (0.5x ~ 5.0x)
 - 메타데이터만 확인 모드
 - 인터랙티브 제어 (일시정지/재생)
+- N번째 턴부터 재생 (session.idx 오프셋으로 바로 seek)
 
 @owner: echo
 @expose
@@ -23,31 +24,70 @@ import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from echo_engine.freespeak import load_turn_index
+
 BASE = os.getenv("ECHO_FREESPEAK_DIR", "logs/freespeak_sessions")
 
 
-def load_session_events(session: str) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    """세션 이벤트와 메타데이터 로드"""
+def load_turn_offsets(session: str) -> Dict[int, int]:
+    """턴 번호 -> session.jsonl 바이트 오프셋 (인덱스가 없으면 빈 dict)"""
+    return {
+        entry["turn"]: entry["offset"] for entry in load_turn_index(session, BASE)
+    }
+
+
+def _parse_lines(f, stop_offset: Optional[int] = None):
+    """바이너리 파일에서 JSONL 이벤트를 읽는다 (stop_offset 전까지)"""
+    while stop_offset is None or f.tell() < stop_offset:
+        line = f.readline()
+        if not line:
+            break
+        try:
+            yield json.loads(line.decode("utf-8", errors="replace"))
+        except json.JSONDecodeError:
+            continue  # 손상된 줄 건너뛰기
+
+
+def load_session_events(
+    session: str, start_turn: int = 1
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    세션 이벤트와 메타데이터 로드
+
+    start_turn > 1이면 해당 턴(user 이벤트)부터의 이벤트만 반환한다.
+    턴 인덱스가 있으면 앞부분은 메타데이터 구간만 읽고 바로 seek한다.
+    """
     session_dir = pathlib.Path(BASE) / session
     jsonl_path = session_dir / "session.jsonl"
 
     if not jsonl_path.exists():
         raise FileNotFoundError(f"Session not found: {session}")
 
-    events = []
+    offsets = load_turn_offsets(session) if start_turn > 1 else {}
     meta = {}
 
-    with jsonl_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                event = json.loads(line.strip())
-                events.append(event)
-
-                # 첫 번째 meta 이벤트 추출
-                if event.get("type") == "meta" and not meta:
+    with jsonl_path.open("rb") as f:
+        if start_turn in offsets:
+            # 첫 턴 이전 구간(meta/persona)에서 메타데이터만 추출
+            for event in _parse_lines(f, offsets.get(1, offsets[start_turn])):
+                if event.get("type") == "meta":
                     meta = event.get("meta", {})
-            except json.JSONDecodeError:
-                continue  # 손상된 줄 건너뛰기
+                    break
+            f.seek(offsets[start_turn])
+            return list(_parse_lines(f)), meta
+
+        events = []
+        turn = 0
+        for event in _parse_lines(f):
+            # 첫 번째 meta 이벤트 추출
+            if event.get("type") == "meta" and not meta:
+                meta = event.get("meta", {})
+            if event.get("type") == "user":
+                turn += 1
+            if start_turn <= 1 or turn >= start_turn:
+                events.append(event)
 
     return events, meta
 
@@ -83,12 +123,16 @@ def format_meta_info(meta: Dict[str, Any]) -> str:
 
 
 def replay_session(
-    session: str, speed: float = 1.0, meta_only: bool = False, interactive: bool = False
+    session: str,
+    speed: float = 1.0,
+    meta_only: bool = False,
+    interactive: bool = False,
+    start_turn: int = 1,
 ) -> int:
     """세션 리플레이 실행"""
 
     try:
-        events, meta = load_session_events(session)
+        events, meta = load_session_events(session, start_turn)
     except FileNotFoundError:
         print(f"❌ Session not found: {session}", file=sys.stderr)
         return 1
@@ -267,6 +311,7 @@ Examples:
   %(prog)s --session fs_20250824_001122_ab12cd34 --speed 2.0  # 2x speed
   %(prog)s --session fs_20250824_001122_ab12cd34 --meta-only  # Metadata only
   %(prog)s --session fs_20250824_001122_ab12cd34 --interactive # Interactive mode
+  %(prog)s --session fs_20250824_001122_ab12cd34 --turn 5     # From turn 5
         """,
     )
 
@@ -290,6 +335,12 @@ Examples:
         action="store_true",
         help="Enable interactive controls during playback",
     )
+    parser.add_argument(
+        "--turn",
+        type=int,
+        default=1,
+        help="Start replay from turn N (1-based, default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -300,7 +351,9 @@ Examples:
         parser.print_help()
         return 1
 
-    return replay_session(args.session, args.speed, args.meta_only, args.interactive)
+    return replay_session(
+        args.session, args.speed, args.meta_only, args.interactive, args.turn
+    )
 
 
 if __name__ == "__main__":